@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from typing import List
-from sqlalchemy.orm import Session
-from core.database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from core.dependencies import get_read_session, get_session
 from repository import booking as booking_repo
 from services import booking as booking_service
 from schemas.booking import CreateEventBookingRooms, CreateReservationEvent, CreateTravellerInfo, BookingRequest, EventBookingRoomsResponse, ReservationEventResponse, TravellerInfoResponse, AllBookingDetailsResponse, CreateOrderRequest
@@ -10,14 +10,14 @@ router = APIRouter(prefix="/api/bookings", tags=["Bookings"])
 
 
 @router.post("/", response_model=AllBookingDetailsResponse, status_code=status.HTTP_201_CREATED)
-def generate_booking(payload: BookingRequest, payment_id: str, db: Session = Depends(get_db)):
+async def generate_booking(payload: BookingRequest, payment_id: str, session: AsyncSession = Depends(get_session)):
     try:
-        new_booking = booking_service.generate_booking(
+        new_booking = await booking_service.generate_booking(
             reservation_event=payload.reservation_event,
             traveller_info=payload.traveller_info,
             booking_rooms=payload.booking_rooms,
             payment_id=payment_id,
-            db=db
+            session=session
         )
         return new_booking
     except HTTPException as e:
@@ -25,9 +25,9 @@ def generate_booking(payload: BookingRequest, payment_id: str, db: Session = Dep
 
 
 @router.put("/{reservation_event_id}", response_model=ReservationEventResponse)
-def update_booking(reservation_event_id: int, payload: CreateReservationEvent, db: Session = Depends(get_db)):
+async def update_booking(reservation_event_id: int, payload: CreateReservationEvent, session: AsyncSession = Depends(get_session)):
     try:
-        updated_booking = booking_repo.update_reservation_event(db, reservation_event_id, payload)
+        updated_booking = await booking_repo.update_reservation_event(session, reservation_event_id, payload)
         if not updated_booking:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Booking not found")
         return ReservationEventResponse.from_orm(updated_booking)
@@ -35,9 +35,9 @@ def update_booking(reservation_event_id: int, payload: CreateReservationEvent, d
         raise e
 
 @router.get("/get_by_client_url/{client_url}", response_model=List[ReservationEventResponse])
-def get_reservation_events_by_client_url(client_url: str, db: Session = Depends(get_db)):
+async def get_reservation_events_by_client_url(client_url: str, session: AsyncSession = Depends(get_read_session)):
     try:
-        reservation_events = booking_service.get_reservation_events_by_client_url(client_url, db)
+        reservation_events = await booking_service.get_reservation_events_by_client_url(client_url, session)
         if not reservation_events:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No bookings found for this client")
         return [ReservationEventResponse.from_orm(event) for event in reservation_events]
@@ -45,9 +45,9 @@ def get_reservation_events_by_client_url(client_url: str, db: Session = Depends(
         raise e
     
 @router.get("/get_by_client_id/{client_id}", response_model=List[AllBookingDetailsResponse])
-def get_reservation_events_by_client_url(client_id: int, db: Session = Depends(get_db)):
+async def get_reservation_events_by_client_url(client_id: int, session: AsyncSession = Depends(get_read_session)):
     try:
-        reservation_events = booking_service.get_reservation_events_by_client_id(client_id, db)
+        reservation_events = await booking_service.get_reservation_events_by_client_id(client_id, session)
         if not reservation_events:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No bookings found for this client")
         return reservation_events
@@ -55,9 +55,9 @@ def get_reservation_events_by_client_url(client_id: int, db: Session = Depends(g
         raise e
     
 @router.get("/get_by_user_id/{user_id}", response_model=List[AllBookingDetailsResponse])
-def get_reservation_events_by_user_id(user_id: int, db: Session = Depends(get_db)):
+async def get_reservation_events_by_user_id(user_id: int, session: AsyncSession = Depends(get_session)):
     try:
-        reservation_events = booking_service.get_reservation_events_by_user_id(user_id, db)
+        reservation_events = await booking_service.get_reservation_events_by_user_id(user_id, session)
         if not reservation_events:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No bookings found for this user")
         return [AllBookingDetailsResponse.from_orm(event) for event in reservation_events]
@@ -65,9 +65,9 @@ def get_reservation_events_by_user_id(user_id: int, db: Session = Depends(get_db
         raise e
     
 @router.get("/available_slots/{event_plan_id}")
-def get_available_slots(event_plan_id: int, db: Session = Depends(get_db)):
+async def get_available_slots(event_plan_id: int, session: AsyncSession = Depends(get_read_session)):
     try:
-        available_slots = booking_service.get_available_slots(event_plan_id, db)
+        available_slots = await booking_service.get_available_slots(event_plan_id, session)
         if not available_slots:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No available slots found for this event plan")
         return available_slots
@@ -75,11 +75,11 @@ def get_available_slots(event_plan_id: int, db: Session = Depends(get_db)):
         raise e
 
 @router.post("/create-order")
-def create_payment_order(request: CreateOrderRequest, db: Session = Depends(get_db)):
+def create_payment_order(request: CreateOrderRequest):
     order = booking_service.create_order(request)
     return order
 @router.post("/verify-payment")
-def verify_payment_endpoint(payment_data: dict, db: Session = Depends(get_db)):
+async def verify_payment_endpoint(payment_data: dict, session: AsyncSession = Depends(get_session)):
     try:
         print(f"Verifying payment with data: {payment_data}")
         
@@ -104,12 +104,12 @@ def verify_payment_endpoint(payment_data: dict, db: Session = Depends(get_db)):
         booking_rooms = [CreateEventBookingRooms(**room) for room in booking_payload["booking_rooms"]]
         
         # Create booking after successful payment verification
-        new_booking = booking_service.generate_booking(
+        new_booking = await booking_service.generate_booking(
             reservation_event=reservation_event,
             traveller_info=traveller_info,
             booking_rooms=booking_rooms,
             payment_id=payment_id,
-            db=db
+            session=session
         )
         
         return {
@@ -1,8 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 
-from core.database import get_db
+from core.dependencies import get_read_session, get_session
 from models.connection_request import ConnectionRequest
 from models.events import EventInfo
 from schemas.connection_request import ConnectionRequestCreate, ConnectionRequestSchema, ReceivedConnectionRequest
@@ -11,38 +12,34 @@ router = APIRouter(prefix="/api/connection-requests", tags=["Connection Requests
 
 
 @router.post("/", response_model=ConnectionRequestSchema)
-def create_connection_request(data: ConnectionRequestCreate, db: Session = Depends(get_db)):
+async def create_connection_request(data: ConnectionRequestCreate, session: AsyncSession = Depends(get_session)):
     new_request = ConnectionRequest(**data.dict())
-    db.add(new_request)
-    db.commit()
-    db.refresh(new_request)
+    session.add(new_request)
+    await session.commit()
+    await session.refresh(new_request)
     return new_request
 
 @router.get("/received/{user_id}", response_model=List[ReceivedConnectionRequest])
-def get_received_requests(user_id: int, db: Session = Depends(get_db)):
-    # Get all requests related to events created by the user
-    requests = (
-        db.query(ConnectionRequest)
+async def get_received_requests(user_id: int, session: AsyncSession = Depends(get_read_session)):
+    # Get all requests related to events created by the user, with their event
+    rows = await session.execute(
+        select(ConnectionRequest, EventInfo.title, EventInfo.description)
         .join(EventInfo, ConnectionRequest.event_id == EventInfo.event_id)
-        .filter(EventInfo.created_by == user_id)
-        .all()
+        .where(EventInfo.created_by == user_id)
     )
 
     # Build simplified response
     result = []
-    for req in requests:
-        # Fetch the associated event directly from the database
-        event = db.query(EventInfo).filter(EventInfo.event_id == req.event_id).first()
-        if event:
-            result.append({
-                "request_id": req.request_id,
-                "name": req.name,  # Added this missing field
-                "contact_no": req.contact_no,
-                "email": req.email,
-                "address": req.address,
-                "event_id": req.event_id,
-                "event_title": event.title,
-                "event_description": event.description
-            })
+    for req, event_title, event_description in rows:
+        result.append({
+            "request_id": req.request_id,
+            "name": req.name,  # Added this missing field
+            "contact_no": req.contact_no,
+            "email": req.email,
+            "address": req.address,
+            "event_id": req.event_id,
+            "event_title": event_title,
+            "event_description": event_description
+        })
 
-    return result
\ No newline at end of file
+    return result
@@ -1,8 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
-from core.database import get_db
+from core.dependencies import get_read_session, get_session
 from repository import client as client_repo
+from repository import events as event_repo
 from datetime import date
 from typing import Optional
 
@@ -13,12 +15,25 @@ from schemas.events import EventCreate, EventSchema, EventUpdate, CategorySchema
 router = APIRouter(prefix="/api", tags=["Events"])
 
 
+async def _fetch_events(session: AsyncSession, stmt):
+    """Run an EventInfo select with every relationship EventSchema reads loaded up front"""
+    result = await session.execute(
+        stmt.options(*event_repo.event_relations()).execution_options(populate_existing=True)
+    )
+    return result.scalars().all()
+
+
+async def _fetch_event(session: AsyncSession, event_id: int):
+    events = await _fetch_events(session, select(EventInfo).where(EventInfo.event_id == event_id))
+    return events[0] if events else None
+
+
 @router.get("/events", response_model=List[EventSchema])
-def get_all_events(db: Session = Depends(get_db), status: Optional[str]=None):
+async def get_all_events(session: AsyncSession = Depends(get_read_session), status: Optional[str]=None):
     if status:
-        events = db.query(EventInfo).filter(EventInfo.status == status).all()
+        events = await _fetch_events(session, select(EventInfo).where(EventInfo.status == status))
     else:
-        events = db.query(EventInfo).all()
+        events = await _fetch_events(session, select(EventInfo))
     enriched_events = []
 
     for event in events:
@@ -46,13 +61,14 @@ def get_all_events(db: Session = Depends(get_db), status: Optional[str]=None):
 
 
 @router.get("/events/basic", response_model=List[BasicEventSchema])
-def get_basic_events(db: Session = Depends(get_db)):
-    events = db.query(EventInfo).all()
+async def get_basic_events(session: AsyncSession = Depends(get_read_session)):
+    result = await session.execute(select(EventInfo))
+    events = result.scalars().all()
     return [BasicEventSchema.from_orm(event) for event in events]
 
 
 @router.post("/events", response_model=EventSchema)
-def create_complete_event(event: EventCreate, db: Session = Depends(get_db)):
+async def create_complete_event(event: EventCreate, session: AsyncSession = Depends(get_session)):
     """
     Create a new event with its itineraries, plans, and settings in a single operation.
     """
@@ -63,8 +79,8 @@ def create_complete_event(event: EventCreate, db: Session = Depends(get_db)):
         
         # Create the main event
         db_event = EventInfo(**event_data)
-        db.add(db_event)
-        db.flush()  # Flush to get the ID without committing transaction
+        session.add(db_event)
+        await session.flush()  # Flush to get the ID without committing transaction
         
         # Now we have the event_id to use for relationships
         event_id = db_event.event_id
@@ -72,7 +88,7 @@ def create_complete_event(event: EventCreate, db: Session = Depends(get_db)):
         # Add room bed pricing
         for pricing in event.room_bed_pricing:
             db_pricing = RoomBedPricing(event_id=event_id, **pricing.dict())
-            db.add(db_pricing)
+            session.add(db_pricing)
 
         # Add itineraries
         for itinerary_data in event.itineraries:
@@ -80,7 +96,7 @@ def create_complete_event(event: EventCreate, db: Session = Depends(get_db)):
                 **itinerary_data.dict(),
                 event_id=event_id
             )
-            db.add(db_itinerary)
+            session.add(db_itinerary)
         
         # Add event plans (date options)
         for plan_data in event.event_plans:
@@ -88,7 +104,7 @@ def create_complete_event(event: EventCreate, db: Session = Depends(get_db)):
                 **plan_data.dict(),
                 event_id=event_id
             )
-            db.add(db_plan)
+            session.add(db_plan)
         
         # Add stop settings
         for setting_data in event.stop_settings:
@@ -96,31 +112,31 @@ def create_complete_event(event: EventCreate, db: Session = Depends(get_db)):
                 **setting_data.dict(),
                 event_id=event_id
             )
-            db.add(db_setting)
+            session.add(db_setting)
 
         for cat_id in event.category_ids:
             event_category = EventInCategory(
                 event_id=event_id,
                 category_id=cat_id
             )
-            db.add(event_category)
+            session.add(event_category)
         
         # Commit all changes
-        db.commit()
-        db.refresh(db_event)
-        return db_event
+        await session.commit()
+        return await _fetch_event(session, event_id)
         
     except Exception as e:
-        db.rollback()
+        await session.rollback()
         raise HTTPException(status_code=500, detail=f"Failed to create event: {str(e)}")
 
 @router.get("/events/{event_id}", response_model=EventSchema)
-def get_event(event_id: int, db: Session = Depends(get_db), status: Optional[str]=None):
+async def get_event(event_id: int, session: AsyncSession = Depends(get_read_session), status: Optional[str]=None):
     if status:
-        event = db.query(EventInfo).filter(EventInfo.event_id == event_id, EventInfo.status == status).first()
+        events = await _fetch_events(session, select(EventInfo).where(EventInfo.event_id == event_id, EventInfo.status == status))
     else:
-        event = db.query(EventInfo).filter(EventInfo.event_id == event_id).first()
-    client_url = client_repo.get_client_by_id(db, event.client_id).url if event else None
+        events = await _fetch_events(session, select(EventInfo).where(EventInfo.event_id == event_id))
+    event = events[0] if events else None
+    client_url = (await client_repo.get_client_by_id(session, event.client_id)).url if event else None
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
 
@@ -141,197 +157,209 @@ def get_event(event_id: int, db: Session = Depends(get_db), status: Optional[str
     return enriched_event
 
 @router.put("/events/{event_id}", response_model=EventSchema)
-def update_event(event_id: int, event: EventUpdate, db: Session = Depends(get_db)):
-    db_event = db.query(EventInfo).filter(EventInfo.event_id == event_id).first()
+async def update_event(event_id: int, event: EventUpdate, session: AsyncSession = Depends(get_session)):
+    db_event = await session.get(EventInfo, event_id)
     if not db_event:
         raise HTTPException(status_code=404, detail="Event not found")
     # Update fields from EventUpdate, excluding event_id
     update_data = event.dict(exclude_unset=True, exclude={"event_id"})
     for key, value in update_data.items():
         setattr(db_event, key, value)
-    db.commit()
-    db.refresh(db_event)
-    return db_event
+    await session.commit()
+    return await _fetch_event(session, event_id)
 
 @router.post("/events/{event_id}/pricing", response_model=RoomBedPricingSchema)
-def add_room_bed_pricing(
+async def add_room_bed_pricing(
     event_id: int,
     pricing: RoomBedPricingCreate,
-    db: Session = Depends(get_db)
+    session: AsyncSession = Depends(get_session)
 ):
     if event_id != pricing.event_id:
         raise HTTPException(status_code=400, detail="Mismatched event_id in URL and body")
 
     db_pricing = RoomBedPricing(**pricing.dict())
-    db.add(db_pricing)
-    db.commit()
-    db.refresh(db_pricing)
+    session.add(db_pricing)
+    await session.commit()
+    await session.refresh(db_pricing)
     return db_pricing
 
 @router.get("/events/{event_id}/pricing", response_model=List[RoomBedPricingSchema])
-def get_room_bed_pricing(event_id: int, db: Session = Depends(get_db)):
-    pricing_data = db.query(RoomBedPricing).filter(RoomBedPricing.event_id == event_id).all()
+async def get_room_bed_pricing(event_id: int, session: AsyncSession = Depends(get_read_session)):
+    pricing_data = await event_repo.get_room_bed_pricing_by_event_id(session, event_id)
     return pricing_data
 
 @router.put("/events/pricing", response_model=RoomBedPricingSchema)
-def update_room_bed_pricing(
+async def update_room_bed_pricing(
     pricing: RoomBedPricingSchema,
-    db: Session = Depends(get_db)
+    session: AsyncSession = Depends(get_session)
 ):
-    db_pricing = db.query(RoomBedPricing).filter_by(pricing_id=pricing.pricing_id, event_id=pricing.event_id).first()
+    result = await session.execute(select(RoomBedPricing).where(RoomBedPricing.pricing_id == pricing.pricing_id, RoomBedPricing.event_id == pricing.event_id))
+    db_pricing = result.scalars().first()
     if not db_pricing:
         raise HTTPException(status_code=404, detail="Room bed pricing not found")
     
     for k, v in pricing.dict(exclude={"pricing_id", "event_id"}).items():
         setattr(db_pricing, k, v)
     
-    db.commit()
-    db.refresh(db_pricing)
+    await session.commit()
+    await session.refresh(db_pricing)
     return db_pricing
 
 # ITINERARY
 @router.get("/events/{event_id}/itinerary", response_model=List[ItineraryInfoSchema])
-def get_itinerary(event_id: int, db: Session = Depends(get_db)):
-    itineraries = db.query(ItineraryInfo).filter(ItineraryInfo.event_id == event_id).all()
+async def get_itinerary(event_id: int, session: AsyncSession = Depends(get_read_session)):
+    result = await session.execute(select(ItineraryInfo).where(ItineraryInfo.event_id == event_id))
+    itineraries = result.scalars().all()
     return itineraries
 
 @router.post("/events/{event_id}/itinerary", response_model=ItineraryInfoSchema)
-def add_itinerary(event_id: int, data: ItineraryInfoBase, db: Session = Depends(get_db)):
+async def add_itinerary(event_id: int, data: ItineraryInfoBase, session: AsyncSession = Depends(get_session)):
     obj = ItineraryInfo(**data.dict(), event_id=event_id)
-    db.add(obj)
-    db.commit()
-    db.refresh(obj)
+    session.add(obj)
+    await session.commit()
+    await session.refresh(obj)
     return obj
 
 @router.put("/events/itinerary", response_model=ItineraryInfoSchema)
-def update_itinerary(data: ItineraryUpdate, db: Session = Depends(get_db)):
-    obj = db.query(ItineraryInfo).filter_by(itinerary_id=data.itinerary_id, event_id=data.event_id).first()
+async def update_itinerary(data: ItineraryUpdate, session: AsyncSession = Depends(get_session)):
+    result = await session.execute(select(ItineraryInfo).where(ItineraryInfo.itinerary_id == data.itinerary_id, ItineraryInfo.event_id == data.event_id))
+    obj = result.scalars().first()
     if not obj:
         raise HTTPException(status_code=404, detail="Itinerary not found")
     for k, v in data.dict(exclude={"itinerary_id", "event_id"}).items():
         setattr(obj, k, v)
-    db.commit()
-    db.refresh(obj)
+    await session.commit()
+    await session.refresh(obj)
     return obj
 
 @router.delete("/events/{event_id}/itinerary/{itinerary_id}")
-def delete_itinerary(event_id: int, itinerary_id: int, db: Session = Depends(get_db)):
-    obj = db.query(ItineraryInfo).filter_by(event_id=event_id, itinerary_id=itinerary_id).first()
+async def delete_itinerary(event_id: int, itinerary_id: int, session: AsyncSession = Depends(get_session)):
+    result = await session.execute(select(ItineraryInfo).where(ItineraryInfo.event_id == event_id, ItineraryInfo.itinerary_id == itinerary_id))
+    obj = result.scalars().first()
     if not obj:
         raise HTTPException(status_code=404, detail="Itinerary not found")
-    db.delete(obj)
-    db.commit()
+    await session.delete(obj)
+    await session.commit()
     return {"message": "Itinerary deleted successfully"}
 
 # EVENT PLAN
 @router.get("/events/{event_id}/plan", response_model=List[EventPlanSchema])
-def get_event_plans(event_id: int, db: Session = Depends(get_db)):
-    plans = db.query(EventPlan).filter(EventPlan.event_id == event_id).all()
+async def get_event_plans(event_id: int, session: AsyncSession = Depends(get_read_session)):
+    result = await session.execute(select(EventPlan).where(EventPlan.event_id == event_id))
+    plans = result.scalars().all()
     return plans
 
 @router.post("/events/{event_id}/plan", response_model=EventPlanSchema)
-def add_event_plan(event_id: int, data: EventPlanBase, db: Session = Depends(get_db)):
+async def add_event_plan(event_id: int, data: EventPlanBase, session: AsyncSession = Depends(get_session)):
     obj = EventPlan(**data.dict(), event_id=event_id)
-    db.add(obj)
-    db.commit()
-    db.refresh(obj)
+    session.add(obj)
+    await session.commit()
+    await session.refresh(obj)
     return obj
 
 @router.put("/events/{even_id}/plan", response_model=EventPlanSchema)
-def update_event_plan(data: EventPlanUpdate, db: Session = Depends(get_db)):
-    obj = db.query(EventPlan).filter_by(ep_id=data.ep_id, event_id=data.event_id).first()
+async def update_event_plan(data: EventPlanUpdate, session: AsyncSession = Depends(get_session)):
+    result = await session.execute(select(EventPlan).where(EventPlan.ep_id == data.ep_id, EventPlan.event_id == data.event_id))
+    obj = result.scalars().first()
     if not obj:
         raise HTTPException(status_code=404, detail="Event plan not found")
     for k, v in data.dict(exclude={"ep_id", "event_id"}).items():
         setattr(obj, k, v)
-    db.commit()
-    db.refresh(obj)
+    await session.commit()
+    await session.refresh(obj)
     return obj
 
 @router.delete("/events/{event_id}/plan/{ep_id}")
-def delete_event_plan(event_id: int, ep_id: int, db: Session = Depends(get_db)):
-    obj = db.query(EventPlan).filter_by(event_id=event_id, ep_id=ep_id).first()
+async def delete_event_plan(event_id: int, ep_id: int, session: AsyncSession = Depends(get_session)):
+    result = await session.execute(select(EventPlan).where(EventPlan.event_id == event_id, EventPlan.ep_id == ep_id))
+    obj = result.scalars().first()
     if not obj:
         raise HTTPException(status_code=404, detail="Event plan not found")
-    db.delete(obj)
-    db.commit()
+    await session.delete(obj)
+    await session.commit()
     return {"message": "Event plan deleted successfully"}
 
 # STOP SETTING
 @router.post("/events/{event_id}/stop-setting", response_model=StopSettingSchema)
-def add_stop_setting(event_id: int, data: StopSettingBase, db: Session = Depends(get_db)):
+async def add_stop_setting(event_id: int, data: StopSettingBase, session: AsyncSession = Depends(get_session)):
     obj = StopSetting(**data.dict(), event_id=event_id)
-    db.add(obj)
-    db.commit()
-    db.refresh(obj)
+    session.add(obj)
+    await session.commit()
+    await session.refresh(obj)
     return obj
 
 @router.put("/events/stop-setting", response_model=StopSettingSchema)
-def update_stop_setting(data: StopSettingUpdate, db: Session = Depends(get_db)):
-    obj = db.query(StopSetting).filter_by(stop_setting_id=data.stop_setting_id, event_id=data.event_id).first()
+async def update_stop_setting(data: StopSettingUpdate, session: AsyncSession = Depends(get_session)):
+    result = await session.execute(select(StopSetting).where(StopSetting.stop_setting_id == data.stop_setting_id, StopSetting.event_id == data.event_id))
+    obj = result.scalars().first()
     if not obj:
         raise HTTPException(status_code=404, detail="Stop setting not found")
     for k, v in data.dict(exclude={"stop_setting_id", "event_id"}).items():
         setattr(obj, k, v)
-    db.commit()
-    db.refresh(obj)
+    await session.commit()
+    await session.refresh(obj)
     return obj
 # GET ALL CATEGORIES
 @router.get("/events/categories/all", response_model=List[CategorySchema])
-def get_all_categories(db: Session = Depends(get_db)):
-    categories = db.query(MasterEventCategory).all()
+async def get_all_categories(session: AsyncSession = Depends(get_read_session)):
+    result = await session.execute(select(MasterEventCategory))
+    categories = result.scalars().all()
     return [CategorySchema.from_orm(category) for category in categories]
 
 @router.delete("/events/{event_id}/stop-setting/{stop_setting_id}")
-def delete_stop_setting(event_id: int, stop_setting_id: int, db: Session = Depends(get_db)):
-    obj = db.query(StopSetting).filter_by(event_id=event_id, stop_setting_id=stop_setting_id).first()
+async def delete_stop_setting(event_id: int, stop_setting_id: int, session: AsyncSession = Depends(get_session)):
+    result = await session.execute(select(StopSetting).where(StopSetting.event_id == event_id, StopSetting.stop_setting_id == stop_setting_id))
+    obj = result.scalars().first()
     if not obj:
         raise HTTPException(status_code=404, detail="Stop setting not found")
-    db.delete(obj)
-    db.commit()
+    await session.delete(obj)
+    await session.commit()
     return {"message": "Stop setting deleted successfully"}
 
 # CATEGORY (EVENT IN CATEGORY)
 @router.get("/events/{event_id}/category", response_model=List[EventInCategorySchema])
-def get_event_categories(event_id: int, db: Session = Depends(get_db)):
-    categories = db.query(EventInCategory).filter(EventInCategory.event_id == event_id).all()
+async def get_event_categories(event_id: int, session: AsyncSession = Depends(get_read_session)):
+    result = await session.execute(select(EventInCategory).where(EventInCategory.event_id == event_id))
+    categories = result.scalars().all()
     return [EventInCategorySchema.from_orm(category) for category in categories]
 
 @router.post("/events/{event_id}/category/{category_id}")
-def add_event_category(event_id: int, category_id: int, db: Session = Depends(get_db)):
+async def add_event_category(event_id: int, category_id: int, session: AsyncSession = Depends(get_session)):
     obj = EventInCategory(event_id=event_id, category_id=category_id)
-    db.add(obj)
-    db.commit()
+    session.add(obj)
+    await session.commit()
     return {"message": "Category added"}
 
 @router.delete("/events/{event_id}/category/{category_id}")
-def delete_event_category(event_id: int, category_id: int, db: Session = Depends(get_db)):
-    obj = db.query(EventInCategory).filter_by(event_id=event_id, category_id=category_id).first()
+async def delete_event_category(event_id: int, category_id: int, session: AsyncSession = Depends(get_session)):
+    result = await session.execute(select(EventInCategory).where(EventInCategory.event_id == event_id, EventInCategory.category_id == category_id))
+    obj = result.scalars().first()
     if not obj:
         raise HTTPException(status_code=404, detail="Category not found for event")
-    db.delete(obj)
-    db.commit()
+    await session.delete(obj)
+    await session.commit()
     return {"message": "Category removed"}
 
 
 # GET EVENTS BY CATEGORY
 @router.get("/events/categories/categories-and-events", response_model=List[CategoryWithEventsSchema])
-def get_categories_with_events(db: Session = Depends(get_db)):
+async def get_categories_with_events(session: AsyncSession = Depends(get_read_session)):
     """
     Get all categories with up to 10 events per category
     """
-    categories = db.query(MasterEventCategory).all()
+    result = await session.execute(select(MasterEventCategory))
+    categories = result.scalars().all()
     result = []
     
     for category in categories:
         # Get events for this category (limit to 10)
-        events_query = (
-            db.query(EventInfo)
+        events_query = await _fetch_events(
+            session,
+            select(EventInfo)
             .join(EventInCategory, EventInfo.event_id == EventInCategory.event_id)
-            .filter(EventInCategory.category_id == category.category_id)
+            .where(EventInCategory.category_id == category.category_id)
             .order_by(EventInfo.created_at.desc())
             .limit(10)
-            .all()
         )
         
         # Create enriched events with their categories
@@ -361,22 +389,22 @@ def get_categories_with_events(db: Session = Depends(get_db)):
     return result
 
 @router.get("/events/categories/{category_id}", response_model=CategoryWithEventsSchema)
-def get_category_events(category_id: int, db: Session = Depends(get_db)):
+async def get_category_events(category_id: int, session: AsyncSession = Depends(get_read_session)):
     """
     Get all events for a specific category
     """
     # Check if category exists
-    category = db.query(MasterEventCategory).filter(MasterEventCategory.category_id == category_id).first()
+    category = await session.get(MasterEventCategory, category_id)
     if not category:
         raise HTTPException(status_code=404, detail=f"Category with ID {category_id} not found")
     
     # Get all events for this category
-    events_query = (
-        db.query(EventInfo)
+    events_query = await _fetch_events(
+        session,
+        select(EventInfo)
         .join(EventInCategory, EventInfo.event_id == EventInCategory.event_id)
-        .filter(EventInCategory.category_id == category_id)
+        .where(EventInCategory.category_id == category_id)
         .order_by(EventInfo.created_at.desc())
-        .all()
     )
     
     # Create enriched events with their categories
@@ -404,8 +432,8 @@ def get_category_events(category_id: int, db: Session = Depends(get_db)):
     return category_with_events
 
 @router.get("/events/client/{client_id}", response_model=List[EventSchema])
-def get_events_by_client(client_id: int, db: Session = Depends(get_db)):
-    events = db.query(EventInfo).filter(EventInfo.client_id == client_id).all()
+async def get_events_by_client(client_id: int, session: AsyncSession = Depends(get_read_session)):
+    events = await _fetch_events(session, select(EventInfo).where(EventInfo.client_id == client_id))
     enriched_events = []
     for event in events:
         filtered_event_plans = [
@@ -424,22 +452,23 @@ def get_events_by_client(client_id: int, db: Session = Depends(get_db)):
     return enriched_events
 
 @router.get("/events/client/{client_id}/categories", response_model=List[CategoryWithEventsSchema])
-def get_client_categories_with_events(client_id: int, db: Session = Depends(get_db)):
+async def get_client_categories_with_events(client_id: int, session: AsyncSession = Depends(get_read_session)):
     """
     Get all categories with up to 10 events per category for a specific client
     """
-    categories = db.query(MasterEventCategory).all()
+    result = await session.execute(select(MasterEventCategory))
+    categories = result.scalars().all()
     result = []
     
     for category in categories:
         # Get events for this category (limit to 10)
-        events_query = (
-            db.query(EventInfo)
+        events_query = await _fetch_events(
+            session,
+            select(EventInfo)
             .join(EventInCategory, EventInfo.event_id == EventInCategory.event_id)
-            .filter(EventInCategory.category_id == category.category_id, EventInfo.client_id == client_id)
+            .where(EventInCategory.category_id == category.category_id, EventInfo.client_id == client_id)
             .order_by(EventInfo.created_at.desc())
             .limit(10)
-            .all()
         )
         
         # Create enriched events with their categories
@@ -469,9 +498,9 @@ def get_client_categories_with_events(client_id: int, db: Session = Depends(get_
     return result
 
 @router.get("/events/clientURL/{client_url}", response_model=List[EventSchema])
-def get_client_events(client_url: str, db: Session = Depends(get_db)):
-    client = client_repo.get_client_by_url(db, client_url)
-    events = db.query(EventInfo).filter(EventInfo.client_id == client.client_id).all()
+async def get_client_events(client_url: str, session: AsyncSession = Depends(get_read_session)):
+    client = await client_repo.get_client_by_url(session, client_url)
+    events = await _fetch_events(session, select(EventInfo).where(EventInfo.client_id == client.client_id))
     enriched_events = []
     for event in events:
         filtered_event_plans = [
@@ -490,23 +519,24 @@ def get_client_events(client_url: str, db: Session = Depends(get_db)):
     return enriched_events
 
 @router.get("/events/clientURL/{client_url}/categories", response_model=List[CategoryWithEventsSchema])
-def get_client_events_by_category(client_url: str, db: Session = Depends(get_db)):
+async def get_client_events_by_category(client_url: str, session: AsyncSession = Depends(get_read_session)):
     """
     Get all categories with up to 10 events per category for a specific client
     """
-    client = client_repo.get_client_by_url(db, client_url)
-    categories = db.query(MasterEventCategory).all()
+    client = await client_repo.get_client_by_url(session, client_url)
+    result = await session.execute(select(MasterEventCategory))
+    categories = result.scalars().all()
     result = []
     
     for category in categories:
         # Get events for this category (limit to 10)
-        events_query = (
-            db.query(EventInfo)
+        events_query = await _fetch_events(
+            session,
+            select(EventInfo)
             .join(EventInCategory, EventInfo.event_id == EventInCategory.event_id)
-            .filter(EventInCategory.category_id == category.category_id, EventInfo.client_id == client.client_id)
+            .where(EventInCategory.category_id == category.category_id, EventInfo.client_id == client.client_id)
             .order_by(EventInfo.created_at.desc())
             .limit(10)
-            .all()
         )
         
         # Create enriched events with their categories
@@ -541,18 +571,18 @@ def get_client_events_by_category(client_url: str, db: Session = Depends(get_db)
     return result
 
 @router.get("/events/clientURL/{client_url}/basics", response_model=List[BasicEventSchema])
-def get_client_events_basics(client_url: str, db: Session = Depends(get_db)):
-    client = client_repo.get_client_by_url(db, client_url)
-    events = db.query(EventInfo).filter(EventInfo.client_id == client.client_id).all()
+async def get_client_events_basics(client_url: str, session: AsyncSession = Depends(get_read_session)):
+    client = await client_repo.get_client_by_url(session, client_url)
+    result = await session.execute(select(EventInfo).where(EventInfo.client_id == client.client_id))
+    events = result.scalars().all()
     return [BasicEventSchema.from_orm(event) for event in events]
 
 @router.put("/events/sequence/update", response_model=EventSchema)
-def update_event_sequence(event_id: int, sequence: float, db: Session = Depends(get_db)):
-    event = db.query(EventInfo).filter(EventInfo.event_id == event_id).first()
+async def update_event_sequence(event_id: int, sequence: float, session: AsyncSession = Depends(get_session)):
+    event = await session.get(EventInfo, event_id)
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
     
     event.display_sequence = sequence
-    db.commit()
-    db.refresh(event)
-    return event
\ No newline at end of file
+    await session.commit()
+    return await _fetch_event(session, event_id)
\ No newline at end of file
@@ -1,34 +1,33 @@
-from fastapi import APIRouter
-import requests 
-from core.config import GOOGLE_MAPS_API_KEY
+from fastapi import APIRouter, Depends, HTTPException
+from core.dependencies import require_admin
+from services import google_maps_service
 
-GOOGLE_MAPS_DETAILS_URL = "https://places.googleapis.com/v1/places/"
 router = APIRouter(
     prefix='/googlemap',
     tags=['maps api'] 
 )
 
 @router.post('/getdetail')
-def get_place_details(place_id: str) -> dict :
-    url=f"{GOOGLE_MAPS_DETAILS_URL}{place_id}?fields=id,displayName,location,formattedAddress,rating,photos&key={GOOGLE_MAPS_API_KEY}"
-    response = requests.get(url)
-
-    if response.status_code !=200:
-        raise Exception(f"Google API error : {response.status_code} - {response.text}")
-    return response.json()
+async def get_place_details(place_id: str) -> dict :
+    try:
+        return await google_maps_service.get_place_details(place_id)
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to fetch place details: {str(e)}")
 
 @router.post('/get_distance_data')
-def get_distance_matrix_details(origin: str, destination:str):
-    url = f"https://maps.googleapis.com/maps/api/distancematrix/json?destinations=place_id:{destination}&mode=driving&origins=place_id:{origin}&key={GOOGLE_MAPS_API_KEY}"
-    response = requests.get(url)
-    if response.status_code != 200:
-        raise Exception(f"distance calculation error : {response.status_code} - {response.text}")
-    data = response.json()
-
-    elements = data["rows"][0]["elements"][0]
+async def get_distance_matrix_details(origin: str, destination:str):
+    try:
+        return await google_maps_service.get_distance_matrix_details(origin, destination)
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to fetch distance data: {str(e)}")
 
-    return  {
-        "distance" : elements["distance"]["value"],
-        "duration": elements["duration"]["value"]
+@router.get('/cache_stats')
+async def get_cache_stats(current_user = Depends(require_admin)):
+    return {
+        "distance_matrix": google_maps_service.get_distance_cache_stats(),
+        "place_details": google_maps_service.get_place_details_cache_stats()
     }
-
@@ -1,15 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Response, Query,Path
+from fastapi import APIRouter, Depends, HTTPException, Request, status, Response, Query,Path
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from models.itinerary_modal import ItineraryShareCode
 from models.user import User
 from schemas.itinerary import CreatePackage, ItineraryItemResponse, PackageCostDetailsResponse, PackageData, GetPackageDetail, GetPackageList, ItineraryInput, AddItineraryItem, ItineraryItemStopUpdate, UpdateItemCost, UpdateItemDescription, UpdateItemDuration
-from services.itinerary_service import add_itinerary_item, create_initial_itinerary, create_share_code, day_cost_breakup, delete_item, get_all_itinerary, get_day_summary, get_itinerary_menu_details, get_local_resource, get_route, get_share_code, get_shared_itinerary, get_timeline, itinerary_cost_breakup,reorder_itinerary_items, update_item_cost, update_item_description, update_item_duration
+from services.itinerary_service import add_itinerary_item, create_initial_itinerary, create_share_code, day_cost_breakup, delete_item, get_all_itinerary, get_day_summary, get_day_summary_etag, get_itinerary_etag, get_itinerary_menu_details, get_local_resource, get_route, get_share_code, get_shared_itinerary, get_shared_snapshot, get_timeline, itinerary_cost_breakup, optimize_itinerary_day, reorder_itinerary_items, update_item_cost, update_item_description, update_item_duration
 
 from typing import Any, Dict, List, Optional, Union
-from sqlalchemy.orm import Session
-from core.database import get_db
 from core.dependencies import get_current_client, get_current_user, get_session
+from core.etag import etag_matches, make_etag
 # from logger import logger
 from datetime import time
 
@@ -44,10 +43,9 @@ async def create_initial_itinerary_api(
         raise HTTPException(status_code=500, detail=f"Failed to create itinerary: {str(e)}")
 
 @router.get('/menu_details/{id}')
-def get_itinerary_menu_details_api(id: int, db: Session = Depends(get_db)) -> Dict[str, Any]:
+async def get_itinerary_menu_details_api(id: int, session: AsyncSession = Depends(get_session)) -> Dict[str, Any]:
     try:
-        with db.begin():
-            return get_itinerary_menu_details(id, db)
+        return await get_itinerary_menu_details(id, session)
     except HTTPException as e:
         raise e
     except Exception as e:
@@ -55,11 +53,22 @@ def get_itinerary_menu_details_api(id: int, db: Session = Depends(get_db)) -> Di
         raise HTTPException(status_code=500, detail=f"Failed to fetch itinerary details.error: {e}")
 
 
+def _set_etag(response: Response, etag: Optional[str], view: str, version: Optional[int]) -> None:
+    """Send the ETag of the version the payload was built at, and none if that isn't the version the ETag was checked against"""
+    if etag is not None and version is not None and make_etag(view, version) == etag:
+        response.headers["ETag"] = etag
+
+
 @router.get('/timeline/{id}')
-def get_timeline_api(id: int, db: Session = Depends(get_db)):
+async def get_timeline_api(id: int, request: Request, response: Response, session: AsyncSession = Depends(get_session)):
     try:
-        with db.begin():
-            return get_timeline(id, db)
+        etag = await get_itinerary_etag(session, id, f"timeline:{id}")
+        if etag:
+            if etag_matches(request.headers.get("if-none-match"), etag):
+                return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+        payload, version = await get_timeline(id, session, with_version=True)
+        _set_etag(response, etag, f"timeline:{id}", version)
+        return payload
     except HTTPException as e:
         raise e
     except Exception as e:
@@ -67,10 +76,15 @@ def get_timeline_api(id: int, db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail="Failed to fetch itinerary timeline")
 
 @router.get('/get_route/{id}') #id = itinerary id
-def get_route_api(id:int=Path(...), day: Union[int,str] = Query(...), db:Session = Depends(get_db)):
+async def get_route_api(request: Request, response: Response, id:int=Path(...), day: Union[int,str] = Query(...), session: AsyncSession = Depends(get_session)):
     try:
-        with db.begin():
-            return get_route(id, day, db)
+        etag = await get_itinerary_etag(session, id, f"route:{id}:{day}")
+        if etag:
+            if etag_matches(request.headers.get("if-none-match"), etag):
+                return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+        payload, version = await get_route(id, day, session, with_version=True)
+        _set_etag(response, etag, f"route:{id}:{day}", version)
+        return payload
     except HTTPException as e:
         raise e
     except Exception as e:
@@ -78,10 +92,15 @@ def get_route_api(id:int=Path(...), day: Union[int,str] = Query(...), db:Session
         raise HTTPException(status_code=500, detail="Failed to fetch route")
 
 @router.get('/get_day_details/{id}') #id = itinerary day id
-def get_day_details_api(id:int=Path(...), db:Session = Depends(get_db)):
+async def get_day_details_api(request: Request, response: Response, id:int=Path(...), session: AsyncSession = Depends(get_session)):
     try:
-        with db.begin():
-            return get_day_summary(id, db)
+        etag = await get_day_summary_etag(session, id)
+        if etag:
+            if etag_matches(request.headers.get("if-none-match"), etag):
+                return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+        payload, version = await get_day_summary(id, session, with_version=True)
+        _set_etag(response, etag, f"day_summary:{id}", version)
+        return payload
     except HTTPException as e:
         raise e
     except Exception as e:
@@ -113,11 +132,19 @@ async def reorder_itinerary_items_api(request:ItineraryItemStopUpdate, session:
         #logger.error(f"Error adding itinerary item: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to add itinerary item: {str(e)}")
     
+@router.put('/optimize_day/{id}') #id = itinerary day id
+async def optimize_itinerary_day_api(id: int, session: AsyncSession = Depends(get_session)):
+    try:
+        return await optimize_itinerary_day(id, session)
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to optimize itinerary day: {str(e)}")
+
 @router.get('/get_all_itinerary/{id}') #id = user id
-def get_all_itinerary_api(id: int, db: Session = Depends(get_db)):
+async def get_all_itinerary_api(id: int, session: AsyncSession = Depends(get_session)):
     try:
-        with db.begin():
-            return get_all_itinerary(id, db)
+        return await get_all_itinerary(id, session)
     except HTTPException as e:
         raise e
     except Exception as e:
@@ -126,10 +153,9 @@ def get_all_itinerary_api(id: int, db: Session = Depends(get_db)):
 
 
 @router.put('/update_item_cost')
-async def update_item_cost_api(payload:UpdateItemCost, db:Session = Depends(get_db)):
+async def update_item_cost_api(payload:UpdateItemCost, session: AsyncSession = Depends(get_session)):
     try:
-        with db.begin():
-            return update_item_cost(payload, db)
+        return await update_item_cost(payload, session)
     except HTTPException as e:
         raise e
     except Exception as e:
@@ -137,10 +163,9 @@ async def update_item_cost_api(payload:UpdateItemCost, db:Session = Depends(get_
         raise HTTPException(status_code=500, detail=f"Failed to fetch day details: {str(e)}")
     
 @router.put('/update_item_description')
-async def update_item_description_api(payload:UpdateItemDescription, db:Session = Depends(get_db)):
+async def update_item_description_api(payload:UpdateItemDescription, session: AsyncSession = Depends(get_session)):
     try:
-        with db.begin():
-            return update_item_description(payload, db)
+        return await update_item_description(payload, session)
     except HTTPException as e:
         raise e
     except Exception as e:
@@ -166,9 +191,9 @@ async def delete_item_api(id:int, session: AsyncSession = Depends(get_session)):
         raise HTTPException(status_code=500, detail=f"Failed to fetch day details: {str(e)}")
 
 @router.get('/day_cost_breakup/{day_id}',status_code=status.HTTP_200_OK)
-def day_cost_breakup_api(day_id:int, db:Session = Depends(get_db)):
+async def day_cost_breakup_api(day_id:int, session: AsyncSession = Depends(get_session)):
     try:
-        return day_cost_breakup(day_id, db)
+        return await day_cost_breakup(day_id, session)
 
     except HTTPException as e:
         raise e
@@ -176,9 +201,9 @@ def day_cost_breakup_api(day_id:int, db:Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=f"Failed to fetch day cost breakup details: {str(e)}")
     
 @router.get('/itinerary_cost_breakup/{itinerary_id}', status_code=status.HTTP_200_OK) 
-def itinerary_cost_breakup_api(itinerary_id:int, db:Session = Depends(get_db)):
+async def itinerary_cost_breakup_api(itinerary_id:int, session: AsyncSession = Depends(get_session)):
     try:
-        return itinerary_cost_breakup(itinerary_id, db)
+        return await itinerary_cost_breakup(itinerary_id, session)
 
     except HTTPException as e:
         raise e
@@ -188,9 +213,9 @@ def itinerary_cost_breakup_api(itinerary_id:int, db:Session = Depends(get_db)):
 
   
 @router.get('/get_local_resource/{user_id}/{resource_type}',status_code=status.HTTP_200_OK)
-def get_local_resource_api(user_id:int,resource_type:str,db: Session = Depends(get_db)):
+async def get_local_resource_api(user_id:int,resource_type:str,session: AsyncSession = Depends(get_session)):
     try:
-        return get_local_resource(user_id,resource_type,db)
+        return await get_local_resource(user_id,resource_type,session)
     except HTTPException as e:
         raise e
     except Exception as e:
@@ -203,13 +228,17 @@ async def create_share_code_api(itinerary_id:int, session: AsyncSession = Depend
     return await create_share_code(itinerary_id, session)
     
 @router.get("/shared_itinerary_id/{share_code}")
-def get_shared_itinerary_api(share_code: str, db: Session = Depends(get_db)):
-    return get_shared_itinerary(share_code, db)
+async def get_shared_itinerary_api(share_code: str, session: AsyncSession = Depends(get_session)):
+    return await get_shared_itinerary(share_code, session)
+
+@router.get("/shared/{share_code}")
+async def get_shared_snapshot_api(share_code: str, session: AsyncSession = Depends(get_session)):
+    return await get_shared_snapshot(share_code, session)
     
 
 @router.get("/get_share_code/{itinerary_id}")
-def get_share_code_api(itinerary_id: int, db: Session = Depends(get_db)):
-    return get_share_code(itinerary_id, db)
+async def get_share_code_api(itinerary_id: int, session: AsyncSession = Depends(get_session)):
+    return await get_share_code(itinerary_id, session)
 
 
 
@@ -219,27 +248,27 @@ def get_share_code_api(itinerary_id: int, db: Session = Depends(get_db)):
 #api for future use
 
 @router.post('/create_package')
-async def create_package(payload: CreatePackage,  db:Session = Depends(get_db)):
+async def create_package(payload: CreatePackage,  session: AsyncSession = Depends(get_session)):
     package = {
         "package_id": 1
     }
     return {"package_id": package["package_id"]}
 
 @router.get('/get_package_detail/{id}') # id = package id
-async def get_package_detail_api(id:int,  db:Session = Depends(get_db) ):
+async def get_package_detail_api(id:int,  session: AsyncSession = Depends(get_session) ):
     return GetPackageDetail
 
 @router.get('/get_all_package/{id}') # id = user id
-async def get_package_detail_api(id:int,  db:Session = Depends(get_db) ):
+async def get_package_detail_api(id:int,  session: AsyncSession = Depends(get_session) ):
     return GetPackageList
 
 @router.put('/edit_package')
-async def edit_package_api(payload: PackageData,db: Session = Depends(get_db)):
+async def edit_package_api(payload: PackageData,session: AsyncSession = Depends(get_session)):
     return "package updated successfully"
 
 
 @router.delete('/delete_package/{id}') # id = package id
-async def delete_package(id:int, db:Session = Depends(get_db)):
+async def delete_package(id:int, session: AsyncSession = Depends(get_session)):
     return "package deleted successfully"
 
 
@@ -247,7 +276,7 @@ async def delete_package(id:int, db:Session = Depends(get_db)):
 async def package_cost_details_api(
     id: int,
     day_id: Optional[int] = Query(None),
-    db: Session = Depends(get_db)
+    session: AsyncSession = Depends(get_session)
 ):
     if day_id:
         return PackageCostDetailsResponse(
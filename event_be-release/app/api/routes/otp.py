@@ -1,14 +1,14 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from core.database import get_db
+from core.dependencies import get_session
 from schemas.otp import OTPRequest, OTPVerify, OTPResponse
 from core.email import save_otp, verify_otp, send_otp_email
 
 router = APIRouter(prefix="/api/otp", tags=["otp"])
 
 @router.post("/generate", response_model=OTPResponse)
-def generate_otp_route(request: OTPRequest, purpose: str, db: Session = Depends(get_db)):
+async def generate_otp_route(request: OTPRequest, purpose: str, session: AsyncSession = Depends(get_session)):
     """Generate and send OTP for various purposes"""
     if purpose not in ["registration", "login", "password_reset"]:
         raise HTTPException(
@@ -18,10 +18,10 @@ def generate_otp_route(request: OTPRequest, purpose: str, db: Session = Depends(
     
     try:
         # Generate and save OTP
-        otp_code = save_otp(db, request.email, purpose)
+        otp_code = await save_otp(session, request.email, purpose)
         
         # Send OTP via email
-        email_sent = send_otp_email(request.email, otp_code, purpose)
+        email_sent = await send_otp_email(request.email, otp_code, purpose)
         
         if not email_sent:
             raise HTTPException(
@@ -40,7 +40,7 @@ def generate_otp_route(request: OTPRequest, purpose: str, db: Session = Depends(
         )
 
 @router.post("/verify", response_model=OTPResponse)
-def verify_otp_route(data: OTPVerify, purpose: str, db: Session = Depends(get_db)):
+async def verify_otp_route(data: OTPVerify, purpose: str, session: AsyncSession = Depends(get_session)):
     """Verify OTP for various purposes"""
     if purpose not in ["registration", "login", "password_reset"]:
         raise HTTPException(
@@ -48,7 +48,7 @@ def verify_otp_route(data: OTPVerify, purpose: str, db: Session = Depends(get_db
             detail="Invalid OTP purpose"
         )
     
-    is_valid = verify_otp(db, data.email, data.code, purpose)
+    is_valid = await verify_otp(session, data.email, data.code, purpose)
     
     if not is_valid:
         raise HTTPException(
@@ -1,16 +1,16 @@
 from fastapi import APIRouter, Depends, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 
-from core.database import get_db
+from core.dependencies import get_read_session, get_session
 from services import to_request as to_request_service
 from schemas.to_request import TORequestWithUser, TORequestCreate, TORequestSchema
 
 router = APIRouter(prefix="/api/to-requests", tags=["TO Requests"])
 
 @router.put("/{to_request_id}/{status}", response_model=TORequestWithUser)
-def update_to_request_status(to_request_id: int, status: str, db: Session = Depends(get_db)):
-    req, user = to_request_service.update_request_status(db, to_request_id, status)
+async def update_to_request_status(to_request_id: int, status: str, session: AsyncSession = Depends(get_session)):
+    req, user = await to_request_service.update_request_status(session, to_request_id, status)
     return {
         "to_request_id": req.to_request_id,
         "approval_status": req.approval_status,
@@ -19,11 +19,11 @@ def update_to_request_status(to_request_id: int, status: str, db: Session = Depe
 
 
 @router.get("/", response_model=List[TORequestWithUser])
-def get_all_to_requests(db: Session = Depends(get_db)):
-    return to_request_service.get_to_request_users(db)
+async def get_all_to_requests(session: AsyncSession = Depends(get_read_session)):
+    return await to_request_service.get_to_request_users(session)
 
 
 @router.post("/create/{user_id}", response_model=TORequestSchema, status_code=status.HTTP_201_CREATED)
-def create_request(user_id: int, db: Session = Depends(get_db)):
+async def create_request(user_id: int, session: AsyncSession = Depends(get_session)):
     request_data = TORequestCreate(user_id=user_id)
-    return to_request_service.create_to_request(db, request_data)
\ No newline at end of file
+    return await to_request_service.create_to_request(session, request_data)
\ No newline at end of file
@@ -1,9 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
 from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from core.database import get_db
 from core.dependencies import get_session
 from schemas.user import DefaultTimingRequest, DefaultTimingResponse
 from models.user import User
@@ -11,6 +9,7 @@ from schemas.user import UserCreate
 from schemas.auth import LoginRequest, LoginResponse
 from services.user import add_default_timing, authenticate_user, create_user, get_default_timing, reset_password, update_default_timing
 from core.auth import create_access_token
+from repository.user import fetch_by_email, fetch_by_phone
 from core.email import save_otp, verify_otp, send_otp_email
 from schemas.otp import OTPVerify
 
@@ -21,26 +20,26 @@ router = APIRouter(prefix="/api/users", tags=["users"])
     status_code=status.HTTP_201_CREATED,
     response_model=None
 )
-def register(
+async def register(
     user_in: UserCreate,
     otp_code: str,  # OTP code passed as a query parameter
-    db: Session = Depends(get_db)
+    session: AsyncSession = Depends(get_session)
 ):
     # 1) Check for existing email in the User table
-    existing_email = db.query(User).filter(User.email == user_in.email).first()
+    existing_email = await fetch_by_email(session, user_in.email)
     if existing_email:
         raise HTTPException(
             status_code=400,
             detail="Email already registered"
         )
-    existing_phone = db.query(User).filter(User.phone == user_in.phone).first()
+    existing_phone = await fetch_by_phone(session, user_in.phone)
     if existing_phone:
         raise HTTPException(
             status_code=400,
             detail="Phone number already registered"
         )
     # 2) Verify OTP
-    is_valid = verify_otp(db, user_in.email, otp_code, "registration")
+    is_valid = await verify_otp(session, user_in.email, otp_code, "registration")
     if not is_valid:
         raise HTTPException(
             status_code=400,
@@ -49,8 +48,8 @@ def register(
     
     # 3) Create and return
     try:
-        new_user = create_user(db, user_in, verified=True)
-        add_default_timing(new_user.user_id,None, db)
+        new_user = await create_user(session, user_in, verified=True)
+        await add_default_timing(new_user.user_id,None, session)
         return {"id": new_user.user_id, "email": new_user.email}
     except ValueError as ve:
         raise HTTPException(status_code=400, detail=str(ve))
@@ -62,8 +61,8 @@ def register(
     response_model=LoginResponse,
     status_code=status.HTTP_200_OK
 )
-def login(creds: LoginRequest, db: Session = Depends(get_db)):
-    user = authenticate_user(db, creds)
+async def login(creds: LoginRequest, session: AsyncSession = Depends(get_session)):
+    user = await authenticate_user(session, creds)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -84,9 +83,9 @@ def login(creds: LoginRequest, db: Session = Depends(get_db)):
     }
 
 @router.post("/login-with-otp", response_model=LoginResponse)
-def login_with_otp(data: OTPVerify, db: Session = Depends(get_db)):
+async def login_with_otp(data: OTPVerify, session: AsyncSession = Depends(get_session)):
     # 1) Verify OTP
-    is_valid = verify_otp(db, data.email, data.code, "login")
+    is_valid = await verify_otp(session, data.email, data.code, "login")
     if not is_valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -94,7 +93,7 @@ def login_with_otp(data: OTPVerify, db: Session = Depends(get_db)):
         )
     
     # 2) Get user
-    user = db.query(User).filter(User.email == data.email).first()
+    user = await fetch_by_email(session, data.email)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -115,9 +114,9 @@ def login_with_otp(data: OTPVerify, db: Session = Depends(get_db)):
     }
 
 @router.post("/forgot-password")
-def forgot_password(email: str, db: Session = Depends(get_db)):
+async def forgot_password(email: str, session: AsyncSession = Depends(get_session)):
     # 1) Check if email exists in the User table
-    user = db.query(User).filter(User.email == email).first()
+    user = await fetch_by_email(session, email)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -125,8 +124,8 @@ def forgot_password(email: str, db: Session = Depends(get_db)):
         )
     
     # 2) Generate and send OTP
-    otp_code = save_otp(db, email, "password_reset")
-    email_sent = send_otp_email(email, otp_code, "password_reset")
+    otp_code = await save_otp(session, email, "password_reset")
+    email_sent = await send_otp_email(email, otp_code, "password_reset")
     
     if not email_sent:
         raise HTTPException(
@@ -137,9 +136,9 @@ def forgot_password(email: str, db: Session = Depends(get_db)):
     return {"message": "Password reset OTP sent to your email"}
 
 @router.post("/reset-password")
-def reset_password_route(data: OTPVerify, new_password: str, db: Session = Depends(get_db)):
+async def reset_password_route(data: OTPVerify, new_password: str, session: AsyncSession = Depends(get_session)):
     # 1) Verify OTP
-    is_valid = verify_otp(db, data.email, data.code, "password_reset")
+    is_valid = await verify_otp(session, data.email, data.code, "password_reset")
     if not is_valid:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, 
@@ -147,7 +146,7 @@ def reset_password_route(data: OTPVerify, new_password: str, db: Session = Depen
         )
     
     # 2) Reset password
-    success = reset_password(db, data.email, new_password)
+    success = await reset_password(session, data.email, new_password)
     if not success:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -158,9 +157,9 @@ def reset_password_route(data: OTPVerify, new_password: str, db: Session = Depen
 
 
 @router.post('/add_default_timing/{user_id}', status_code=status.HTTP_201_CREATED)
-def add_default_timing_api(user_id:int,payload: DefaultTimingRequest, db: Session = Depends(get_db)):
+async def add_default_timing_api(user_id:int,payload: DefaultTimingRequest, session: AsyncSession = Depends(get_session)):
     try:
-        return add_default_timing(user_id,payload, db)        
+        return await add_default_timing(user_id,payload, session)        
     except HTTPException as e:
         raise e
     except Exception as e:
@@ -178,9 +177,9 @@ async def get_default_timing_api(user_id:int, session: AsyncSession = Depends(ge
       
      
 @router.put('/update_default_timing/{setting_id}',status_code=status.HTTP_200_OK, response_model=DefaultTimingResponse)
-def update_default_timing_api(setting_id:int,payload: DefaultTimingRequest, db: Session = Depends(get_db)):
+async def update_default_timing_api(setting_id:int,payload: DefaultTimingRequest, session: AsyncSession = Depends(get_session)):
     try:
-        return update_default_timing(setting_id,payload,db)
+        return await update_default_timing(setting_id,payload,session)
     except HTTPException as e:
         raise e
     except Exception as e:
@@ -0,0 +1,54 @@
+"""Request-shaped latency on the async engine: NullPool (connection per session) vs the configured pool.
+
+Each request opens a session, runs one query and closes it, like get_session + get_current_user.
+Run from the app directory:
+    python -m benchmarks.db_pool --requests 500 --concurrency 20
+"""
+import argparse
+import asyncio
+import time
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from core.async_database import engine_options
+from core.config import settings
+
+
+def summarize(label: str, timings: list) -> None:
+    timings = sorted(timings)
+    p50 = timings[len(timings) // 2]
+    p99 = timings[max(0, int(len(timings) * 0.99) - 1)]
+    print(f"{label:<10} p50={p50 * 1000:7.2f}ms p99={p99 * 1000:7.2f}ms max={timings[-1] * 1000:7.2f}ms")
+
+
+async def run(engine_kwargs: dict, requests: int, concurrency: int) -> list:
+    engine = create_async_engine(settings.ASYNC_DATABASE_URL, **engine_kwargs)
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    gate = asyncio.Semaphore(concurrency)
+    timings = []
+
+    async def request() -> None:
+        async with gate:
+            started = time.perf_counter()
+            async with session_factory() as session:
+                await session.execute(text("SELECT 1"))
+            timings.append(time.perf_counter() - started)
+
+    await asyncio.gather(*(request() for _ in range(requests)))
+    await engine.dispose()
+    return timings
+
+
+async def main(requests: int, concurrency: int) -> None:
+    summarize("NullPool", await run({"poolclass": NullPool, "pool_pre_ping": True}, requests, concurrency))
+    summarize("pooled", await run(engine_options(), requests, concurrency))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency))
@@ -0,0 +1,59 @@
+"""Per-call latency of Google Maps lookups: fresh httpx client per call vs the shared pooled client.
+
+Run from the app directory:
+    python -m benchmarks.google_maps_client --calls 50
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+from core.config import GOOGLE_MAPS_API_KEY
+from core.http_client import close_http_client, get_http_client
+
+DEFAULT_URL = "https://maps.googleapis.com/maps/api/place/details/json"
+
+
+def summarize(label: str, timings: list) -> None:
+    timings = sorted(timings)
+    p95 = timings[max(0, int(len(timings) * 0.95) - 1)]
+    print(
+        f"{label:<16} mean={statistics.mean(timings) * 1000:7.1f}ms "
+        f"p50={statistics.median(timings) * 1000:7.1f}ms "
+        f"p95={p95 * 1000:7.1f}ms"
+    )
+
+
+async def fresh_client_call(url: str, params: dict) -> float:
+    started = time.perf_counter()
+    async with httpx.AsyncClient() as client:
+        await client.get(url, params=params)
+    return time.perf_counter() - started
+
+
+async def shared_client_call(url: str, params: dict) -> float:
+    started = time.perf_counter()
+    await get_http_client().get(url, params=params)
+    return time.perf_counter() - started
+
+
+async def main(calls: int, url: str, place_id: str) -> None:
+    params = {"place_id": place_id, "fields": "name", "key": GOOGLE_MAPS_API_KEY}
+
+    before = [await fresh_client_call(url, params) for _ in range(calls)]
+    after = [await shared_client_call(url, params) for _ in range(calls)]
+    await close_http_client()
+
+    summarize("fresh client", before)
+    summarize("shared client", after)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=20)
+    parser.add_argument("--url", default=DEFAULT_URL)
+    parser.add_argument("--place-id", default="ChIJN1t_tDeuEmsRUsoyG83frY4")
+    args = parser.parse_args()
+    asyncio.run(main(args.calls, args.url, args.place_id))
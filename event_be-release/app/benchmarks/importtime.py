@@ -0,0 +1,81 @@
+"""Cold import time of `main`, the work every worker does before it can serve.
+
+Each run imports `main` in a fresh interpreter. Exits non-zero when a heavy dependency that
+should load on first use is imported eagerly, or when the median regresses:
+  * past --margin over a baseline recorded on the same machine with --record, or
+  * past an absolute --budget-ms (or IMPORTTIME_BUDGET_MS), for machines with a known budget.
+With neither it fails too, since an unchecked timing would pass any regression; record a
+baseline first. Run from the app directory:
+    python -m benchmarks.importtime --record     # on the base commit
+    python -m benchmarks.importtime              # on the change
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+# built on first use (core.images, services.booking) or never used by the API (gen_ai)
+LAZY_MODULES = ["boto3", "botocore", "razorpay", "langchain", "langchain_core", "langgraph"]
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "importtime_baseline.json")
+
+PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import main
+elapsed = time.perf_counter() - started
+print(json.dumps({"seconds": elapsed, "loaded": [name for name in %r if name in sys.modules]}))
+""" % LAZY_MODULES
+
+
+def cold_import() -> dict:
+    result = subprocess.run([sys.executable, "-c", PROBE], capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main(runs: int, budget_ms: float, baseline_path: str, margin: float, record: bool) -> int:
+    samples = [cold_import() for _ in range(runs)]
+    timings = sorted(sample["seconds"] * 1000 for sample in samples)
+    median = statistics.median(timings)
+    print(f"import main  median={median:7.1f}ms min={timings[0]:7.1f}ms max={timings[-1]:7.1f}ms")
+
+    failed = False
+    loaded = sorted({name for sample in samples for name in sample["loaded"]})
+    if loaded:
+        print(f"FAIL: imported eagerly: {', '.join(loaded)}")
+        failed = True
+
+    if record:
+        with open(baseline_path, "w") as baseline_file:
+            json.dump({"median_ms": median}, baseline_file)
+        print(f"recorded baseline {median:.1f}ms in {baseline_path}")
+    elif os.path.exists(baseline_path):
+        with open(baseline_path) as baseline_file:
+            limit = json.load(baseline_file)["median_ms"] * (1 + margin)
+        print(f"baseline limit {limit:.1f}ms (+{margin:.0%})")
+        if median > limit:
+            print(f"FAIL: median import time is {median - limit:.1f}ms over the baseline limit")
+            failed = True
+    elif not budget_ms:
+        print(f"FAIL: no baseline at {baseline_path} and no budget; record one with --record on the base commit")
+        failed = True
+
+    if budget_ms:
+        print(f"budget {budget_ms:.0f}ms")
+        if median > budget_ms:
+            print(f"FAIL: median import time is {median - budget_ms:.1f}ms over budget")
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=float(os.getenv("IMPORTTIME_BUDGET_MS", 0)))
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--margin", type=float, default=0.5)
+    parser.add_argument("--record", action="store_true")
+    args = parser.parse_args()
+    sys.exit(main(args.runs, args.budget_ms, args.baseline, args.margin, args.record))
@@ -0,0 +1,65 @@
+"""Cold worker startup: the old create_all startup hook vs the connectivity check it was replaced with.
+
+Each boot builds a fresh engine, as a new worker process would, runs the startup work and disposes
+it; --workers boots run at once, like a deploy starting several workers. The schema should already
+be migrated (python -m migrations). Run from the app directory:
+    python -m benchmarks.startup --boots 20 --workers 4
+"""
+import argparse
+import asyncio
+import time
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from core.async_database import engine_options
+from core.config import settings
+from migrations import load_migrations
+
+# the table set the old startup hook created, frozen in migration 0001
+initial_schema = load_migrations()[0]
+
+
+async def create_all(conn) -> None:
+    await conn.run_sync(initial_schema.metadata.create_all)
+
+
+async def connectivity_check(conn) -> None:
+    await conn.execute(text("SELECT 1"))
+
+
+def summarize(label: str, timings: list) -> None:
+    timings = sorted(timings)
+    p50 = timings[len(timings) // 2]
+    print(f"{label:<20} p50={p50 * 1000:8.2f}ms max={timings[-1] * 1000:8.2f}ms")
+
+
+async def boot(startup) -> float:
+    started = time.perf_counter()
+    engine = create_async_engine(settings.ASYNC_DATABASE_URL, **engine_options())
+    async with engine.begin() as conn:
+        await startup(conn)
+    elapsed = time.perf_counter() - started
+    await engine.dispose()
+    return elapsed
+
+
+async def run(startup, boots: int, workers: int) -> list:
+    timings = []
+    for start in range(0, boots, workers):
+        batch = min(workers, boots - start)
+        timings.extend(await asyncio.gather(*(boot(startup) for _ in range(batch))))
+    return timings
+
+
+async def main(boots: int, workers: int) -> None:
+    summarize("create_all", await run(create_all, boots, workers))
+    summarize("connectivity check", await run(connectivity_check, boots, workers))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--boots", type=int, default=20)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+    asyncio.run(main(args.boots, args.workers))
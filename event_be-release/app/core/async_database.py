@@ -2,12 +2,32 @@ from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sess
 from sqlalchemy.pool import NullPool
 from core.config import settings
 
-# Create async engine with pooling disabled
+
+def engine_options() -> dict:
+    """Pool arguments for the async engine, taken from Settings"""
+    if settings.DB_USE_NULL_POOL:
+        return {"poolclass": NullPool}
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT_SECONDS,
+        "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+
+# Create async engine with a connection pool shared by every request
 async_engine = create_async_engine(
     settings.ASYNC_DATABASE_URL,
-    poolclass=NullPool,  # Disable connection pooling
     echo=False,
-    pool_pre_ping=True,
+    **engine_options(),
+)
+
+# Replica engine for read-only sessions, or the primary itself when no replica is configured
+read_engine = (
+    create_async_engine(settings.READ_DATABASE_URL, echo=False, **engine_options())
+    if settings.READ_DATABASE_URL
+    else async_engine
 )
 
 # Create async session factory
@@ -17,4 +37,8 @@ AsyncSessionLocal = async_sessionmaker(
     expire_on_commit=False,
 )
 
-
+AsyncReadSessionLocal = async_sessionmaker(
+    read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+)
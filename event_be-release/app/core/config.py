@@ -2,7 +2,7 @@
 from datetime import timedelta
 from pydantic_settings import BaseSettings 
 from pydantic import field_validator
-from typing import List
+from typing import List, Optional
 from dotenv import load_dotenv
 import os
 import json
@@ -30,6 +30,56 @@ class Settings(BaseSettings):
     S3_BUCKET_NAME: str
     S3_REGION: str
 
+    # Async engine connection pool
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT_SECONDS: float = 30.0
+    DB_POOL_RECYCLE_SECONDS: int = 1800                              # below MySQL's wait_timeout
+    DB_POOL_PRE_PING: bool = True
+    DB_USE_NULL_POOL: bool = False                                   # open a connection per session instead
+
+    # Read replica for GET endpoints (async URL); reads use the primary when unset
+    READ_DATABASE_URL: Optional[str] = None
+    READ_AFTER_WRITE_PRIMARY_SECONDS: int = 5                        # keep a client's reads on the primary after it writes
+    READ_AFTER_WRITE_MAX_USERS: int = 10000                          # recent writers remembered per worker
+
+    # Distance Matrix cache: in-process LRU in front of the distance_matrix_cache table
+    DISTANCE_CACHE_MAX_ENTRIES: int = 10000
+    DISTANCE_CACHE_MEMORY_TTL_SECONDS: int = 60 * 60                 # 1 hr
+    DISTANCE_CACHE_DB_TTL_SECONDS: int = 60 * 60 * 24 * 30           # 30 days
+    # billed but unused elements a batched request may carry; 100 batches a whole day, 0 never pays for unused elements
+    DISTANCE_MATRIX_MAX_WASTED_ELEMENTS: int = 100
+
+    # Place Details cache shared by hotel, place, restaurant and location creation
+    PLACE_DETAILS_CACHE_MAX_ENTRIES: int = 5000
+    PLACE_DETAILS_CACHE_MEMORY_TTL_SECONDS: int = 60 * 60 * 24      # 1 day
+    PLACE_DETAILS_CACHE_DB_TTL_SECONDS: int = 60 * 60 * 24 * 30      # 30 days
+
+    # Offline travel-time estimator used as provisional answer / fallback for the Distance Matrix
+    TRAVEL_TIME_MODE: str = "live"                                   # "live" or "estimate_first"
+    TRAVEL_ESTIMATE_FALLBACK: bool = True
+    TRAVEL_ESTIMATE_FALLBACK_AFTER_SECONDS: float = 5.0
+    TRAVEL_ESTIMATE_CIRCUITY: float = 1.35
+    TRAVEL_ESTIMATE_SMOOTHING: float = 0.05
+
+    # Shared HTTP client used for Google Maps calls
+    GOOGLE_HTTP2: bool = True
+    GOOGLE_HTTP_MAX_CONNECTIONS: int = 100
+    GOOGLE_HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    GOOGLE_HTTP_KEEPALIVE_EXPIRY_SECONDS: float = 30.0
+    GOOGLE_HTTP_TIMEOUT_SECONDS: float = 10.0
+    GOOGLE_HTTP_CONNECT_TIMEOUT_SECONDS: float = 5.0
+
+    # Day route optimizer: exact DP up to this many movable stops, 2-opt/or-opt above it
+    ROUTE_OPTIMIZER_EXACT_MAX_STOPS: int = 10
+    ROUTE_OPTIMIZER_MAX_PASSES: int = 50
+
+    # Shared itinerary links: share code -> itinerary id, and the public snapshot per itinerary
+    SHARE_CODE_CACHE_MAX_ENTRIES: int = 10000
+    SHARE_CODE_CACHE_TTL_SECONDS: int = 60 * 60 * 24                # 1 day, share codes never change
+    SHARED_SNAPSHOT_CACHE_MAX_ENTRIES: int = 1000
+    SHARED_SNAPSHOT_CACHE_TTL_SECONDS: int = 30                      # bounds staleness on other workers
+
 
     @field_validator("CORS_ORIGINS", mode="before")
     def parse_cors(cls, value):
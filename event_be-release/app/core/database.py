@@ -11,11 +11,38 @@ DATABASE_URL = (
     settings.DATABASE_URL   
 )
 
-engine = create_engine(DATABASE_URL, future=True)
-SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+# The app runs on the async engine in core.async_database. The sync engine is
+# only a compatibility layer for scripts and code that still needs a blocking
+# Session, so it is created on first use instead of at import time.
+_engine = None
+_session_factory = None
+
+
+def get_engine():
+    global _engine
+    if _engine is None:
+        _engine = create_engine(DATABASE_URL, future=True)
+    return _engine
+
+
+def get_sessionmaker():
+    global _session_factory
+    if _session_factory is None:
+        _session_factory = sessionmaker(bind=get_engine(), autoflush=False, autocommit=False)
+    return _session_factory
+
+
+def __getattr__(name):
+    # keep `from core.database import engine, SessionLocal` working
+    if name == "engine":
+        return get_engine()
+    if name == "SessionLocal":
+        return get_sessionmaker()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 def get_db():
-    db = SessionLocal()
+    db = get_sessionmaker()()
     try:
         yield db
     finally:
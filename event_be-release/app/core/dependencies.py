@@ -1,12 +1,16 @@
-from typing import Any, AsyncGenerator
+import time
+from typing import Any, AsyncGenerator, Optional
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, Response, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from sqlalchemy.orm import selectinload
+from starlette.concurrency import run_in_threadpool
 from core.auth import create_refresh_token, verify_password, create_access_token, decode_access_token
-from core.async_database import AsyncSessionLocal
+from core.async_database import AsyncReadSessionLocal, AsyncSessionLocal, read_engine, async_engine
+from core.cache import TTLCache
+from core.config import settings
 from models.user import User
 from models.client import ClientUser
 from schemas.auth import Token
@@ -21,12 +25,64 @@ async def get_session() -> AsyncGenerator[Any, Any]:
         finally:
             await session.close()
 
+
+# --- Read replica routing ---
+# After a successful write, the writer's reads stay on the primary for READ_AFTER_WRITE_PRIMARY_SECONDS
+# so it never sees replica lag on its own writes. Writers are recognised by the `sub` of their bearer
+# token (what the app sends; remembered per worker) or by this cookie (epoch seconds, for browsers).
+# Endpoints that read back a user's own working data (itineraries, default timing, own client and
+# bookings) use get_session outright, since the next request may land on another worker.
+PRIMARY_UNTIL_COOKIE = "db_primary_until"
+
+_recent_writers = TTLCache(settings.READ_AFTER_WRITE_MAX_USERS, settings.READ_AFTER_WRITE_PRIMARY_SECONDS)
+
+
+def _token_subject(request: Request) -> Optional[str]:
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    try:
+        return decode_access_token(token).get("sub")
+    except HTTPException:
+        return None
+
+
+def stick_to_primary(request: Request, response: Response) -> None:
+    """Route the client's reads to the primary for READ_AFTER_WRITE_PRIMARY_SECONDS"""
+    if read_engine is async_engine:
+        return
+    subject = _token_subject(request)
+    if subject is not None:
+        _recent_writers.set(subject, True)
+    seconds = settings.READ_AFTER_WRITE_PRIMARY_SECONDS
+    response.set_cookie(PRIMARY_UNTIL_COOKIE, str(int(time.time()) + seconds), max_age=seconds, httponly=True)
+
+
+def reads_from_primary(request: Request) -> bool:
+    subject = _token_subject(request)
+    if subject is not None and _recent_writers.get(subject):
+        return True
+    try:
+        return float(request.cookies.get(PRIMARY_UNTIL_COOKIE, 0)) > time.time()
+    except ValueError:
+        return False
+
+
+async def get_read_session(request: Request) -> AsyncGenerator[Any, Any]:
+    """Session for read-only endpoints: the replica, unless the client wrote recently"""
+    session_factory = AsyncSessionLocal if reads_from_primary(request) else AsyncReadSessionLocal
+    async with session_factory() as session:
+        try:
+            yield session
+        finally:
+            await session.close()
+
 # --- Authenticate & issue JWT ---
 async def authenticate_user(email: str, password: str, session: AsyncSession):
     q = select(User).where(User.email == email)
     result = await session.execute(q)
     user = result.scalar_one_or_none()
-    if not user or not verify_password(password, user.password_hash):
+    if not user or not await run_in_threadpool(verify_password, password, user.password_hash):
         return None
     return user
 
@@ -77,6 +133,16 @@ async def require_TO(user: User = Depends(get_current_user)) -> User:
     return user
 
 
+# --- Check User.role == 'admin' ---
+async def require_admin(user: User = Depends(get_current_user)) -> User:
+    if not user.role or user.role.role != 'admin':
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only admins can perform this action"
+        )
+    return user
+
+
 # --- Determine current client context ---
 #    We assume each TO is assigned exactly one approved ClientUser record
 async def get_current_client(
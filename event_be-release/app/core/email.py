@@ -4,7 +4,9 @@ from email.message import EmailMessage
 import random
 import string
 from datetime import datetime, timedelta
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
 
 from models.otp import OTP
 
@@ -18,7 +20,7 @@ def generate_otp():
     """Generate a random 6-digit OTP"""
     return ''.join(random.choices(string.digits, k=6))
 
-def save_otp(db: Session, email: str, purpose: str, expiry_minutes: int = 10):
+async def save_otp(session: AsyncSession, email: str, purpose: str, expiry_minutes: int = 10):
     """Save a new OTP to the database"""
     # Generate a new OTP
     otp_code = generate_otp()
@@ -35,29 +37,29 @@ def save_otp(db: Session, email: str, purpose: str, expiry_minutes: int = 10):
     )
     
     # Save to database
-    db.add(new_otp)
-    db.commit()
-    db.refresh(new_otp)
+    session.add(new_otp)
+    await session.commit()
     
     return otp_code
 
-def verify_otp(db: Session, email: str, code: str, purpose: str):
+async def verify_otp(session: AsyncSession, email: str, code: str, purpose: str):
     """Verify if OTP is valid and not expired"""
     # Find the most recent unused OTP for this email and purpose
-    otp = db.query(OTP).filter(
+    result = await session.execute(select(OTP).where(
         OTP.email == email,
         OTP.code == code,
         OTP.purpose == purpose,
         OTP.is_used == 0,
         OTP.expires_at > datetime.utcnow()
-    ).order_by(OTP.created_at.desc()).first()
+    ).order_by(OTP.created_at.desc()).limit(1))
+    otp = result.scalars().first()
     
     if not otp:
         return False
     
     # Mark as used
     otp.is_used = 1
-    db.commit()
+    await session.commit()
     
     return True
 
@@ -78,8 +80,8 @@ def send_email(to_email: str, subject: str, content: str):
         print(f"Error sending email: {e}")
         return False
 
-def send_otp_email(email: str, otp: str, purpose: str):
-    """Send OTP via email"""
+async def send_otp_email(email: str, otp: str, purpose: str):
+    """Send OTP via email, off the event loop since smtplib blocks"""
     subject_mapping = {
         "registration": "Verify Your Email for Registration",
         "login": "Your Login OTP Code",
@@ -95,4 +97,4 @@ def send_otp_email(email: str, otp: str, purpose: str):
     subject = subject_mapping.get(purpose, "Your OTP Code")
     content = content_mapping.get(purpose, f"Your OTP code is: {otp}")
     
-    return send_email(email, subject, content)
\ No newline at end of file
+    return await run_in_threadpool(send_email, email, subject, content)
\ No newline at end of file
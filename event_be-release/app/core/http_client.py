@@ -0,0 +1,31 @@
+import httpx
+from typing import Optional
+from core.config import settings
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Application-scoped client so Google Maps calls reuse pooled keep-alive connections"""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            http2=settings.GOOGLE_HTTP2,
+            limits=httpx.Limits(
+                max_connections=settings.GOOGLE_HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.GOOGLE_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=settings.GOOGLE_HTTP_KEEPALIVE_EXPIRY_SECONDS,
+            ),
+            timeout=httpx.Timeout(
+                settings.GOOGLE_HTTP_TIMEOUT_SECONDS,
+                connect=settings.GOOGLE_HTTP_CONNECT_TIMEOUT_SECONDS,
+            ),
+        )
+    return _client
+
+
+async def close_http_client() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
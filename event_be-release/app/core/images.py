@@ -1,26 +1,34 @@
 
 from fastapi import File, UploadFile, HTTPException, APIRouter
-import boto3
 import os
 from dotenv import load_dotenv
 import time
 from core.config import settings
 import random, string
-# Initialize S3 client
-s3 = boto3.client(
-    "s3",
-    region_name=settings.S3_REGION,
-    aws_access_key_id=settings.AWS_ACCESS_KEY,
-    aws_secret_access_key=settings.AWS_SECRET_KEY
-)
 S3_BUCKET_NAME = settings.S3_BUCKET_NAME
 
+_s3 = None
+
+
+def get_s3_client():
+    """S3 client built on first use so boto3 stays out of app import"""
+    global _s3
+    if _s3 is None:
+        import boto3
+        _s3 = boto3.client(
+            "s3",
+            region_name=settings.S3_REGION,
+            aws_access_key_id=settings.AWS_ACCESS_KEY,
+            aws_secret_access_key=settings.AWS_SECRET_KEY
+        )
+    return _s3
+
 async def upload_image(file: UploadFile = File(...)):
     # filename = f"{int(os.path.getmtime(file.file.fileno()))}_{file.filename}"
     filename = f"{int(time.time())}_{''.join(random.choices(string.digits, k=6))}_{(file.filename)}"
 
     try:
-        s3.upload_fileobj(file.file, S3_BUCKET_NAME, filename)
+        get_s3_client().upload_fileobj(file.file, S3_BUCKET_NAME, filename)
         return {"message": "Image uploaded successfully", "filename": filename}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -29,7 +37,7 @@ def view_image(selected_image_key: str = None):
     current_image = selected_image_key
     if not current_image:
         raise HTTPException(status_code=404, detail="No image uploaded")
-    url = s3.generate_presigned_url('get_object',
+    url = get_s3_client().generate_presigned_url('get_object',
                                     Params={'Bucket': S3_BUCKET_NAME, 'Key': current_image},
                                     ExpiresIn=3600)
     return {"url": url, "filename": current_image}
@@ -41,7 +49,7 @@ def delete_image(selected_image_key: str = None):
         raise HTTPException(status_code=404, detail="No image to delete")
 
     try:
-        s3.delete_object(Bucket=S3_BUCKET_NAME, Key=current_image)
+        get_s3_client().delete_object(Bucket=S3_BUCKET_NAME, Key=current_image)
         return {"message": "Image deleted successfully"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -0,0 +1,50 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+
+class SingleFlight:
+    """Let concurrent awaits for the same key share one in-flight call.
+
+    `calls` counts calls that were actually started, `coalesced` counts awaits
+    that piggybacked on a call already in flight.
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.coalesced = 0
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+
+    def join(self, key: Hashable) -> Optional[asyncio.Future]:
+        """In-flight call for `key`, if there is one"""
+        future = self._in_flight.get(key)
+        if future is not None:
+            self.coalesced += 1
+        return future
+
+    def track(self, key: Hashable, future: asyncio.Future) -> None:
+        """Register `future` as the in-flight call for `key` until it completes"""
+        self.calls += 1
+        self._in_flight[key] = future
+        future.add_done_callback(lambda done: self._forget(key, done))
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        future = self.join(key)
+        if future is None:
+            future = asyncio.ensure_future(fn())
+            self.track(key, future)
+        # shield so one caller going away doesn't cancel the call for the others
+        return await asyncio.shield(future)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "in_flight": len(self._in_flight),
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+        }
+
+    def _forget(self, key: Hashable, future: asyncio.Future) -> None:
+        if self._in_flight.get(key) is future:
+            del self._in_flight[key]
+        if not future.cancelled():
+            # mark the exception retrieved even if every waiter went away
+            future.exception()
@@ -1,14 +1,15 @@
 import os
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from sqlalchemy import text
 import uvicorn
 
 
 
-# make sure you create tables before serving
-from core.database import engine
+# tables are created and altered by `python -m migrations`, not at startup
 from models import events
-from core.database import Base
+from core.async_database import async_engine, read_engine
+from core.dependencies import stick_to_primary
 
 from api.routes import (user,hotel_route, itinerary, events,
                         connection_request, otp, to_request, client,
@@ -31,16 +32,29 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.middleware("http")
+async def read_after_write_middleware(request: Request, call_next):
+    response = await call_next(request)
+    if request.method not in ("GET", "HEAD", "OPTIONS") and response.status_code < 400:
+        stick_to_primary(request, response)
+    return response
+
 @app.on_event("startup")
 async def startup_event():
-    from core.database import engine as sync_engine
-    Base.metadata.create_all(bind=sync_engine)
+    # fail fast if the database is unreachable; this also opens the first pooled connection
+    async with async_engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
 
 @app.on_event("shutdown")
 async def shutdown_event():
     # async disposal
-    from core.async_database import async_engine
+    from core.http_client import close_http_client
+    from services.google_maps_service import flush_cache_writes
+    await flush_cache_writes()
     await async_engine.dispose()
+    if read_engine is not async_engine:
+        await read_engine.dispose()
+    await close_http_client()
 
 app.include_router(user.router)
 app.include_router(events.router)
@@ -0,0 +1,64 @@
+"""Versioned schema migrations, applied by a separate bootstrap command instead of app startup.
+
+Each module in migrations/versions is named `<version>_<name>.py` and defines
+DESCRIPTION and `async def upgrade(conn)`. Applied versions are recorded in the
+schema_migrations table. A version module never changes once released: any change to
+the models needs a new version module, or existing databases never see it. Run from
+the app directory:
+    python -m migrations            # apply pending migrations
+    python -m migrations status     # list applied and pending versions
+"""
+import importlib
+import pkgutil
+from datetime import datetime
+from types import ModuleType
+from typing import List, Set
+
+from sqlalchemy import Column, DateTime, MetaData, String, Table, select
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from migrations import versions
+
+metadata = MetaData()
+
+schema_migrations = Table(
+    "schema_migrations",
+    metadata,
+    Column("version", String(50), primary_key=True),
+    Column("description", String(255), nullable=False),
+    Column("applied_at", DateTime, nullable=False, default=datetime.now),
+)
+
+
+def load_migrations() -> List[ModuleType]:
+    """Migration modules in version order"""
+    names = sorted(info.name for info in pkgutil.iter_modules(versions.__path__))
+    return [importlib.import_module(f"{versions.__name__}.{name}") for name in names]
+
+
+def migration_version(module: ModuleType) -> str:
+    return module.__name__.rsplit(".", 1)[-1].split("_", 1)[0]
+
+
+async def applied_versions(conn: AsyncConnection) -> Set[str]:
+    await conn.run_sync(metadata.create_all)
+    result = await conn.execute(select(schema_migrations.c.version))
+    return set(result.scalars().all())
+
+
+async def pending_migrations(engine: AsyncEngine) -> List[ModuleType]:
+    async with engine.begin() as conn:
+        applied = await applied_versions(conn)
+    return [module for module in load_migrations() if migration_version(module) not in applied]
+
+
+async def upgrade(engine: AsyncEngine) -> List[str]:
+    """Apply every pending migration, each in its own transaction; returns the versions applied"""
+    applied = []
+    for module in await pending_migrations(engine):
+        version = migration_version(module)
+        async with engine.begin() as conn:
+            await module.upgrade(conn)
+            await conn.execute(schema_migrations.insert().values(version=version, description=module.DESCRIPTION))
+        applied.append(version)
+    return applied
@@ -0,0 +1,25 @@
+import argparse
+import asyncio
+
+from core.async_database import async_engine
+from migrations import load_migrations, migration_version, pending_migrations, upgrade
+
+
+async def main(command: str) -> None:
+    try:
+        if command == "status":
+            pending = {migration_version(module) for module in await pending_migrations(async_engine)}
+            for module in load_migrations():
+                version = migration_version(module)
+                print(f"{version}  {'pending' if version in pending else 'applied':<8} {module.DESCRIPTION}")
+        else:
+            applied = await upgrade(async_engine)
+            print(f"applied {', '.join(applied)}" if applied else "schema is up to date")
+    finally:
+        await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Apply versioned schema migrations")
+    parser.add_argument("command", nargs="?", choices=["upgrade", "status"], default="upgrade")
+    asyncio.run(main(parser.parse_args().command))
@@ -0,0 +1,407 @@
+"""Tables as they stood when schema creation moved out of app startup.
+
+Frozen on purpose: this module must not import the models, so later model changes
+need a new version module instead of silently changing what 0001 creates.
+"""
+from sqlalchemy import (BigInteger, Boolean, Column, DECIMAL, Date, DateTime, Double, Enum, Float, ForeignKey,
+                        Integer, JSON, MetaData, String, TIMESTAMP, Table, Text, Time, UniqueConstraint, func)
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+DESCRIPTION = "initial schema, as previously created by app startup"
+
+metadata = MetaData()
+
+Table(
+    "distance_matrix_cache",
+    metadata,
+    Column("cache_id", Integer, primary_key=True, autoincrement=True),
+    Column("origin_place_id", String(255), nullable=False),
+    Column("destination_place_id", String(255), nullable=False),
+    Column("mode", String(20), nullable=False),
+    Column("distance", Integer, nullable=False),
+    Column("duration", Integer, nullable=False),
+    Column("fetched_at", DateTime, nullable=False),
+    UniqueConstraint("origin_place_id", "destination_place_id", "mode", name="uq_distance_matrix_pair"),
+)
+
+Table(
+    "event_booking_rooms",
+    metadata,
+    Column("booking_room_id", Integer, primary_key=True, autoincrement=True),
+    Column("reservation_event_id", Integer, nullable=False),
+    Column("room_bed_id", Integer, nullable=False),
+    Column("number_of_travelers", Integer, nullable=False),
+    Column("price_per_head_trip", DECIMAL(10, 2), nullable=False),
+    Column("total_price", Integer, nullable=False),
+    Column("created_at", TIMESTAMP, nullable=True, server_default=func.now()),
+    Column("event_plan_id", BigInteger, nullable=True),
+    Column("selected_beds_quantity", Integer, nullable=True),
+    Column("user_id", BigInteger, nullable=True),
+)
+
+Table(
+    "event_info",
+    metadata,
+    Column("event_id", BigInteger, primary_key=True, autoincrement=True),
+    Column("user_id", BigInteger, nullable=False, index=True),
+    Column("title", String(255), nullable=False),
+    Column("tour_category", String(100), nullable=True),
+    Column("tour_per_head_price", DECIMAL(10, 2), nullable=True),
+    Column("tour_capacity", Integer, nullable=True),
+    Column("description", Text, nullable=True),
+    Column("booking_per", String(50), nullable=True),
+    Column("destination", String(255), nullable=True),
+    Column("number_of_nodes", Integer, nullable=True),
+    Column("itinerary_info", Text, nullable=True),
+    Column("images", Text, nullable=True),
+    Column("videos", Text, nullable=True),
+    Column("status", String(50), nullable=True),
+    Column("client_id", BigInteger, nullable=True),
+    Column("created_at", TIMESTAMP, nullable=True, server_default=func.current_timestamp()),
+    Column("updated_at", TIMESTAMP, nullable=True, server_default=func.current_timestamp()),
+    Column("instruction_for_trip", Text, nullable=True),
+    Column("display_sequence", DECIMAL(10, 2), nullable=True),
+    Column("tour_duration", Integer, nullable=True),
+)
+
+Table(
+    "itinerary_read_models",
+    metadata,
+    Column("read_model_id", Integer, primary_key=True, autoincrement=True),
+    Column("itinerary_id", Integer, nullable=False, index=True),
+    Column("view", String(100), nullable=False, unique=True),
+    Column("payload", JSON, nullable=False),
+    Column("built_at", DateTime, nullable=False),
+)
+
+Table(
+    "itinerary_versions",
+    metadata,
+    Column("itinerary_id", Integer, primary_key=True, autoincrement=False),
+    Column("version", Integer, nullable=False),
+)
+
+Table(
+    "locations",
+    metadata,
+    Column("location_id", Integer, primary_key=True, autoincrement=True),
+    Column("place_id", String(255), nullable=True),
+    Column("name", String(255), nullable=True),
+    Column("address", Text, nullable=True),
+    Column("latitude", Double, nullable=True),
+    Column("longitude", Double, nullable=True),
+)
+
+Table(
+    "master_event_categories",
+    metadata,
+    Column("category_id", BigInteger, primary_key=True, autoincrement=True),
+    Column("name", String(100), nullable=False, unique=True),
+    Column("description", Text, nullable=True),
+)
+
+Table(
+    "place_details_cache",
+    metadata,
+    Column("cache_id", Integer, primary_key=True, autoincrement=True),
+    Column("place_id", String(255), nullable=False),
+    Column("field_mask", String(255), nullable=False),
+    Column("payload", JSON, nullable=False),
+    Column("fetched_at", DateTime, nullable=False),
+    UniqueConstraint("place_id", "field_mask", name="uq_place_details_field_mask"),
+)
+
+Table(
+    "places",
+    metadata,
+    Column("p_id", Integer, primary_key=True, autoincrement=True),
+    Column("place_id", String(255), nullable=False),
+    Column("name", String(255), nullable=True),
+    Column("address", Text, nullable=True),
+    Column("latitude", Double, nullable=True),
+    Column("longitude", Double, nullable=True),
+    Column("rating", Float, nullable=True),
+    Column("photo_url", Text, nullable=True),
+    Column("cost", Float, nullable=True),
+)
+
+Table(
+    "reservation_event",
+    metadata,
+    Column("reservation_event_id", Integer, primary_key=True, autoincrement=True),
+    Column("event_id", BigInteger, nullable=False),
+    Column("total_travelers", Integer, nullable=True),
+    Column("total_price", Integer, nullable=True),
+    Column("payment_status", String(50), nullable=True),
+    Column("advance_paid", Integer, nullable=True),
+    Column("booking_status", String(50), nullable=True),
+    Column("special_requests", Text, nullable=True),
+    Column("booking_date", TIMESTAMP, nullable=True, server_default=func.now()),
+    Column("payment_reference", String(100), nullable=True),
+    Column("invoice_url", String(255), nullable=True),
+    Column("created_at", TIMESTAMP, nullable=True, server_default=func.now()),
+    Column("updated_at", TIMESTAMP, nullable=True, server_default=func.now()),
+    Column("user_id", BigInteger, nullable=True),
+    Column("event_plan_id", BigInteger, nullable=True),
+    Column("payment_id", String, nullable=True),
+)
+
+Table(
+    "role",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("role", String(50), nullable=False, unique=True),
+)
+
+Table(
+    "traveller_info",
+    metadata,
+    Column("traveller_id", Integer, primary_key=True, autoincrement=True),
+    Column("reservation_event_id", Integer, nullable=False),
+    Column("full_name", String(255), nullable=False),
+    Column("id_proof", String(255), nullable=True),
+    Column("medical_needs", Text, nullable=True),
+    Column("meal_preference", String(100), nullable=True),
+    Column("emergency_contact", String(20), nullable=True),
+    Column("created_at", TIMESTAMP, nullable=True, server_default=func.now()),
+    Column("user_id", BigInteger, nullable=True),
+    Column("event_plan_id", BigInteger, nullable=True),
+)
+
+Table(
+    "connection_request",
+    metadata,
+    Column("request_id", Integer, primary_key=True, autoincrement=True, index=True),
+    Column("name", String(255), nullable=True),
+    Column("contact_no", String(20), nullable=True),
+    Column("email", String(100), nullable=True),
+    Column("address", Text, nullable=True),
+    Column("event_id", BigInteger, ForeignKey("event_info.event_id"), nullable=False),
+)
+
+Table(
+    "event_in_category",
+    metadata,
+    Column("id", BigInteger, primary_key=True, autoincrement=True),
+    Column("event_id", BigInteger, ForeignKey("event_info.event_id"), nullable=False),
+    Column("category_id", BigInteger, ForeignKey("master_event_categories.category_id"), nullable=False),
+)
+
+Table(
+    "event_plan",
+    metadata,
+    Column("ep_id", BigInteger, primary_key=True, autoincrement=True),
+    Column("event_id", BigInteger, ForeignKey("event_info.event_id"), nullable=False),
+    Column("client_id", Text, nullable=True),
+    Column("booking_start_date", Date, nullable=True),
+    Column("booking_end_date", Date, nullable=True),
+    Column("tour_start_date", Date, nullable=True),
+    Column("tour_end_date", Date, nullable=True),
+    Column("status", String(50), nullable=True),
+    Column("created_by", BigInteger, nullable=True, index=True),
+    Column("created_at", TIMESTAMP, nullable=True, server_default=func.current_timestamp()),
+    Column("updated_at", TIMESTAMP, nullable=True, server_default=func.current_timestamp()),
+    Column("instruction_for_trip", Text, nullable=True),
+)
+
+Table(
+    "itinerary_info",
+    metadata,
+    Column("itinerary_id", BigInteger, primary_key=True, autoincrement=True),
+    Column("event_id", BigInteger, ForeignKey("event_info.event_id"), nullable=False),
+    Column("day_count", Integer, nullable=False),
+    Column("stop_name", String(255), nullable=False),
+    Column("eta", Time, nullable=True),
+    Column("description", Text, nullable=True),
+)
+
+Table(
+    "room_bed_pricing",
+    metadata,
+    Column("room_bed_id", BigInteger, primary_key=True, autoincrement=True),
+    Column("event_id", BigInteger, ForeignKey("event_info.event_id"), nullable=False),
+    Column("no_of_days", Integer, nullable=True),
+    Column("room_type", String(100), nullable=True),
+    Column("bed_count", Integer, nullable=True),
+    Column("price_per_head_per_day", Integer, nullable=True),
+    Column("price_per_head_trip", Integer, nullable=True),
+    Column("total_rooms", Integer, nullable=True),
+    Column("created_at", TIMESTAMP, nullable=True, server_default=func.current_timestamp()),
+    Column("updated_at", TIMESTAMP, nullable=True, server_default=func.current_timestamp()),
+    Column("remarks", Text, nullable=True),
+)
+
+Table(
+    "stop_setting",
+    metadata,
+    Column("stop_setting_id", BigInteger, primary_key=True, autoincrement=True),
+    Column("event_id", BigInteger, ForeignKey("event_info.event_id"), nullable=False),
+    Column("day_start_time", Time, nullable=True),
+    Column("hotel_duration", Integer, nullable=True),
+    Column("activity_duration", Integer, nullable=True),
+    Column("restaurant_duration", Integer, nullable=True),
+)
+
+Table(
+    "users",
+    metadata,
+    Column("user_id", BigInteger, primary_key=True, autoincrement=True),
+    Column("username", String(100), nullable=False, unique=True),
+    Column("email", String(100), nullable=False, unique=True),
+    Column("phone", String(20), nullable=True, unique=True),
+    Column("password_hash", String(255), nullable=False),
+    Column("role_id", Integer, ForeignKey("role.id"), nullable=False),
+    Column("created_at", TIMESTAMP, nullable=True, server_default=func.current_timestamp()),
+    Column("updated_at", TIMESTAMP, nullable=True, server_default=func.current_timestamp()),
+    Column("is_active", Integer, nullable=True),
+)
+
+Table(
+    "client_table",
+    metadata,
+    Column("client_id", BigInteger, primary_key=True, autoincrement=True),
+    Column("client_name", String(255), nullable=False),
+    Column("url", String(255), nullable=True, unique=True),
+    Column("user_id", BigInteger, ForeignKey("users.user_id"), nullable=False),
+    Column("client_logo", String(255), nullable=True),
+    Column("client_banner", String(255), nullable=True),
+    Column("approval_status", Enum("open", "pending", "approved", "rejected", "left"), nullable=True),
+    Column("created_at", TIMESTAMP, nullable=False, server_default=func.now()),
+    Column("updated_at", TIMESTAMP, nullable=False, server_default=func.now()),
+)
+
+Table(
+    "default_itinerary_timing",
+    metadata,
+    Column("setting_id", Integer, primary_key=True, index=True),
+    Column("user_id", Integer, ForeignKey("users.user_id", ondelete="CASCADE"), nullable=False, unique=True),
+    Column("day_start_time", Time, nullable=False),
+    Column("place_duration", Integer, nullable=False),
+    Column("hotel_daytime_duration", Integer, nullable=False),
+    Column("hotel_night_duration", Integer, nullable=False),
+    Column("activity_duration", Integer, nullable=False),
+    Column("restaurant_duration", Integer, nullable=False),
+    Column("created_at", DateTime(timezone=True), nullable=True, server_default=func.now()),
+    Column("updated_at", DateTime(timezone=True), nullable=True),
+)
+
+Table(
+    "itinerary",
+    metadata,
+    Column("itinerary_id", Integer, primary_key=True, index=True),
+    Column("user_id", BigInteger, ForeignKey("users.user_id", ondelete="NO ACTION"), nullable=True),
+    Column("title", String(255), nullable=True),
+    Column("location_id", Integer, ForeignKey("locations.location_id", ondelete="NO ACTION"), nullable=True),
+    Column("start_date", Date, nullable=True),
+    Column("end_date", Date, nullable=True),
+    Column("starting_point", Integer, ForeignKey("places.p_id", ondelete="NO ACTION"), nullable=True),
+    Column("created_at", TIMESTAMP, nullable=True, server_default=func.current_timestamp()),
+)
+
+Table(
+    "restaurants",
+    metadata,
+    Column("restaurant_id", Integer, primary_key=True, autoincrement=True),
+    Column("place_id", String(100), nullable=False),
+    Column("user_id", BigInteger, ForeignKey("users.user_id"), nullable=False),
+    Column("name", String(255), nullable=True),
+    Column("address", Text, nullable=True),
+    Column("latitude", Float, nullable=True),
+    Column("longitude", Float, nullable=True),
+    Column("rating", Float, nullable=True),
+    Column("photo_url", String(1000), nullable=True),
+    Column("cost", Float, nullable=True),
+)
+
+Table(
+    "to_request",
+    metadata,
+    Column("to_request_id", Integer, primary_key=True, autoincrement=True, index=True),
+    Column("user_id", BigInteger, ForeignKey("users.user_id"), nullable=False),
+    Column("approval_status", Enum("open", "pending", "approved", "rejected"), nullable=True),
+)
+
+Table(
+    "client_user_table",
+    metadata,
+    Column("client_user_id", BigInteger, primary_key=True, autoincrement=True),
+    Column("client_id", BigInteger, ForeignKey("client_table.client_id"), nullable=False),
+    Column("user_id", BigInteger, ForeignKey("users.user_id"), nullable=False),
+    Column("client_user_role", Enum("admin", "user", "customer"), nullable=False),
+    Column("approval_status", Enum("open", "pending", "approved", "rejected"), nullable=True),
+)
+
+Table(
+    "hotels",
+    metadata,
+    Column("hotel_id", BigInteger, primary_key=True, autoincrement=True),
+    Column("client_id", BigInteger, ForeignKey("client_table.client_id"), nullable=False),
+    Column("user_id", BigInteger, ForeignKey("users.user_id"), nullable=False),
+    Column("place_id", String(255), nullable=False),
+    Column("name", String(255), nullable=False),
+    Column("address", Text, nullable=True),
+    Column("food_type", Enum("Veg", "NonVeg", "Both", name="foodtype"), nullable=False),
+    Column("category", Enum("three", "four", "five", name="hotelcategory"), nullable=False),
+    Column("special_view_info", String(255), nullable=True),
+    Column("latitude", Float, nullable=True),
+    Column("longitude", Float, nullable=True),
+    Column("photo_url", String(1000), nullable=True),
+    Column("google_rating", Float, nullable=True),
+    Column("created_at", TIMESTAMP, nullable=True, server_default=func.now()),
+    Column("updated_at", TIMESTAMP, nullable=True, server_default=func.now()),
+    Column("is_active", Boolean, nullable=True),
+)
+
+Table(
+    "itinerary_days",
+    metadata,
+    Column("itinerary_day_id", Integer, primary_key=True, index=True),
+    Column("itinerary_id", Integer, ForeignKey("itinerary.itinerary_id", ondelete="NO ACTION"), nullable=True),
+    Column("day_number", Integer, nullable=True),
+    Column("date", Date, nullable=True),
+)
+
+Table(
+    "itinerary_share_code",
+    metadata,
+    Column("share_id", Integer, primary_key=True, index=True),
+    Column("itinerary_id", Integer, ForeignKey("itinerary.itinerary_id", ondelete="NO ACTION"), nullable=True),
+    Column("share_code", String(255), nullable=True),
+)
+
+Table(
+    "hotel_rooms",
+    metadata,
+    Column("id", BigInteger, primary_key=True, autoincrement=True),
+    Column("hotel_id", BigInteger, ForeignKey("hotels.hotel_id"), nullable=False),
+    Column("room_type", Enum("Single", "Double", "Triple", "Family", name="roomtype"), nullable=False),
+    Column("ac_count", Integer, nullable=False),
+    Column("non_ac_count", Integer, nullable=False),
+    Column("ac_rate_per_night", DECIMAL(10, 2), nullable=False),
+    Column("non_ac_rate_per_night", DECIMAL(10, 2), nullable=False),
+    Column("is_available", Boolean, nullable=True),
+    Column("created_at", TIMESTAMP, nullable=True, server_default=func.now()),
+    Column("updated_at", TIMESTAMP, nullable=True, server_default=func.now()),
+)
+
+Table(
+    "itinerary_items",
+    metadata,
+    Column("itinerary_item_id", Integer, primary_key=True, index=True),
+    Column("itinerary_day_id", Integer, ForeignKey("itinerary_days.itinerary_day_id", ondelete="NO ACTION"), nullable=True),
+    Column("time", Time, nullable=True),
+    Column("distance_from_previous_stop", Double, nullable=True),
+    Column("duration_from_previous_stop", Double, nullable=True),
+    Column("order_index", Integer, nullable=True),
+    Column("type", Enum("HOTEL", "RESTAURANT", "PLACE", "STARTING_POINT", name="itemtype"), nullable=False),
+    Column("hotel_id", BigInteger, ForeignKey("hotels.hotel_id"), nullable=True),
+    Column("restaurant_id", Integer, ForeignKey("restaurants.restaurant_id"), nullable=True),
+    Column("p_id", Integer, ForeignKey("places.place_id"), nullable=True),
+    Column("cost", Double, nullable=True),
+    Column("stay_duration", Integer, nullable=True),
+    Column("description", Text, nullable=True),
+)
+
+
+async def upgrade(conn: AsyncConnection) -> None:
+    await conn.run_sync(metadata.create_all)
@@ -0,0 +1,10 @@
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+DESCRIPTION = "flag itinerary legs that hold an offline travel estimate"
+
+
+async def upgrade(conn: AsyncConnection) -> None:
+    await conn.execute(text(
+        "ALTER TABLE itinerary_items ADD COLUMN estimated_from_previous_stop BOOLEAN NOT NULL DEFAULT 0"
+    ))
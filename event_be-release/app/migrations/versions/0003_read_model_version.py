@@ -0,0 +1,9 @@
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+DESCRIPTION = "stamp itinerary read-model views with the version they were built at"
+
+
+async def upgrade(conn: AsyncConnection) -> None:
+    # views stored without a version are never served again and get rebuilt on first read
+    await conn.execute(text("ALTER TABLE itinerary_read_models ADD COLUMN version INTEGER NULL"))
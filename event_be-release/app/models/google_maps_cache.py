@@ -0,0 +1,31 @@
+from datetime import datetime
+from sqlalchemy import JSON, Column, DateTime, Integer, String, UniqueConstraint
+from core.database import Base
+
+
+class DistanceMatrixCache(Base):
+    __tablename__ = "distance_matrix_cache"
+    __table_args__ = (
+        UniqueConstraint("origin_place_id", "destination_place_id", "mode", name="uq_distance_matrix_pair"),
+    )
+
+    cache_id = Column(Integer, primary_key=True, autoincrement=True)
+    origin_place_id = Column(String(255), nullable=False)
+    destination_place_id = Column(String(255), nullable=False)
+    mode = Column(String(20), nullable=False, default="driving")
+    distance = Column(Integer, nullable=False)      # metres
+    duration = Column(Integer, nullable=False)      # seconds
+    fetched_at = Column(DateTime, nullable=False, default=datetime.now)
+
+
+class PlaceDetailsCache(Base):
+    __tablename__ = "place_details_cache"
+    __table_args__ = (
+        UniqueConstraint("place_id", "field_mask", name="uq_place_details_field_mask"),
+    )
+
+    cache_id = Column(Integer, primary_key=True, autoincrement=True)
+    place_id = Column(String(255), nullable=False)
+    field_mask = Column(String(255), nullable=False)
+    payload = Column(JSON, nullable=False)
+    fetched_at = Column(DateTime, nullable=False, default=datetime.now)
@@ -1,6 +1,6 @@
 # app/models/itinerary.py
 
-from sqlalchemy import BigInteger, Column, DateTime, Double, Integer, String, Text, TIMESTAMP,ForeignKey,Date,Time,Enum
+from sqlalchemy import BigInteger, Boolean, Column, DateTime, Double, Integer, String, Text, TIMESTAMP,ForeignKey,Date,Time,Enum
 from sqlalchemy.sql import func
 from sqlalchemy.orm import Relationship
 from core.database import Base
@@ -57,6 +57,8 @@ class ItineraryItem(Base):
     time = Column(Time, nullable=True)
     distance_from_previous_stop = Column(Double, nullable=True)
     duration_from_previous_stop = Column(Double, nullable=True)
+    # True while the leg above holds an offline estimate; the next re-time fetches it again
+    estimated_from_previous_stop = Column(Boolean, nullable=False, default=False, server_default="0")
     order_index = Column(Integer, nullable=True)
     type = Column(Enum(ItemType), nullable=False)
     hotel_id = Column(BigInteger, ForeignKey("hotels.hotel_id"), nullable=True)
@@ -0,0 +1,21 @@
+from datetime import datetime
+from sqlalchemy import JSON, Column, DateTime, Integer, String
+from core.database import Base
+
+
+class ItineraryReadModel(Base):
+    __tablename__ = "itinerary_read_models"
+
+    read_model_id = Column(Integer, primary_key=True, autoincrement=True)
+    itinerary_id = Column(Integer, nullable=False, index=True)
+    view = Column(String(100), nullable=False, unique=True)     # e.g. "timeline:12", "day_summary:40"
+    payload = Column(JSON, nullable=False)
+    version = Column(Integer, nullable=True)                     # itinerary version the payload was built at
+    built_at = Column(DateTime, nullable=False, default=datetime.now)
+
+
+class ItineraryVersion(Base):
+    __tablename__ = "itinerary_versions"
+
+    itinerary_id = Column(Integer, primary_key=True, autoincrement=False)
+    version = Column(Integer, nullable=False, default=1)         # bumped by every itinerary edit
@@ -1,151 +1,160 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from models.booking import ReservationEvent, TravellerInfo, EventBookingRooms
 from schemas.booking import CreateReservationEvent, ReservationEventResponse, CreateTravellerInfo, TravellerInfoResponse, CreateEventBookingRooms, EventBookingRoomsResponse, AllBookingDetailsResponse
 from typing import List
 
-def get_all_reservation_events(db: Session, skip: int = 0):
-    reservation_events = db.query(ReservationEvent).offset(skip).all()
-    return reservation_events
+async def get_all_reservation_events(session: AsyncSession, skip: int = 0):
+    result = await session.execute(select(ReservationEvent).offset(skip))
+    return result.scalars().all()
 
-def get_reservation_event_by_id(db: Session, reservation_event_id: int):
-    reservation_event = db.query(ReservationEvent).filter(ReservationEvent.reservation_event_id == reservation_event_id).first()
-    return reservation_event
+async def get_reservation_event_by_id(session: AsyncSession, reservation_event_id: int):
+    result = await session.execute(select(ReservationEvent).where(ReservationEvent.reservation_event_id == reservation_event_id))
+    return result.scalars().first()
 
-def get_reservation_event_by_user_id(db: Session, user_id: int):
-    reservation_event = db.query(ReservationEvent).filter(ReservationEvent.user_id == user_id).all()
-    return reservation_event
+async def get_reservation_event_by_user_id(session: AsyncSession, user_id: int):
+    result = await session.execute(select(ReservationEvent).where(ReservationEvent.user_id == user_id))
+    return result.scalars().all()
 
-def get_reservation_event_by_event_id(db: Session, event_id: int):
-    reservation_event = db.query(ReservationEvent).filter(ReservationEvent.event_id == event_id).all()
-    return reservation_event
+async def get_reservation_event_by_event_id(session: AsyncSession, event_id: int):
+    result = await session.execute(select(ReservationEvent).where(ReservationEvent.event_id == event_id))
+    return result.scalars().all()
 
-def get_reservation_event_by_event_plan_id(db: Session, event_plan_id: int):
-    reservation_event = db.query(ReservationEvent).filter(ReservationEvent.event_plan_id == event_plan_id).all()
-    return reservation_event
+async def get_reservation_event_by_event_plan_id(session: AsyncSession, event_plan_id: int):
+    result = await session.execute(select(ReservationEvent).where(ReservationEvent.event_plan_id == event_plan_id))
+    return result.scalars().all()
 
-def create_reservation_event(db: Session, reservation_event: CreateReservationEvent):
+async def create_reservation_event(session: AsyncSession, reservation_event: CreateReservationEvent):
     db_reservation_event = ReservationEvent(**reservation_event.dict())
-    db.add(db_reservation_event)
-    db.commit()
-    db.refresh(db_reservation_event)
+    session.add(db_reservation_event)
+    await session.commit()
+    await session.refresh(db_reservation_event)
     return db_reservation_event
 
-def update_reservation_event(db: Session, reservation_event_id: int, reservation_event: CreateReservationEvent):
-    db_reservation_event = db.query(ReservationEvent).filter(ReservationEvent.reservation_event_id == reservation_event_id).first()
+async def update_reservation_event(session: AsyncSession, reservation_event_id: int, reservation_event: CreateReservationEvent):
+    db_reservation_event = await get_reservation_event_by_id(session, reservation_event_id)
     if not db_reservation_event:
         return None
     for key, value in reservation_event.dict().items():
         setattr(db_reservation_event, key, value)
-    db.commit()
-    db.refresh(db_reservation_event)
+    await session.commit()
+    await session.refresh(db_reservation_event)
     return db_reservation_event
 
-def delete_reservation_event(db: Session, reservation_event_id: int):
-    db_reservation_event = db.query(ReservationEvent).filter(ReservationEvent.reservation_event_id == reservation_event_id).first()
+async def delete_reservation_event(session: AsyncSession, reservation_event_id: int):
+    db_reservation_event = await get_reservation_event_by_id(session, reservation_event_id)
     if not db_reservation_event:
         return None
-    db.delete(db_reservation_event)
-    db.commit()
+    await session.delete(db_reservation_event)
+    await session.commit()
     return db_reservation_event
 
-def get_all_traveller_info(db: Session, skip: int = 0):
-    traveller_info = db.query(TravellerInfo).offset(skip).all()
-    return traveller_info
+async def get_all_traveller_info(session: AsyncSession, skip: int = 0):
+    result = await session.execute(select(TravellerInfo).offset(skip))
+    return result.scalars().all()
 
-def get_traveller_info_by_id(db: Session, traveller_id: int):
-    traveller_info = db.query(TravellerInfo).filter(TravellerInfo.traveller_id == traveller_id).first()
-    return traveller_info
+async def get_traveller_info_by_id(session: AsyncSession, traveller_id: int):
+    result = await session.execute(select(TravellerInfo).where(TravellerInfo.traveller_id == traveller_id))
+    return result.scalars().first()
 
-def get_traveller_info_by_reservation_event_id(db: Session, reservation_event_id: int):
-    traveller_info = db.query(TravellerInfo).filter(TravellerInfo.reservation_event_id == reservation_event_id).all()
-    return traveller_info
+async def get_traveller_info_by_reservation_event_id(session: AsyncSession, reservation_event_id: int):
+    result = await session.execute(select(TravellerInfo).where(TravellerInfo.reservation_event_id == reservation_event_id))
+    return result.scalars().all()
 
-def get_traveller_info_by_user_id(db: Session, user_id: int):
-    traveller_info = db.query(TravellerInfo).filter(TravellerInfo.user_id == user_id).all()
-    return traveller_info
+async def get_traveller_info_by_reservation_event_ids(session: AsyncSession, reservation_event_ids: List[int]):
+    result = await session.execute(select(TravellerInfo).where(TravellerInfo.reservation_event_id.in_(reservation_event_ids)))
+    return result.scalars().all()
 
-def get_traveller_info_by_event_plan_id(db: Session, event_plan_id: int):
-    traveller_info = db.query(TravellerInfo).filter(TravellerInfo.event_plan_id == event_plan_id).all()
-    return traveller_info
+async def get_traveller_info_by_user_id(session: AsyncSession, user_id: int):
+    result = await session.execute(select(TravellerInfo).where(TravellerInfo.user_id == user_id))
+    return result.scalars().all()
 
-def create_traveller_info(db: Session, traveller_info_list: list[CreateTravellerInfo]):
+async def get_traveller_info_by_event_plan_id(session: AsyncSession, event_plan_id: int):
+    result = await session.execute(select(TravellerInfo).where(TravellerInfo.event_plan_id == event_plan_id))
+    return result.scalars().all()
+
+async def create_traveller_info(session: AsyncSession, traveller_info_list: list[CreateTravellerInfo]):
     db_travellers = [TravellerInfo(**t.dict()) for t in traveller_info_list]
-    db.add_all(db_travellers)
-    db.commit()
+    session.add_all(db_travellers)
+    await session.commit()
     for t in db_travellers:
-        db.refresh(t)
+        await session.refresh(t)
     return db_travellers
 
-def update_traveller_info(db: Session, traveller_id: int, traveller_info: CreateTravellerInfo):
-    db_traveller_info = db.query(TravellerInfo).filter(TravellerInfo.traveller_id == traveller_id).first()
+async def update_traveller_info(session: AsyncSession, traveller_id: int, traveller_info: CreateTravellerInfo):
+    db_traveller_info = await get_traveller_info_by_id(session, traveller_id)
     if not db_traveller_info:
         return None
     for key, value in traveller_info.dict().items():
         setattr(db_traveller_info, key, value)
-    db.commit()
-    db.refresh(db_traveller_info)
+    await session.commit()
+    await session.refresh(db_traveller_info)
     return db_traveller_info
 
-def delete_traveller_info(db: Session, traveller_id: int):
-    db_traveller_info = db.query(TravellerInfo).filter(TravellerInfo.traveller_id == traveller_id).first()
+async def delete_traveller_info(session: AsyncSession, traveller_id: int):
+    db_traveller_info = await get_traveller_info_by_id(session, traveller_id)
     if not db_traveller_info:
         return None
-    db.delete(db_traveller_info)
-    db.commit()
+    await session.delete(db_traveller_info)
+    await session.commit()
     return db_traveller_info
 
-def get_all_event_booking_rooms(db: Session, skip: int = 0):
-    event_booking_rooms = db.query(EventBookingRooms).offset(skip).all()
-    return event_booking_rooms
+async def get_all_event_booking_rooms(session: AsyncSession, skip: int = 0):
+    result = await session.execute(select(EventBookingRooms).offset(skip))
+    return result.scalars().all()
+
+async def get_event_booking_rooms_by_id(session: AsyncSession, booking_room_id: int):
+    result = await session.execute(select(EventBookingRooms).where(EventBookingRooms.booking_room_id == booking_room_id))
+    return result.scalars().first()
 
-def get_event_booking_rooms_by_id(db: Session, booking_room_id: int):
-    event_booking_rooms = db.query(EventBookingRooms).filter(EventBookingRooms.booking_room_id == booking_room_id).first()
-    return event_booking_rooms
+async def get_event_booking_rooms_by_reservation_event_id(session: AsyncSession, reservation_event_id: int):
+    result = await session.execute(select(EventBookingRooms).where(EventBookingRooms.reservation_event_id == reservation_event_id))
+    return result.scalars().all()
 
-def get_event_booking_rooms_by_reservation_event_id(db: Session, reservation_event_id: int):
-    event_booking_rooms = db.query(EventBookingRooms).filter(EventBookingRooms.reservation_event_id == reservation_event_id).all()
-    return event_booking_rooms
+async def get_event_booking_rooms_by_reservation_event_ids(session: AsyncSession, reservation_event_ids: List[int]):
+    result = await session.execute(select(EventBookingRooms).where(EventBookingRooms.reservation_event_id.in_(reservation_event_ids)))
+    return result.scalars().all()
 
-def get_event_booking_rooms_by_user_id(db: Session, user_id: int):
-    event_booking_rooms = db.query(EventBookingRooms).filter(EventBookingRooms.user_id == user_id).all()
-    return event_booking_rooms
+async def get_event_booking_rooms_by_user_id(session: AsyncSession, user_id: int):
+    result = await session.execute(select(EventBookingRooms).where(EventBookingRooms.user_id == user_id))
+    return result.scalars().all()
 
-def get_event_booking_rooms_by_event_plan_id(db: Session, event_plan_id: int):
-    event_booking_rooms = db.query(EventBookingRooms).filter(EventBookingRooms.event_plan_id == event_plan_id).all()
-    return event_booking_rooms
+async def get_event_booking_rooms_by_event_plan_id(session: AsyncSession, event_plan_id: int):
+    result = await session.execute(select(EventBookingRooms).where(EventBookingRooms.event_plan_id == event_plan_id))
+    return result.scalars().all()
 
-def create_event_booking_rooms(db: Session, event_booking_rooms_list: list[CreateEventBookingRooms]):
+async def create_event_booking_rooms(session: AsyncSession, event_booking_rooms_list: list[CreateEventBookingRooms]):
     db_rooms = [EventBookingRooms(**room.dict()) for room in event_booking_rooms_list]
-    db.add_all(db_rooms)
-    db.commit()
+    session.add_all(db_rooms)
+    await session.commit()
     for room in db_rooms:
-        db.refresh(room)
+        await session.refresh(room)
     return db_rooms
 
-def update_event_booking_rooms(db: Session, booking_room_id: int, event_booking_rooms: CreateEventBookingRooms):
-    db_event_booking_rooms = db.query(EventBookingRooms).filter(EventBookingRooms.booking_room_id == booking_room_id).first()
+async def update_event_booking_rooms(session: AsyncSession, booking_room_id: int, event_booking_rooms: CreateEventBookingRooms):
+    db_event_booking_rooms = await get_event_booking_rooms_by_id(session, booking_room_id)
     if not db_event_booking_rooms:
         return None
     for key, value in event_booking_rooms.dict().items():
         setattr(db_event_booking_rooms, key, value)
-    db.commit()
-    db.refresh(db_event_booking_rooms)
+    await session.commit()
+    await session.refresh(db_event_booking_rooms)
     return db_event_booking_rooms
 
-def delete_event_booking_rooms(db: Session, booking_room_id: int):
-    db_event_booking_rooms = db.query(EventBookingRooms).filter(EventBookingRooms.booking_room_id == booking_room_id).first()
+async def delete_event_booking_rooms(session: AsyncSession, booking_room_id: int):
+    db_event_booking_rooms = await get_event_booking_rooms_by_id(session, booking_room_id)
     if not db_event_booking_rooms:
         return None
-    db.delete(db_event_booking_rooms)
-    db.commit()
+    await session.delete(db_event_booking_rooms)
+    await session.commit()
     return db_event_booking_rooms
 
-def get_all_booking_details(db: Session, reservation_event_id: int):
-    reservation_event = db.query(ReservationEvent).filter(ReservationEvent.reservation_event_id == reservation_event_id).first()
+async def get_all_booking_details(session: AsyncSession, reservation_event_id: int):
+    reservation_event = await get_reservation_event_by_id(session, reservation_event_id)
     if not reservation_event:
         return None
-    traveller_info = db.query(TravellerInfo).filter(TravellerInfo.reservation_event_id == reservation_event_id).all()
-    event_booking_rooms = db.query(EventBookingRooms).filter(EventBookingRooms.reservation_event_id == reservation_event_id).all()
+    traveller_info = await get_traveller_info_by_reservation_event_id(session, reservation_event_id)
+    event_booking_rooms = await get_event_booking_rooms_by_reservation_event_id(session, reservation_event_id)
     
     booking_details = AllBookingDetailsResponse(
         reservation_event_id=reservation_event.reservation_event_id,
@@ -167,4 +176,4 @@ def get_all_booking_details(db: Session, reservation_event_id: int):
         event_booking_rooms=[EventBookingRoomsResponse(**room.__dict__) for room in event_booking_rooms]
     )
     
-    return booking_details
\ No newline at end of file
+    return booking_details
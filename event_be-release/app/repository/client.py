@@ -1,69 +1,87 @@
 # repository/client.py
 
 from fastapi import HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from models.client import Client, ClientUser
 from schemas.client import ClientCreate
 
-def get_all_clients(db: Session, skip: int = 0):
-    clients = db.query(Client).offset(skip).all()
+async def get_all_clients(session: AsyncSession, skip: int = 0):
+    result = await session.execute(select(Client).offset(skip))
+    clients = result.scalars().all()
     if not clients:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No clients found")
     return clients
 
-def get_all_clients_user(db: Session):
-    clients = db.query(ClientUser).all()
+async def get_all_clients_user(session: AsyncSession):
+    result = await session.execute(select(ClientUser))
+    clients = result.scalars().all()
     if not clients:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No clients found")
     return clients
 
-def get_client_by_id(db: Session, client_id: int):
-    client = db.query(Client).filter(Client.client_id == client_id).first()
+async def get_client_by_id(session: AsyncSession, client_id: int):
+    result = await session.execute(select(Client).where(Client.client_id == client_id))
+    client = result.scalars().first()
     if not client:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Client not found")
     return client
 
-def get_client_user_by_id(db: Session, client_user_id: int):
-    client_user = db.query(ClientUser).filter(ClientUser.client_user_id == client_user_id).first()
+async def get_client_user_by_id(session: AsyncSession, client_user_id: int):
+    result = await session.execute(select(ClientUser).where(ClientUser.client_user_id == client_user_id))
+    client_user = result.scalars().first()
     if not client_user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Client user not found")
     return client_user
 
-def get_client_by_user_id(db: Session, user_id: int):
-    client = db.query(Client).filter(Client.user_id == user_id).first()
+async def get_client_by_user_id(session: AsyncSession, user_id: int):
+    result = await session.execute(select(Client).where(Client.user_id == user_id))
+    client = result.scalars().first()
     if not client:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Client not found")
     return client
 
-def get_client_user_by_user_id(db: Session, user_id: int):
-    client_user = db.query(ClientUser).filter(ClientUser.user_id == user_id).all()
+async def get_client_user_by_user_id(session: AsyncSession, user_id: int):
+    result = await session.execute(select(ClientUser).where(ClientUser.user_id == user_id))
+    client_user = result.scalars().all()
     if not client_user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Client user not found")
     return client_user
 
-def get_client_user_by_user_id_and_approval(db: Session, user_id: int, approval_status: str):
-    client_user = db.query(ClientUser).filter(
+async def get_client_user_by_user_id_and_approval(session: AsyncSession, user_id: int, approval_status: str):
+    result = await session.execute(select(ClientUser).where(
         ClientUser.user_id == user_id,
         ClientUser.approval_status == approval_status,
         ClientUser.client_user_role.in_(["user", "admin"])
-    ).all()
+    ))
+    client_user = result.scalars().all()
     if not client_user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Client user not found")
     return client_user
 
-def get_client_user_by_client_id_and_approval(db: Session, client_id: int, approval_status: str):
-    client_user = db.query(ClientUser).filter(ClientUser.client_id == client_id, ClientUser.approval_status == approval_status).all()
+async def get_client_user_by_client_id_and_approval(session: AsyncSession, client_id: int, approval_status: str):
+    result = await session.execute(select(ClientUser).where(ClientUser.client_id == client_id, ClientUser.approval_status == approval_status))
+    client_user = result.scalars().all()
     if not client_user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Client user not found")
     return client_user
 
-def get_client_user_by_client_id(db: Session, client_id: int):
-    client_user = db.query(ClientUser).filter(ClientUser.client_id == client_id).all()
+async def get_client_user_by_client_id(session: AsyncSession, client_id: int):
+    result = await session.execute(select(ClientUser).where(ClientUser.client_id == client_id))
+    client_user = result.scalars().all()
     if not client_user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Client user not found")
     return client_user
 
-def create_client(db: Session, request_data: ClientCreate):
+async def get_admin_client_user(session: AsyncSession, client_id: int, user_id: int):
+    result = await session.execute(select(ClientUser).where(
+        ClientUser.client_id == client_id,
+        ClientUser.user_id == user_id,
+        ClientUser.client_user_role == "admin"
+    ))
+    return result.scalars().first()
+
+async def create_client(session: AsyncSession, request_data: ClientCreate):
     try:
         new_request = Client(
             url=request_data.url,
@@ -73,16 +91,16 @@ def create_client(db: Session, request_data: ClientCreate):
             approval_status=request_data.approval_status,
             client_name=request_data.client_name
         )
-        db.add(new_request)
-        db.commit()
-        db.refresh(new_request)
+        session.add(new_request)
+        await session.commit()
+        await session.refresh(new_request)
         return new_request
     except Exception as e:
-        db.rollback()
+        await session.rollback()
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
 
-def create_client_user(db: Session, client_id: int, user_id: int, role: str, approval_status: str):
+async def create_client_user(session: AsyncSession, client_id: int, user_id: int, role: str, approval_status: str):
     try:
         new_client_user = ClientUser(
             client_id=client_id,
@@ -90,63 +108,65 @@ def create_client_user(db: Session, client_id: int, user_id: int, role: str, app
             client_user_role=role,
             approval_status=approval_status
         )
-        db.add(new_client_user)
-        db.commit()
-        db.refresh(new_client_user)
+        session.add(new_client_user)
+        await session.commit()
+        await session.refresh(new_client_user)
         return new_client_user
     except Exception as e:
-        db.rollback()
+        await session.rollback()
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
-def update_client_status(db: Session, client: Client, status: str):
+async def update_client_status(session: AsyncSession, client: Client, status: str):
     client.approval_status = status
-    db.commit()
-    db.refresh(client)
+    await session.commit()
+    await session.refresh(client)
 
 
-def update_client_user_status(db: Session, client_user: ClientUser, status: str):
+async def update_client_user_status(session: AsyncSession, client_user: ClientUser, status: str):
     client_user.approval_status = status
-    db.commit()
-    db.refresh(client_user)
+    await session.commit()
+    await session.refresh(client_user)
     
-def has_approved_client_user(db: Session, user_id: int) -> bool:
-    return db.query(ClientUser).filter(
+async def has_approved_client_user(session: AsyncSession, user_id: int) -> bool:
+    result = await session.execute(select(ClientUser.client_user_id).where(
         ClientUser.user_id == user_id,
         ClientUser.approval_status == 'approved'
-    ).first() is not None
+    ).limit(1))
+    return result.first() is not None
 
-def reject_other_client_users(db: Session, user_id: int, exclude_id: int = None):
-    query = db.query(ClientUser).filter(
+async def reject_other_client_users(session: AsyncSession, user_id: int, exclude_id: int = None):
+    stmt = update(ClientUser).where(
         ClientUser.user_id == user_id,
         ClientUser.approval_status.in_(['open', 'pending'])
     )
     if exclude_id:
-        query = query.filter(ClientUser.client_user_id != exclude_id)
-    query.update({"approval_status": "rejected"})
-    db.commit()
+        stmt = stmt.where(ClientUser.client_user_id != exclude_id)
+    await session.execute(stmt.values(approval_status="rejected"))
+    await session.commit()
 
-def delete_client(db: Session, client_id: int):
-    client = db.query(Client).filter(Client.client_id == client_id).first()
+async def delete_client(session: AsyncSession, client_id: int):
+    client = await session.get(Client, client_id)
     if not client:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Client not found")
-    db.delete(client)
-    db.commit()
+    await session.delete(client)
+    await session.commit()
     return {"message": "Client deleted successfully"}
 
-def delete_client_user(db: Session, client_user_id: int):
-    client_user = db.query(ClientUser).filter(ClientUser.client_user_id == client_user_id).first()
+async def delete_client_user(session: AsyncSession, client_user_id: int):
+    client_user = await session.get(ClientUser, client_user_id)
     if not client_user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Client user not found")
-    db.delete(client_user)
-    db.commit()
+    await session.delete(client_user)
+    await session.commit()
     return {"message": "Client user deleted successfully"}
 
-def get_client_by_url(db: Session, url: str):
-    client = db.query(Client).filter(Client.url == url).first()
+async def get_client_by_url(session: AsyncSession, url: str):
+    result = await session.execute(select(Client).where(Client.url == url))
+    client = result.scalars().first()
     if not client:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Client not found")
     return client
 
-def get_client_user_by_client_id_and_user_id(db: Session, client_id: int, user_id: int):
-    client_user = db.query(ClientUser).filter(ClientUser.client_id == client_id, ClientUser.user_id == user_id).first()
-    return client_user
\ No newline at end of file
+async def get_client_user_by_client_id_and_user_id(session: AsyncSession, client_id: int, user_id: int):
+    result = await session.execute(select(ClientUser).where(ClientUser.client_id == client_id, ClientUser.user_id == user_id))
+    return result.scalars().first()
@@ -1,14 +1,26 @@
-from sqlalchemy.orm import Session
-from models.events import RoomBedPricing
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from models.events import EventInCategory, EventInfo, RoomBedPricing
 
-def get_all_room_bed_pricing(db: Session):
-    room_bed_pricing = db.query(RoomBedPricing).all()
-    return room_bed_pricing
+def event_relations():
+    """Loader options for every relationship EventSchema reads"""
+    return (
+        selectinload(EventInfo.itineraries),
+        selectinload(EventInfo.event_plans),
+        selectinload(EventInfo.stop_settings),
+        selectinload(EventInfo.room_bed_pricings),
+        selectinload(EventInfo.event_categories).selectinload(EventInCategory.category),
+    )
 
-def get_room_bed_pricing_by_id(db: Session, room_bed_pricing_id: int):
-    room_bed_pricing = db.query(RoomBedPricing).filter(RoomBedPricing.room_bed_pricing_id == room_bed_pricing_id).first()
-    return room_bed_pricing
+async def get_all_room_bed_pricing(session: AsyncSession):
+    result = await session.execute(select(RoomBedPricing))
+    return result.scalars().all()
 
-def get_room_bed_pricing_by_event_id(db: Session, event_id: int):
-    room_bed_pricing = db.query(RoomBedPricing).filter(RoomBedPricing.event_id == event_id).all()
-    return room_bed_pricing
\ No newline at end of file
+async def get_room_bed_pricing_by_id(session: AsyncSession, room_bed_pricing_id: int):
+    result = await session.execute(select(RoomBedPricing).where(RoomBedPricing.room_bed_pricing_id == room_bed_pricing_id))
+    return result.scalars().first()
+
+async def get_room_bed_pricing_by_event_id(session: AsyncSession, event_id: int):
+    result = await session.execute(select(RoomBedPricing).where(RoomBedPricing.event_id == event_id))
+    return result.scalars().all()
@@ -0,0 +1,113 @@
+from datetime import datetime
+from typing import List, Optional, Tuple
+from sqlalchemy import select, tuple_
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from models.google_maps_cache import DistanceMatrixCache, PlaceDetailsCache
+
+
+async def get_distances(
+    session: AsyncSession,
+    pairs: List[Tuple[str, str]],
+    mode: str,
+    fresh_after: datetime
+) -> List[DistanceMatrixCache]:
+    """Get cached distance rows for many (origin, destination) pairs fetched after `fresh_after`"""
+    if not pairs:
+        return []
+    result = await session.execute(
+        select(DistanceMatrixCache).where(
+            tuple_(DistanceMatrixCache.origin_place_id, DistanceMatrixCache.destination_place_id).in_(pairs),
+            DistanceMatrixCache.mode == mode,
+            DistanceMatrixCache.fetched_at > fresh_after
+        )
+    )
+    return list(result.scalars().all())
+
+
+async def save_distances(
+    session: AsyncSession,
+    distances: List[Tuple[str, str, int, int]],
+    mode: str
+) -> None:
+    """Insert or refresh cached (origin, destination, distance, duration) rows in one upsert.
+
+    Pairs another worker cached first are refreshed rather than failing the whole batch.
+    """
+    if not distances:
+        return
+    now = datetime.now()
+    rows = [
+        {
+            "origin_place_id": origin,
+            "destination_place_id": destination,
+            "mode": mode,
+            "distance": distance,
+            "duration": duration,
+            "fetched_at": now,
+        }
+        for origin, destination, distance, duration in distances
+    ]
+    refreshed = ("distance", "duration", "fetched_at")
+    if session.bind.dialect.name == "mysql":
+        stmt = mysql_insert(DistanceMatrixCache).values(rows)
+        stmt = stmt.on_duplicate_key_update({column: stmt.inserted[column] for column in refreshed})
+    else:
+        stmt = sqlite_insert(DistanceMatrixCache).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["origin_place_id", "destination_place_id", "mode"],
+            set_={column: stmt.excluded[column] for column in refreshed}
+        )
+    await session.execute(stmt)
+    await session.commit()
+
+
+async def get_place_details(
+    session: AsyncSession,
+    place_id: str,
+    field_mask: str,
+    fresh_after: datetime
+) -> Optional[PlaceDetailsCache]:
+    """Get cached place details for a place_id and field mask fetched after `fresh_after`"""
+    result = await session.execute(
+        select(PlaceDetailsCache).where(
+            PlaceDetailsCache.place_id == place_id,
+            PlaceDetailsCache.field_mask == field_mask,
+            PlaceDetailsCache.fetched_at > fresh_after
+        )
+    )
+    return result.scalar_one_or_none()
+
+
+async def save_place_details(
+    session: AsyncSession,
+    place_id: str,
+    field_mask: str,
+    payload: dict
+) -> None:
+    """Insert or refresh cached place details"""
+    result = await session.execute(
+        select(PlaceDetailsCache).where(
+            PlaceDetailsCache.place_id == place_id,
+            PlaceDetailsCache.field_mask == field_mask
+        )
+    )
+    row = result.scalar_one_or_none()
+
+    if row:
+        row.payload = payload
+        row.fetched_at = datetime.now()
+    else:
+        session.add(PlaceDetailsCache(
+            place_id=place_id,
+            field_mask=field_mask,
+            payload=payload,
+            fetched_at=datetime.now()
+        ))
+
+    try:
+        await session.commit()
+    except IntegrityError:
+        await session.rollback()
@@ -0,0 +1,119 @@
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+from sqlalchemy import delete, insert, literal, or_, select, union, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from models.itinerary_modal import Itinerary, ItineraryDays, ItineraryItem
+from models.itinerary_read_model import ItineraryReadModel, ItineraryVersion
+
+
+async def get_view(session: AsyncSession, view: str) -> Optional[Tuple[Any, Optional[int]]]:
+    """Stored (payload, version it was built at) of a read-model view, or None if it has to be built"""
+    result = await session.execute(
+        select(ItineraryReadModel.payload, ItineraryReadModel.version).where(ItineraryReadModel.view == view)
+    )
+    row = result.one_or_none()
+    return (row.payload, row.version) if row is not None else None
+
+
+async def save_view(session: AsyncSession, itinerary_id: int, view: str, payload: Any, version: int) -> None:
+    """Store a view built at `version`, replacing one built at an older version, in its own commit"""
+    await session.execute(
+        delete(ItineraryReadModel)
+        .where(
+            ItineraryReadModel.view == view,
+            or_(ItineraryReadModel.version.is_(None), ItineraryReadModel.version < version)
+        )
+        .execution_options(synchronize_session=False)
+    )
+    session.add(ItineraryReadModel(
+        itinerary_id=itinerary_id,
+        view=view,
+        payload=payload,
+        version=version,
+        built_at=datetime.now()
+    ))
+    try:
+        await session.commit()
+    except IntegrityError:
+        # another request stored this view first, at the same or a newer version
+        await session.rollback()
+
+
+async def invalidate_itinerary(session: AsyncSession, itinerary_id: int) -> None:
+    """Drop every view of an itinerary; runs in the caller's transaction so it commits with the edit"""
+    await session.execute(
+        delete(ItineraryReadModel)
+        .where(ItineraryReadModel.itinerary_id == itinerary_id)
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def itineraries_using(session: AsyncSession, table: str, resource_id: int) -> List[int]:
+    """Itineraries whose views embed the hotel, restaurant or place row `resource_id`"""
+    column = {
+        "hotel": ItineraryItem.hotel_id,
+        "restaurant": ItineraryItem.restaurant_id,
+        "place": ItineraryItem.p_id,
+    }[table]
+    stmt = (
+        select(ItineraryDays.itinerary_id)
+        .join(ItineraryItem, ItineraryItem.itinerary_day_id == ItineraryDays.itinerary_day_id)
+        .where(column == resource_id)
+    )
+    if table == "place":
+        stmt = union(stmt, select(Itinerary.itinerary_id).where(Itinerary.starting_point == resource_id))
+    result = await session.execute(stmt)
+    return sorted({itinerary_id for itinerary_id in result.scalars() if itinerary_id is not None})
+
+
+def add_version(session: AsyncSession, itinerary_id: int) -> None:
+    """Start the version counter of a new itinerary in the caller's transaction"""
+    session.add(ItineraryVersion(itinerary_id=itinerary_id, version=1))
+
+
+async def bump_version(session: AsyncSession, itinerary_id: int) -> None:
+    """Increment the version of an itinerary in the caller's transaction"""
+    await session.execute(
+        update(ItineraryVersion)
+        .where(ItineraryVersion.itinerary_id == itinerary_id)
+        .values(version=ItineraryVersion.version + 1)
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def get_version(session: AsyncSession, itinerary_id: int) -> Optional[int]:
+    """Current version of an itinerary, starting its counter if it predates versioning.
+
+    None if the itinerary doesn't exist.
+    """
+    stmt = select(ItineraryVersion.version).where(ItineraryVersion.itinerary_id == itinerary_id)
+    version = (await session.execute(stmt)).scalar_one_or_none()
+    if version is not None:
+        return version
+
+    try:
+        await session.execute(
+            insert(ItineraryVersion).from_select(
+                ["itinerary_id", "version"],
+                select(Itinerary.itinerary_id, literal(1)).where(Itinerary.itinerary_id == itinerary_id)
+            )
+        )
+        await session.commit()
+    except IntegrityError:
+        await session.rollback()
+    return (await session.execute(stmt)).scalar_one_or_none()
+
+
+async def get_day_version(session: AsyncSession, itinerary_day_id: int) -> Optional[Tuple[int, int]]:
+    """(itinerary_id, version) for the itinerary a day belongs to, or None if the day doesn't exist"""
+    result = await session.execute(
+        select(ItineraryDays.itinerary_id, ItineraryVersion.version)
+        .outerjoin(ItineraryVersion, ItineraryVersion.itinerary_id == ItineraryDays.itinerary_id)
+        .where(ItineraryDays.itinerary_day_id == itinerary_day_id)
+    )
+    row = result.one_or_none()
+    if row is None or row.itinerary_id is None:
+        return None
+    version = row.version if row.version is not None else await get_version(session, row.itinerary_id)
+    return row.itinerary_id, version
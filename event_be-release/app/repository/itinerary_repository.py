@@ -6,10 +6,6 @@ from sqlalchemy.future import select
 
 
 
-def get_itinerary_item(itinerary_item_id, db):
-        item = db.query(ItineraryItem).filter(ItineraryItem.itinerary_item_id == itinerary_item_id).first()
-        return item
-
 async def get_item(itinerary_item_id, session):
     stmt = select(ItineraryItem).where(ItineraryItem.itinerary_item_id == itinerary_item_id)
     result = await session.execute(stmt)
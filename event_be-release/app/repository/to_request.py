@@ -1,22 +1,24 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from models.to_request import TORequest
 from schemas.to_request import TORequestCreate
 
-def create_to_request(db: Session, request_data: TORequestCreate):
+async def create_to_request(session: AsyncSession, request_data: TORequestCreate):
     new_request = TORequest(user_id=request_data.user_id, approval_status="open")
-    db.add(new_request)
-    db.commit()
-    db.refresh(new_request)
+    session.add(new_request)
+    await session.commit()
+    await session.refresh(new_request)
     return new_request
 
-def update_approval_status(db: Session, to_request_id: int, status: str):
-    to_request = db.query(TORequest).filter(TORequest.to_request_id == to_request_id).first()
+async def update_approval_status(session: AsyncSession, to_request_id: int, status: str):
+    result = await session.execute(select(TORequest).where(TORequest.to_request_id == to_request_id))
+    to_request = result.scalars().first()
     if to_request:
         to_request.approval_status = status
-        db.commit()
-        db.refresh(to_request)
+        await session.commit()
+        await session.refresh(to_request)
     return to_request
 
-def get_all_to_requests(db: Session):
-    return db.query(TORequest).all()
-
+async def get_all_to_requests(session: AsyncSession):
+    result = await session.execute(select(TORequest))
+    return result.scalars().all()
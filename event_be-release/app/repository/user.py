@@ -1,19 +1,27 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from models.user import User
 
-def update_user_role(db: Session, user_id: int, new_role_id: int):
-    user = db.query(User).filter(User.user_id == user_id).first()
+async def update_user_role(session: AsyncSession, user_id: int, new_role_id: int):
+    user = await fetch_by_user_id(session, user_id)
     if user:
         user.role_id = new_role_id
-        db.commit()
-        db.refresh(user)
+        await session.commit()
+        await session.refresh(user)
     return user
 
-def fetch_by_user_id(db: Session, user_id: int):
-    return db.query(User).filter(User.user_id == user_id).first()
+async def fetch_by_user_id(session: AsyncSession, user_id: int):
+    result = await session.execute(select(User).where(User.user_id == user_id))
+    return result.scalars().first()
 
-def fetch_by_email(db: Session, email: str):
-    return db.query(User).filter(User.email == email).first()
+async def fetch_by_email(session: AsyncSession, email: str):
+    result = await session.execute(select(User).where(User.email == email))
+    return result.scalars().first()
 
-def fetch_by_username(db: Session, username: str):
-    return db.query(User).filter(User.username == username).first()
\ No newline at end of file
+async def fetch_by_phone(session: AsyncSession, phone: str):
+    result = await session.execute(select(User).where(User.phone == phone))
+    return result.scalars().first()
+
+async def fetch_by_username(session: AsyncSession, username: str):
+    result = await session.execute(select(User).where(User.username == username))
+    return result.scalars().first()
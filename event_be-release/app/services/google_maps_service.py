@@ -1,66 +1,359 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta
 from fastapi import HTTPException
 import httpx
-import requests
-from api.routes.google_maps_router import GOOGLE_MAPS_DETAILS_URL
-from core.config import GOOGLE_MAPS_API_KEY
+from sqlalchemy.exc import SQLAlchemyError
+from typing import Awaitable, Callable, Dict, List, Optional, Set, Tuple
+from core.async_database import AsyncSessionLocal
+from core.cache import TTLCache
+from core.config import GOOGLE_MAPS_API_KEY, settings
+from core.http_client import get_http_client
+from core.singleflight import SingleFlight
+from repository import google_maps_cache as google_maps_cache_repo
+from services import travel_estimator
+from services.travel_estimator import Coordinate
 
-async def create_hotel_from_google_maps_api(accommodation: str) -> dict:
+logger = logging.getLogger(__name__)
+
+GOOGLE_MAPS_DETAILS_URL = "https://places.googleapis.com/v1/places/"
+
+# (origin place_id, destination place_id, mode) -> {"distance", "duration"}
+_distance_cache = TTLCache(settings.DISTANCE_CACHE_MAX_ENTRIES, settings.DISTANCE_CACHE_MEMORY_TTL_SECONDS)
+_distance_stats = {"db_hits": 0, "api_calls": 0, "api_requests": 0, "estimates": 0}
+
+# (place_id, field mask) -> Place Details payload
+_place_details_cache = TTLCache(settings.PLACE_DETAILS_CACHE_MAX_ENTRIES, settings.PLACE_DETAILS_CACHE_MEMORY_TTL_SECONDS)
+_place_details_stats = {"db_hits": 0, "api_calls": 0}
+
+# concurrent lookups for the same key share one in-flight request
+_distance_flights = SingleFlight()
+_place_details_flights = SingleFlight()
+
+# distance_matrix_cache writes running detached from the request that fetched the legs
+_cache_writes: Set[asyncio.Task] = set()
+
+# Legacy Place Details fields needed to create hotels, places, restaurants and locations
+PLACE_DETAILS_FIELDS = "name,formatted_address,geometry/location,rating,photos"
+# Places API (v1) field mask served by /googlemap/getdetail
+PLACE_DETAILS_V1_FIELDS = "id,displayName,location,formattedAddress,rating,photos"
+
+# Distance Matrix limits: 25 origins or destinations and 100 elements per request
+DISTANCE_MATRIX_MAX_PLACES = 25
+DISTANCE_MATRIX_MAX_ELEMENTS = 100
+
+def _chunk_legs(legs: List[Tuple[str, str]]) -> List[List[Tuple[str, str]]]:
+    """Group legs into Distance Matrix requests, trading round trips against billed elements.
+
+    A request is billed for every origin x destination element, not just the legs we read.
+    Consecutive legs of a day (A->B, B->C, C->D) share no origin, so batching k of them in one
+    request bills k*k elements to read k. Legs are grouped by origin (one origin x many
+    destinations wastes nothing), and origin groups are merged while the unused elements stay
+    within DISTANCE_MATRIX_MAX_WASTED_ELEMENTS. The default lets a day of up to 10 stops go out
+    as one request; setting it to 0 sends one request per origin and bills only the legs read.
+    """
+    destinations_by_origin: Dict[str, List[str]] = {}
+    for origin, destination in dict.fromkeys(legs):
+        destinations_by_origin.setdefault(origin, []).append(destination)
+
+    chunks, current, origins, destinations = [], [], set(), set()
+    for origin, origin_destinations in destinations_by_origin.items():
+        for start in range(0, len(origin_destinations), DISTANCE_MATRIX_MAX_PLACES):
+            row = [(origin, destination) for destination in origin_destinations[start:start + DISTANCE_MATRIX_MAX_PLACES]]
+            next_origins = origins | {origin}
+            next_destinations = destinations | {destination for _, destination in row}
+            elements = len(next_origins) * len(next_destinations)
+            if current and (
+                len(next_origins) > DISTANCE_MATRIX_MAX_PLACES
+                or len(next_destinations) > DISTANCE_MATRIX_MAX_PLACES
+                or elements > DISTANCE_MATRIX_MAX_ELEMENTS
+                or elements - len(current) - len(row) > settings.DISTANCE_MATRIX_MAX_WASTED_ELEMENTS
+            ):
+                chunks.append(current)
+                current, next_origins, next_destinations = [], {origin}, {destination for _, destination in row}
+            current.extend(row)
+            origins, destinations = next_origins, next_destinations
+    if current:
+        chunks.append(current)
+    return chunks
+
+async def _fetch_distance_matrix(legs: List[Tuple[str, str]], mode: str) -> Dict[Tuple[str, str], dict]:
+    """One Distance Matrix request covering every leg in `legs`"""
+    origins = list(dict.fromkeys(origin for origin, _ in legs))
+    destinations = list(dict.fromkeys(destination for _, destination in legs))
+    url = "https://maps.googleapis.com/maps/api/distancematrix/json"
+    params = {
+        "origins": "|".join(f"place_id:{origin}" for origin in origins),
+        "destinations": "|".join(f"place_id:{destination}" for destination in destinations),
+        "mode": mode,
+        "key": GOOGLE_MAPS_API_KEY,
+    }
+    response = await get_http_client().get(url, params=params)
+    if response.status_code != 200:
+        raise Exception(f"distance calculation error : {response.status_code} - {response.text}")
+    data = response.json()
+    if data.get("status") != "OK":
+        raise Exception(f"distance calculation error : {data.get('status')} - {data.get('error_message', '')}")
+
+    results = {}
+    for origin, destination in legs:
+        elements = data["rows"][origins.index(origin)]["elements"][destinations.index(destination)]
+        if elements.get("status") != "OK":
+            raise Exception(f"distance calculation error : {elements.get('status')} for {origin} -> {destination}")
+        results[(origin, destination)] = {
+            "distance" : elements["distance"]["value"],
+            "duration": elements["duration"]["value"]
+        }
+    return results
+
+async def _save_distances(fetched: Dict[Tuple[str, str], dict], mode: str) -> None:
     try:
-        url = f"https://maps.googleapis.com/maps/api/place/details/json?place_id={accommodation}&key={GOOGLE_MAPS_API_KEY}"
-        
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, timeout=10.0)
-            response.raise_for_status()
-            
-        result = response.json()
-
-        if result.get("status") != "OK":
-            raise HTTPException(
-                status_code=400, 
-                detail=f"Google Maps API error: {result.get('status', 'Unknown error')}"
+        async with AsyncSessionLocal() as cache_session:
+            await google_maps_cache_repo.save_distances(
+                cache_session,
+                [(origin, destination, data["distance"], data["duration"]) for (origin, destination), data in fetched.items()],
+                mode
             )
-        
-        data = result["result"]
-        google_data = {
-            "name": data.get("name", ""),
-            "address": data.get("formatted_address", ""),
-            "latitude": data["geometry"]["location"].get("lat", 0.0),
-            "longitude": data["geometry"]["location"].get("lng", 0.0),
-            "rating": data.get("rating", 0.0),
-            "photo_url": ""
-        }
+    except SQLAlchemyError as e:
+        logger.warning(f"distance cache write failed: {e}")
+
+async def _fetch_and_cache_distances(
+    legs: List[Tuple[str, str]],
+    mode: str,
+    coordinates: Optional[Dict[str, Coordinate]]
+) -> Dict[Tuple[str, str], dict]:
+    """Fetch one chunk of legs and store it in both cache tiers.
+
+    Runs as its own task, so it still lands in the cache when the caller has already
+    answered with estimates. The table write is left to a task of its own so callers
+    get the legs without waiting on it.
+    """
+    fetched = await _fetch_distance_matrix(legs, mode)
+    for leg, data in fetched.items():
+        _distance_cache.set((*leg, mode), data)
+    if coordinates:
+        travel_estimator.calibrate(list(fetched), coordinates, list(fetched.values()))
+
+    write = asyncio.ensure_future(_save_distances(fetched, mode))
+    _cache_writes.add(write)
+    write.add_done_callback(_cache_writes.discard)
+    return fetched
+
+async def flush_cache_writes() -> None:
+    """Wait for distance cache writes still in flight (on shutdown)"""
+    if _cache_writes:
+        await asyncio.gather(*_cache_writes, return_exceptions=True)
+
+async def get_distance_matrix_legs(
+    legs: List[Tuple[str, str]],
+    mode: str = "driving",
+    coordinates: Optional[Dict[str, Coordinate]] = None
+) -> List[dict]:
+    """Resolve (origin, destination) place_id legs with as few Distance Matrix calls as possible.
+
+    Legs are served from the memory cache, then the distance_matrix_cache table; whatever is
+    left is fetched in batched requests issued concurrently. Results keep the order of `legs`.
+
+    When `coordinates` (place_id -> (lat, lng)) covers every uncached endpoint, legs can be
+    answered with travel_estimator estimates (marked "estimated"): right away in the
+    "estimate_first" TRAVEL_TIME_MODE, or when Google fails or is slower than
+    TRAVEL_ESTIMATE_FALLBACK_AFTER_SECONDS. The real requests keep running and fill the cache.
+    """
+    resolved = {}
+    for leg in dict.fromkeys(legs):
+        cached = _distance_cache.get((*leg, mode))
+        if cached is not None:
+            resolved[leg] = cached
+
+    missing = [leg for leg in dict.fromkeys(legs) if leg not in resolved]
+    if missing:
+        fresh_after = datetime.now() - timedelta(seconds=settings.DISTANCE_CACHE_DB_TTL_SECONDS)
+        try:
+            async with AsyncSessionLocal() as cache_session:
+                rows = await google_maps_cache_repo.get_distances(cache_session, missing, mode, fresh_after)
+        except SQLAlchemyError as e:
+            logger.warning(f"distance cache lookup failed: {e}")
+            rows = []
+
+        for row in rows:
+            leg = (row.origin_place_id, row.destination_place_id)
+            resolved[leg] = {"distance": row.distance, "duration": row.duration}
+            _distance_cache.set((*leg, mode), resolved[leg])
+        _distance_stats["db_hits"] += len(rows)
+        missing = [leg for leg in missing if leg not in resolved]
+
+    if missing:
+        # legs another request is already fetching are awaited rather than fetched again
+        owned, pending = [], {}
+        for leg in missing:
+            in_flight = _distance_flights.join((*leg, mode))
+            if in_flight is not None:
+                pending[leg] = in_flight
+            else:
+                owned.append(leg)
+
+        chunks = _chunk_legs(owned)
+        for chunk in chunks:
+            task = asyncio.ensure_future(_fetch_and_cache_distances(chunk, mode, coordinates))
+            for leg in chunk:
+                _distance_flights.track((*leg, mode), task)
+                pending[leg] = task
+        _distance_stats["api_calls"] += len(owned)
+        _distance_stats["api_requests"] += len(chunks)
 
-        if photos := data.get("photos"):
-            photo_ref = photos[0].get("photo_reference")
-            if photo_ref:
-                google_data["photo_url"] = f"https://maps.googleapis.com/maps/api/place/photo?maxwidth=400&photoreference={photo_ref}&key={GOOGLE_MAPS_API_KEY}"
+        estimates = travel_estimator.estimate_legs(missing, coordinates) if coordinates else None
+        if estimates is None:
+            wait_for = None
+        elif settings.TRAVEL_TIME_MODE == "estimate_first":
+            wait_for = 0
+        elif settings.TRAVEL_ESTIMATE_FALLBACK:
+            wait_for = settings.TRAVEL_ESTIMATE_FALLBACK_AFTER_SECONDS
+        else:
+            estimates, wait_for = None, None
 
-        return google_data
-        
+        futures = list(dict.fromkeys(pending.values()))
+        try:
+            fetched = await asyncio.wait_for(
+                asyncio.gather(*(asyncio.shield(future) for future in futures)),
+                wait_for
+            )
+            results = dict(zip(futures, fetched))
+            for leg, future in pending.items():
+                resolved[leg] = results[future][leg]
+        except Exception as e:
+            if estimates is None:
+                raise
+            if not isinstance(e, asyncio.TimeoutError):
+                logger.warning(f"distance matrix failed, using estimates: {e}")
+            _distance_stats["estimates"] += len(missing)
+            for leg, estimate in zip(missing, estimates):
+                resolved[leg] = {**estimate, "estimated": True}
+
+    return [dict(resolved[leg]) for leg in legs]
+
+async def get_distance_matrix_details(
+    origin: str,
+    destination:str,
+    mode: str = "driving",
+    coordinates: Optional[Dict[str, Coordinate]] = None
+):
+    legs = await get_distance_matrix_legs([(origin, destination)], mode, coordinates)
+    return legs[0]
+
+def get_distance_cache_stats() -> dict:
+    memory = _distance_cache.stats()
+    return {
+        "memory_size": memory["size"],
+        "memory_hits": memory["hits"],
+        "db_hits": _distance_stats["db_hits"],
+        "misses": _distance_stats["api_calls"],
+        "api_requests": _distance_stats["api_requests"],
+        "coalesced": _distance_flights.coalesced,
+        "estimates": _distance_stats["estimates"],
+        "estimator_observations": travel_estimator.speed_model.observations,
+    }
+
+async def _cached_place_details(place_id: str, field_mask: str, fetch: Callable[[], Awaitable[dict]]) -> dict:
+    """Serve place details from memory, then the place_details_cache table, calling `fetch` only on a miss"""
+    key = (place_id, field_mask)
+    cached = _place_details_cache.get(key)
+    if cached is not None:
+        return cached
+    return await _place_details_flights.do(key, lambda: _load_place_details(key, fetch))
+
+async def _load_place_details(key: Tuple[str, str], fetch: Callable[[], Awaitable[dict]]) -> dict:
+    place_id, field_mask = key
+    fresh_after = datetime.now() - timedelta(seconds=settings.PLACE_DETAILS_CACHE_DB_TTL_SECONDS)
+    try:
+        async with AsyncSessionLocal() as cache_session:
+            row = await google_maps_cache_repo.get_place_details(cache_session, place_id, field_mask, fresh_after)
+    except SQLAlchemyError as e:
+        logger.warning(f"place details cache lookup failed: {e}")
+        row = None
+
+    if row:
+        _place_details_stats["db_hits"] += 1
+        _place_details_cache.set(key, row.payload)
+        return row.payload
+
+    _place_details_stats["api_calls"] += 1
+    payload = await fetch()
+    _place_details_cache.set(key, payload)
+
+    try:
+        async with AsyncSessionLocal() as cache_session:
+            await google_maps_cache_repo.save_place_details(cache_session, place_id, field_mask, payload)
+    except SQLAlchemyError as e:
+        logger.warning(f"place details cache write failed: {e}")
+
+    return payload
+
+async def _fetch_place_details(place_id: str, fields: str) -> dict:
+    url = "https://maps.googleapis.com/maps/api/place/details/json"
+    params = {"place_id": place_id, "fields": fields, "key": GOOGLE_MAPS_API_KEY}
+    try:
+        response = await get_http_client().get(url, params=params)
+        response.raise_for_status()
     except httpx.HTTPError as e:
         raise HTTPException(status_code=503, detail=f"Failed to contact Google Maps API: {str(e)}")
+
+    result = response.json()
+    if result.get("status") != "OK":
+        raise HTTPException(
+            status_code=400, 
+            detail=f"Google Maps API error: {result.get('status', 'Unknown error')}"
+        )
+    return result["result"]
+
+async def resolve_place_details(place_id: str, fields: str = PLACE_DETAILS_FIELDS) -> dict:
+    """Place Details `result` for a place_id, fetched from Google at most once per field mask"""
+    return await _cached_place_details(place_id, fields, lambda: _fetch_place_details(place_id, fields))
+
+async def prefetch_place_details(place_ids: List[str], fields: str = PLACE_DETAILS_FIELDS) -> None:
+    """Resolve several place_ids concurrently so the lookups that follow are served from the cache"""
+    await asyncio.gather(*(resolve_place_details(place_id, fields) for place_id in dict.fromkeys(place_ids)))
+
+def place_summary(data: dict) -> dict:
+    """Flatten a Place Details result into the columns our Hotel/Place/Restaurant/Location rows store"""
+    google_data = {
+        "name": data.get("name", ""),
+        "address": data.get("formatted_address", ""),
+        "latitude": data["geometry"]["location"].get("lat", 0.0),
+        "longitude": data["geometry"]["location"].get("lng", 0.0),
+        "rating": data.get("rating", 0.0),
+        "photo_url": ""
+    }
+
+    if photos := data.get("photos"):
+        photo_ref = photos[0].get("photo_reference")
+        if photo_ref:
+            google_data["photo_url"] = f"https://maps.googleapis.com/maps/api/place/photo?maxwidth=400&photoreference={photo_ref}&key={GOOGLE_MAPS_API_KEY}"
+
+    return google_data
+
+async def get_place_summary(place_id: str) -> dict:
+    data = await resolve_place_details(place_id)
+    try:
+        return place_summary(data)
     except KeyError as e:
         raise HTTPException(status_code=500, detail=f"Invalid response format: {str(e)}")
-    
-async def get_distance_matrix_details(origin: str, destination:str):
-    url = f"https://maps.googleapis.com/maps/api/distancematrix/json?destinations=place_id:{destination}&mode=driving&origins=place_id:{origin}&key={GOOGLE_MAPS_API_KEY}"
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url)
-        if response.status_code != 200:
-            raise Exception(f"distance calculation error : {response.status_code} - {response.text}")
-        data = response.json()
-
-        elements = data["rows"][0]["elements"][0]
-
-        return  {
-            "distance" : elements["distance"]["value"],
-            "duration": elements["duration"]["value"]
-        }
+
+async def _fetch_place_details_v1(place_id: str) -> dict:
+    url=f"{GOOGLE_MAPS_DETAILS_URL}{place_id}?fields={PLACE_DETAILS_V1_FIELDS}&key={GOOGLE_MAPS_API_KEY}"
+    response = await get_http_client().get(url)
+    if response.status_code !=200:
+        raise Exception(f"Google API error : {response.status_code} - {response.text}")
+    return response.json()
 
 async def get_place_details(place_id: str) -> dict :
-    url=f"{GOOGLE_MAPS_DETAILS_URL}{place_id}?fields=id,displayName,location,formattedAddress,rating,photos&key={GOOGLE_MAPS_API_KEY}"
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url)
-        if response.status_code !=200:
-            raise Exception(f"Google API error : {response.status_code} - {response.text}")
-        return response.json()
\ No newline at end of file
+    return await _cached_place_details(place_id, f"v1:{PLACE_DETAILS_V1_FIELDS}", lambda: _fetch_place_details_v1(place_id))
+
+def get_place_details_cache_stats() -> dict:
+    memory = _place_details_cache.stats()
+    return {
+        "memory_size": memory["size"],
+        "memory_hits": memory["hits"],
+        "db_hits": _place_details_stats["db_hits"],
+        "misses": _place_details_stats["api_calls"],
+        "coalesced": _place_details_flights.coalesced,
+    }
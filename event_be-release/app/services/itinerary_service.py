@@ -5,20 +5,29 @@ from services.resources.hotels.hotel import HotelService
 from schemas.resources.hotels.hotel import HotelCreate, HotelResponse
 from repository.user import fetch_by_user_id
 from services.user import get_default_timing
-from repository.itinerary_repository import get_item, get_itinerary_item
+from repository.itinerary_repository import get_item
 from schemas.itinerary import AddItineraryItem
 from fastapi import HTTPException, status
 import requests
-from sqlalchemy import Null, asc, desc, select, update
-from services import google_maps_service
+from sqlalchemy import Null, and_, asc, case, desc, event, func, insert, select, update
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy.orm.attributes import set_committed_value
+from services import google_maps_service, route_optimizer
+from repository import itinerary_read_model as read_model_repo
+from fastapi.encoders import jsonable_encoder
+from starlette.concurrency import run_in_threadpool
+from core.etag import make_etag
+from core.async_database import AsyncSessionLocal
+from core.cache import TTLCache
+from core.config import settings
+from core.singleflight import SingleFlight
 # from models import itinerary_modal
-from sqlalchemy.orm import Session
 from core.config import GOOGLE_MAPS_API_KEY
 # from models import hotel_model, place_modal, restaurant_modal
 from datetime import date, datetime, timedelta, time
 from collections import defaultdict
 # from logger import logger
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from services.hotel_service import create_hotel_from_google_maps_api
 from models.location_modal import Location
@@ -26,27 +35,48 @@ from services.location_service import create_location_from__google_maps_api
 from services.place_service import create_place_from_google_maps_api
 from services.restaurant_service import create_restaurant_from_google_maps_api
 from schemas.itinerary import ItineraryInput
-from models.itinerary_modal import Itinerary, ItineraryDays, ItineraryItem, ItineraryShareCode
+from models.itinerary_modal import Itinerary, ItineraryDays, ItineraryItem, ItineraryShareCode, ItemType
 from models.hotels.hotel import FoodType, Hotel, HotelCategory
 from models.place_modal import Place
 from models.restaurant_modal import Restaurant
 
 
 
-async def create_share_code(itinerary_id, session: AsyncSession):
-    code = secrets.token_urlsafe(10)
+# share code -> itinerary_id, and itinerary_id -> public snapshot of a shared itinerary
+_share_code_cache = TTLCache(settings.SHARE_CODE_CACHE_MAX_ENTRIES, settings.SHARE_CODE_CACHE_TTL_SECONDS)
+_shared_snapshot_cache = TTLCache(settings.SHARED_SNAPSHOT_CACHE_MAX_ENTRIES, settings.SHARED_SNAPSHOT_CACHE_TTL_SECONDS)
+_shared_snapshot_flights = SingleFlight()
+# bumped whenever a committed edit forgets a snapshot, so builds started before it aren't cached
+_shared_snapshot_generation = 0
+
+def forget_shared_snapshot(itinerary_id: int) -> None:
+    global _shared_snapshot_generation
+    _shared_snapshot_generation += 1
+    _shared_snapshot_cache.invalidate(itinerary_id)
+
+@event.listens_for(Session, "after_commit")
+def _forget_committed_snapshots(session: Session) -> None:
+    """Forget the shared snapshots of itineraries edited in the transaction that just committed"""
+    for itinerary_id in session.info.pop("edited_itineraries", ()):
+        forget_shared_snapshot(itinerary_id)
 
-    # Create a new entry
-    new_share = ItineraryShareCode(
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back_edits(session: Session) -> None:
+    session.info.pop("edited_itineraries", None)
+
+def add_share_code(itinerary_id, session: AsyncSession) -> str:
+    """Stage a new share code for the itinerary in the current transaction"""
+    code = secrets.token_urlsafe(10)
+    session.add(ItineraryShareCode(
         itinerary_id=itinerary_id,
         share_code=code
-    )
-    # Add to DB and commit
-    session.add(new_share)
-    await session.flush()
+    ))
+    return code
+
+async def create_share_code(itinerary_id, session: AsyncSession):
+    code = add_share_code(itinerary_id, session)
     await session.commit()
-    await session.refresh(new_share)
-    return new_share.share_code
+    return code
 
 async def calculate_next_arrival_time(arrival_time:time, stay_duration:int, travel_duration:int ):
     dummy_datetime = datetime.combine(datetime.today() , arrival_time)
@@ -54,53 +84,112 @@ async def calculate_next_arrival_time(arrival_time:time, stay_duration:int, trav
     eta = dummy_datetime + total_duration
     return eta.time()
 
-async def get_item_details(item, item_type, session: AsyncSession):
-    if item_type == "hotel":
-        item_detail = await session.execute(
-            select(Hotel).where(Hotel.hotel_id == item.hotel_id)
-        )
-    elif item_type == "restaurant":
-        item_detail = await session.execute(
-            select(Restaurant).where(Restaurant.restaurant_id == item.restaurant_id)
-        )
-    elif item_type == "place" or item_type == "starting_point":
-        item_detail = await session.execute(
-            select(Place).where(Place.p_id == item.p_id)
-        )
-    return item_detail.scalar_one_or_none()  # Added scalar_one_or_none() to get the actual model instance
-
+def get_coordinates(*resources) -> Dict[str, Tuple[float, float]]:
+    """place_id -> (lat, lng) for hotels/restaurants/places that have stored coordinates"""
+    return {
+        resource.place_id: (resource.latitude, resource.longitude)
+        for resource in resources
+        if resource is not None and resource.latitude is not None and resource.longitude is not None
+    }
 
+def get_item_resource_key(item):
+    """(table, id) of the Hotel/Restaurant/Place an itinerary item points at"""
+    if item.type == "hotel":
+        return ("hotel", item.hotel_id)
+    elif item.type == "restaurant":
+        return ("restaurant", item.restaurant_id)
+    elif item.type == "place" or item.type == "starting_point":
+        return ("place", item.p_id)
+    return (None, None)
+
+async def get_items_details_map(items, session: AsyncSession) -> Dict[Tuple[str, int], Any]:
+    """Load the Hotel/Restaurant/Place rows of many itinerary items with one IN-query per table"""
+    ids = defaultdict(set)
+    for item in items:
+        table, resource_id = get_item_resource_key(item)
+        if table and resource_id is not None:
+            ids[table].add(resource_id)
+
+    details = {}
+    if ids["hotel"]:
+        result = await session.execute(select(Hotel).where(Hotel.hotel_id.in_(ids["hotel"])))
+        details.update({("hotel", hotel.hotel_id): hotel for hotel in result.scalars()})
+    if ids["restaurant"]:
+        result = await session.execute(select(Restaurant).where(Restaurant.restaurant_id.in_(ids["restaurant"])))
+        details.update({("restaurant", restaurant.restaurant_id): restaurant for restaurant in result.scalars()})
+    if ids["place"]:
+        result = await session.execute(select(Place).where(Place.p_id.in_(ids["place"])))
+        details.update({("place", place.p_id): place for place in result.scalars()})
+    return details
+
+
+async def recalculate_itinerary_timings(ordered_items, session, changed_legs=None, start_index=None):
+    """Re-time `ordered_items` (consecutive stops of one day).
+
+    `changed_legs` holds the indexes i whose leg ordered_items[i-1] -> ordered_items[i] got new
+    endpoints; only those (and legs with no stored travel data, or only an estimate) go to the
+    Distance Matrix, the rest reuse distance_from_previous_stop / duration_from_previous_stop.
+    None means every leg.
+    Arrival times are propagated forward from the first changed leg or `start_index`,
+    whichever comes first.
+    """
+    leg_indexes = range(1, len(ordered_items))
+    if changed_legs is None:
+        changed = set(leg_indexes)
+    else:
+        changed = {index for index in changed_legs if index in leg_indexes}
+        changed |= {
+            index for index in leg_indexes
+            if ordered_items[index].distance_from_previous_stop is None
+            or ordered_items[index].duration_from_previous_stop is None
+            or ordered_items[index].estimated_from_previous_stop
+        }
 
-async def recalculate_itinerary_timings(ordered_items, session):
-    for index, current_item in enumerate(ordered_items):
-        if index == 0: 
-            continue
+    starts = set(changed)
+    if start_index is not None and start_index in leg_indexes:
+        starts.add(start_index)
+    if not starts:
+        await session.commit()
+        return ordered_items
+
+    if changed:
+        endpoints = sorted({i for leg in changed for i in (leg - 1, leg)})
+        details_map = await get_items_details_map([ordered_items[index] for index in endpoints], session)
+        details = {}
+        for index in endpoints:
+            detail = details_map.get(get_item_resource_key(ordered_items[index]))
+            if not detail:
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"Origin or destination not found for itinerary item at index {index}"
+                )
+            details[index] = detail
+
+        # every changed leg of the day in one batched Distance Matrix lookup
+        changed = sorted(changed)
+        legs = [(details[index - 1].place_id, details[index].place_id) for index in changed]
+        leg_data = dict(zip(changed, await google_maps_service.get_distance_matrix_legs(
+            legs, coordinates=get_coordinates(*details.values())
+        )))
+        for index, data in leg_data.items():
+            ordered_items[index].distance_from_previous_stop = data["distance"]
+            ordered_items[index].duration_from_previous_stop = data["duration"]
+            ordered_items[index].estimated_from_previous_stop = data.get("estimated", False)
+
+    for index in range(min(starts), len(ordered_items)):
         last_item = ordered_items[index - 1]
+        current_item = ordered_items[index]
+        current_item.time = await calculate_next_arrival_time(
+            last_item.time, last_item.stay_duration, current_item.duration_from_previous_stop
+        )
 
-        origin = await get_item_details(last_item, last_item.type.value, session) 
-        destination = await get_item_details(current_item, current_item.type.value, session)
-
-        if not origin or not destination:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Origin or destination not found for itinerary item at index {index}"
-            )
-
-        data = await google_maps_service.get_distance_matrix_details(origin.place_id, destination.place_id)
-
-        new_time = await calculate_next_arrival_time(last_item.time, last_item.stay_duration, data["duration"])
-
-        current_item.time = new_time
-        current_item.distance_from_previous_stop = data["distance"]
-        current_item.duration_from_previous_stop = data["duration"]
+    # drop the views and bump the version again in the commit that carries the new times, so a view
+    # rebuilt while we waited on the Distance Matrix doesn't outlive them
+    await mark_itinerary_day_changed(session, ordered_items[0].itinerary_day_id)
 
-    # Commit once after updating all items for better performance
+    # Commit once after updating all items; the session doesn't expire on commit so no refresh is needed
     await session.commit()
 
-    # Refresh all items asynchronously
-    for item in ordered_items:
-        await session.refresh(item)
-
     return ordered_items
 
 
@@ -136,7 +225,8 @@ async def add_item(item_id, item, request, session: AsyncSession):
 
     # Determine origin and next item's arrival time
     if last_item:
-        origin = await get_item_details(last_item, last_item.type, session)
+        details_map = await get_items_details_map([last_item], session)
+        origin = details_map.get(get_item_resource_key(last_item))
         new_time = await calculate_next_arrival_time(last_item.time, last_item.stay_duration, 0)
         new_order = last_item.order_index + 1
     else:
@@ -147,7 +237,9 @@ async def add_item(item_id, item, request, session: AsyncSession):
     if not origin or not origin.place_id or not request.place_id:
         raise HTTPException(status_code=400, detail="Missing place ID for distance calculation")
 
-    data = await google_maps_service.get_distance_matrix_details(origin.place_id, request.place_id)
+    data = await google_maps_service.get_distance_matrix_details(
+        origin.place_id, request.place_id, coordinates=get_coordinates(origin, item)
+    )
     distance = data["distance"]
     duration = data["duration"]
 
@@ -156,6 +248,7 @@ async def add_item(item_id, item, request, session: AsyncSession):
         "time": new_time,
         "distance_from_previous_stop": distance,
         "duration_from_previous_stop": duration,
+        "estimated_from_previous_stop": data.get("estimated", False),
         "order_index": new_order,
         "type": request.type,
         "hotel_id": hotel_id,
@@ -166,6 +259,7 @@ async def add_item(item_id, item, request, session: AsyncSession):
 
     new_item = ItineraryItem(**item_data)
     session.add(new_item)
+    await mark_itinerary_day_changed(session, request.itinerary_day_id)
 
     await session.flush()
     await session.refresh(new_item)
@@ -188,7 +282,6 @@ async def create_itinerary(
     )
     session.add(new_itinerary)
     await session.flush()  # Ensure itinerary_id is available
-    await session.refresh(new_itinerary)
     return new_itinerary
 
 async def create_itinerary_days(
@@ -197,90 +290,73 @@ async def create_itinerary_days(
     endDate: date,
     session: AsyncSession
 ) -> List[ItineraryDays]:
-    current_date = startDate
-    day_number = 1
-    itinerary_days = []
-    
-    while current_date <= endDate:
-        itinerary_days.append(
-            ItineraryDays(
-                itinerary_id=itinerary_id,
-                day_number=day_number,
-                date=current_date
-            )
-        )
-        current_date += timedelta(days=1)
-        day_number += 1
-
-    session.add_all(itinerary_days)   # Correct: no await
-    await session.flush()             # Correct: await async call
-
-    
-    for day in itinerary_days:
-        await session.refresh(day)
-        
-    return itinerary_days
+    """Insert every day of the trip in one executemany and read them back with one SELECT"""
+    day_rows = [
+        {
+            "itinerary_id": itinerary_id,
+            "day_number": offset + 1,
+            "date": startDate + timedelta(days=offset)
+        }
+        for offset in range((endDate - startDate).days + 1)
+    ]
+    if not day_rows:
+        return []
+
+    await session.execute(insert(ItineraryDays), day_rows)
+    result = await session.execute(
+        select(ItineraryDays)
+        .where(ItineraryDays.itinerary_id == itinerary_id)
+        .order_by(asc(ItineraryDays.day_number))
+    )
+    return list(result.scalars().all())
 
 async def create_itinerary_items(
-    user_id:int,
-    itinerary_day_id: int,
-    day_number: int,
-    p_id: int,
-    hotel_id: int,
-    place_place_id: str,
-    hotel_place_id: str,
+    timing,
+    itinerary_days: List[ItineraryDays],
+    place: Place,
+    hotel: Hotel,
     session: AsyncSession
-) -> List[ItineraryItem]:
-
-    timing = await get_default_timing(user_id, session)
-    if not timing:
-        raise HTTPException(status_code=404, detail=f"default timing not found user ID = {user_id}")
-    
-    items = []
-    if day_number == 1:
-        place_item = ItineraryItem(
-            itinerary_day_id=itinerary_day_id,
-            time=time(9, 0),
-            order_index=0,
-            type="starting_point",
-            p_id=p_id,
-            stay_duration=0
-        )
-        session.add(place_item)
-        await session.flush()
-        items.append(place_item)
-        data = await google_maps_service.get_distance_matrix_details(place_place_id, hotel_place_id)
-        distance = data["distance"]
-        duration = data["duration"]
-        new_time = await calculate_next_arrival_time(place_item.time, place_item.stay_duration, duration)
-        hotel_item = ItineraryItem(
-            itinerary_day_id=itinerary_day_id,
-            time=new_time,
-            distance_from_previous_stop=distance,
-            duration_from_previous_stop=duration,
-            order_index=1,
-            type="hotel",
-            hotel_id=hotel_id,
-            stay_duration=timing.hotel_daytime_duration
-        )
-        session.add(hotel_item)
-        items.append(hotel_item)
-    else:
-        hotel_item = ItineraryItem(
-            itinerary_day_id=itinerary_day_id,
-            time=time(9, 0),
-            order_index=1,
-            type="hotel",
-            hotel_id=hotel_id,
-            stay_duration=0
-        )
-        session.add(hotel_item)
-        items.append(hotel_item)
-    await session.flush()
+) -> List[dict]:
+    """Insert the opening items of every day (starting point + hotel on day 1, hotel after) in one executemany"""
+    item_rows = []
+    for day in itinerary_days:
+        if day.day_number == 1:
+            data = await google_maps_service.get_distance_matrix_details(
+                place.place_id, hotel.place_id, coordinates=get_coordinates(place, hotel)
+            )
+            start_time = time(9, 0)
+            item_rows.append({
+                "itinerary_day_id": day.itinerary_day_id,
+                "time": start_time,
+                "order_index": 0,
+                "type": "starting_point",
+                "p_id": place.p_id,
+                "stay_duration": 0,
+            })
+            item_rows.append({
+                "itinerary_day_id": day.itinerary_day_id,
+                "time": await calculate_next_arrival_time(start_time, 0, data["duration"]),
+                "distance_from_previous_stop": data["distance"],
+                "duration_from_previous_stop": data["duration"],
+                "estimated_from_previous_stop": data.get("estimated", False),
+                "order_index": 1,
+                "type": "hotel",
+                "hotel_id": hotel.hotel_id,
+                "stay_duration": timing.hotel_daytime_duration,
+            })
+        else:
+            item_rows.append({
+                "itinerary_day_id": day.itinerary_day_id,
+                "time": time(9, 0),
+                "order_index": 1,
+                "type": "hotel",
+                "hotel_id": hotel.hotel_id,
+                "stay_duration": 0,
+            })
 
-    for item in items:
-        await session.refresh(item)
-    return items
+    if item_rows:
+        await session.execute(insert(ItineraryItem), item_rows)
+    return item_rows
 
 async def create_initial_itinerary(
     session: AsyncSession,
@@ -294,7 +370,11 @@ async def create_initial_itinerary(
     endDate: date,
 ) -> Itinerary:
     try:
-        # Check or create hotel
+        timing = await get_default_timing(user_id, session)
+        if not timing:
+            raise HTTPException(status_code=404, detail=f"default timing not found user ID = {user_id}")
+
+        # Look up the hotel, location and starting point we already have
         hotel_result = await session.execute(
             select(Hotel).where(
                 Hotel.place_id == accommodation,
@@ -304,6 +384,24 @@ async def create_initial_itinerary(
         )
         hotel = hotel_result.scalar_one_or_none()
 
+        location_result = await session.execute(
+            select(Location).where(Location.place_id == itineraryPlaceID)
+        )
+        location = location_result.scalar_one_or_none()
+
+        place_result = await session.execute(
+            select(Place).where(Place.place_id == startingPoint)
+        )
+        place = place_result.scalar_one_or_none()
+
+        # Fetch the Place Details of the missing ones concurrently; the creates below read them from the cache
+        missing = [
+            place_id for place_id, found in (
+                (accommodation, hotel), (itineraryPlaceID, location), (startingPoint, place)
+            ) if not found
+        ]
+        await google_maps_service.prefetch_place_details(missing)
+
         if not hotel:
             hotel_data = HotelCreate(
                 food_type=FoodType.Veg,
@@ -321,29 +419,13 @@ async def create_initial_itinerary(
         if not hotel:
             raise HTTPException(status_code=500, detail="Hotel creation failed and could not be found.")
 
-        # ✅ Check or create location
-        location_result = await session.execute(
-            select(Location).where(Location.place_id == itineraryPlaceID)
-        )
-        location = location_result.scalar_one_or_none()
-
         if not location:
             location = await create_location_from__google_maps_api(itineraryPlaceID, session)
             if not location:
                 raise HTTPException(status_code=500, detail="Location creation failed and could not be found.")
 
-        # ✅ Check or create starting point place
-        place_result = await session.execute(
-            select(Place).where(Place.place_id == startingPoint)
-        )
-        place = place_result.scalar_one_or_none()
-
         if not place:
-            await create_place_from_google_maps_api(startingPoint, session=session)
-            place_result = await session.execute(
-                select(Place).where(Place.place_id == startingPoint)
-            )
-            place = place_result.scalar_one_or_none()
+            place = await create_place_from_google_maps_api(startingPoint, session=session)
 
         if not place:
             raise HTTPException(status_code=500, detail="Starting point creation failed and could not be found.")
@@ -367,23 +449,11 @@ async def create_initial_itinerary(
             session
         )
 
-        # Create itinerary items
-        itinerary_items = []
-        for day in itinerary_days:
-            day_items = await create_itinerary_items(
-                user_id,
-                day.itinerary_day_id,
-                day.day_number,
-                place.p_id,
-                hotel.hotel_id,
-                place.place_id,
-                hotel.place_id,
-                session
-            )
-            itinerary_items.extend(day_items)
+        # Create the opening items of every day
+        await create_itinerary_items(timing, itinerary_days, place, hotel, session)
 
-        await session.refresh(itinerary)
-        await create_share_code(itinerary.itinerary_id, session)
+        add_share_code(itinerary.itinerary_id, session)
+        read_model_repo.add_version(session, itinerary.itinerary_id)
         await session.commit()
         return itinerary
 
@@ -461,211 +531,254 @@ async def add_itinerary_item(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to add itinerary item: {e}")
 
-def get_all_route(itinerary_id, db):
-    items = (
-        db.query(
-            ItineraryDays.itinerary_day_id,
-            ItineraryDays.day_number,
-            ItineraryDays.date,
-            ItineraryItem.itinerary_item_id,
-            ItineraryItem.order_index,
-            ItineraryItem.type,
-            ItineraryItem.hotel_id,
-            ItineraryItem.restaurant_id,
-            ItineraryItem.p_id,
-        )
-        .join(ItineraryItem, ItineraryItem.itinerary_day_id == ItineraryDays.itinerary_day_id)
-        .filter(ItineraryDays.itinerary_id == itinerary_id)
-        .order_by(ItineraryDays.day_number, ItineraryItem.order_index)
-        .all()
+async def mark_itinerary_day_changed(session: AsyncSession, itinerary_day_id: int) -> None:
+    """Record an edit to a day's itinerary: drop its read-model views, bump its version and
+    forget its shared snapshot.
+
+    The database changes run in the caller's transaction, so they take effect when the edit commits;
+    the snapshot is forgotten once that commit is done (see _forget_committed_snapshots).
+    """
+    result = await session.execute(
+        select(ItineraryDays.itinerary_id).where(ItineraryDays.itinerary_day_id == itinerary_day_id)
     )
-    #logger.info(items)
-    hotel_ids, restaurant_ids, place_ids = set(), set(), set()
+    itinerary_id = result.scalar_one_or_none()
+    if itinerary_id is None:
+        return
+    await mark_itinerary_changed(session, itinerary_id)
 
-    for item in items:
-        if item.type == "hotel" and item.hotel_id:
-            hotel_ids.add(item.hotel_id)
-        elif item.type == "restaurant" and item.restaurant_id:
-            restaurant_ids.add(item.restaurant_id)
-        elif (item.type == "place" or item.type =="starting_point") and item.p_id:
-            place_ids.add(item.p_id)
-
-    hotels = {h.hotel_id: h for h in db.query(Hotel).filter(Hotel.hotel_id.in_(hotel_ids)).all()}
-    restaurants = {r.restaurant_id: r for r in db.query(Restaurant).filter(Restaurant.restaurant_id.in_(restaurant_ids)).all()}
-    places = {p.p_id: p for p in db.query(Place).filter(Place.p_id.in_(place_ids)).all()}
-
-    grouped = defaultdict(lambda: {"place": {}})
-    item_counters = defaultdict(int)
-
-    for row in items:
-        day_id = str(row.itinerary_day_id)
-        if "day_id" not in grouped[day_id]:
-            grouped[day_id]["day_id"] = str(row.day_number)
-            grouped[day_id]["date"] = row.date.strftime("%d-%m-%Y") if row.date else ""
-
-        item_counters[day_id] += 1
-        pid = f"p_id-{item_counters[day_id]}"
-
-        data = {}
-        if row.type == "hotel" and row.hotel_id in hotels:
-            p = hotels[row.hotel_id]
-        elif row.type == "restaurant" and row.restaurant_id in restaurants:
-            p = restaurants[row.restaurant_id]
-        elif row.p_id in places:
-            p = places[row.p_id]
-        data = {
-                "order": str(row.order_index),
-                "placeID": str(p.place_id),
-                "lat": str(p.latitude),
-                "lng": str(p.longitude),
-                "placeType": row.type,
-                "name": p.name,
-                "address": p.address,
-            }   
-        grouped[day_id]["place"][pid] = data
-
-    return list(grouped.values())
-
-
-def get_route_for_day(itinerary_id, day_id, db):
-    items = (
-        db.query(
+
+async def mark_itinerary_changed(session: AsyncSession, itinerary_id: int) -> None:
+    await read_model_repo.invalidate_itinerary(session, itinerary_id)
+    await read_model_repo.bump_version(session, itinerary_id)
+    session.info.setdefault("edited_itineraries", set()).add(itinerary_id)
+
+
+async def mark_resource_changed(session: AsyncSession, table: str, resource_id: int) -> None:
+    """Record an edit to a hotel ("hotel"), restaurant or place row: every itinerary whose views
+    embed it is treated as edited, in the caller's transaction like mark_itinerary_day_changed"""
+    for itinerary_id in await read_model_repo.itineraries_using(session, table, resource_id):
+        await mark_itinerary_changed(session, itinerary_id)
+
+
+async def get_itinerary_etag(session: AsyncSession, itinerary_id: int, view: str) -> Optional[str]:
+    """ETag of an itinerary view at the itinerary's current version, None if there is no such itinerary"""
+    version = await read_model_repo.get_version(session, itinerary_id)
+    return make_etag(view, version) if version is not None else None
+
+
+async def get_day_summary_etag(session: AsyncSession, itinerary_day_id: int) -> Optional[str]:
+    day_version = await read_model_repo.get_day_version(session, itinerary_day_id)
+    if day_version is None:
+        return None
+    return make_etag(f"day_summary:{itinerary_day_id}", day_version[1])
+
+
+async def _read_model(
+    session: AsyncSession,
+    view: str,
+    build,
+    itinerary_id: Optional[int] = None,
+    itinerary_day_id: Optional[int] = None,
+    with_version: bool = False
+):
+    """Serve a view from itinerary_read_models, building and storing it when missing or stale.
+
+    The itinerary's version (looked up from `itinerary_day_id` for day views) is read in the same
+    transaction as the build, and the view is stored stamped with it. A view stamped with another
+    version than the current one is never served, so a build that raced an edit can't outlive it.
+    Edits also drop the views outright (mark_itinerary_day_changed, mark_resource_changed).
+
+    With `with_version`, returns (payload, version); version is None if the itinerary doesn't exist.
+    """
+    if itinerary_day_id is not None:
+        day_version = await read_model_repo.get_day_version(session, itinerary_day_id)
+        itinerary_id, version = day_version if day_version is not None else (None, None)
+    else:
+        version = await read_model_repo.get_version(session, itinerary_id)
+
+    stored = await read_model_repo.get_view(session, view)
+    if stored is not None and version is not None and stored[1] == version:
+        payload = stored[0]
+    else:
+        payload = jsonable_encoder(await build())
+        if version is not None:
+            await read_model_repo.save_view(session, itinerary_id, view, payload, version)
+    return (payload, version) if with_version else payload
+
+
+def _resource_column(column: str):
+    """COALESCE of a hotel/restaurant/place column over the joins added by _join_item_resources"""
+    return func.coalesce(
+        getattr(Hotel, column), getattr(Restaurant, column), getattr(Place, column)
+    ).label(column)
+
+
+def _join_item_resources(stmt):
+    """LEFT JOIN every itinerary item to the hotel, restaurant or place its type points at"""
+    return (
+        stmt
+        .outerjoin(Hotel, and_(
+            ItineraryItem.type == ItemType.HOTEL,
+            Hotel.hotel_id == ItineraryItem.hotel_id
+        ))
+        .outerjoin(Restaurant, and_(
+            ItineraryItem.type == ItemType.RESTAURANT,
+            Restaurant.restaurant_id == ItineraryItem.restaurant_id
+        ))
+        .outerjoin(Place, and_(
+            ItineraryItem.type.in_([ItemType.PLACE, ItemType.STARTING_POINT]),
+            Place.p_id == ItineraryItem.p_id
+        ))
+    )
+
+
+async def materialize_route(itinerary_id: int, session: AsyncSession, day_id: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Route of an itinerary (or of one of its days) built from a single joined query.
+
+    Each item is LEFT JOINed to the hotel, restaurant or place its type points at and the
+    columns are COALESCEd, so rows stream straight into the per-day response shape.
+    """
+    stmt = _join_item_resources(
+        select(
             ItineraryDays.itinerary_day_id,
             ItineraryDays.day_number,
             ItineraryDays.date,
-            ItineraryItem.itinerary_item_id,
             ItineraryItem.order_index,
             ItineraryItem.type,
-            ItineraryItem.hotel_id,
-            ItineraryItem.restaurant_id,
-            ItineraryItem.p_id,
+            _resource_column("place_id"),
+            _resource_column("latitude"),
+            _resource_column("longitude"),
+            _resource_column("name"),
+            _resource_column("address"),
         )
         .join(ItineraryItem, ItineraryItem.itinerary_day_id == ItineraryDays.itinerary_day_id)
-        .filter(ItineraryDays.itinerary_id == itinerary_id)
-        .filter(ItineraryDays.itinerary_day_id == day_id)
-        .order_by(ItineraryDays.day_number, ItineraryItem.order_index)
-        .all()
-    )
-    #logger.info(items)
-
-    hotel_ids, restaurant_ids, place_ids = set(), set(), set()
-
-    for item in items:
-        if item.type == "hotel" and item.hotel_id:
-            hotel_ids.add(item.hotel_id)
-        elif item.type == "restaurant" and item.restaurant_id:
-            restaurant_ids.add(item.restaurant_id)
-        elif (item.type == "place" or item.type == "starting_point") and item.p_id:
-            place_ids.add(item.p_id)
-
-    hotels = {h.hotel_id: h for h in db.query(Hotel).filter(Hotel.hotel_id.in_(hotel_ids)).all()}
-    restaurants = {r.restaurant_id: r for r in db.query(Restaurant).filter(Restaurant.restaurant_id.in_(restaurant_ids)).all()}
-    places = {p.p_id: p for p in db.query(Place).filter(Place.p_id.in_(place_ids)).all()}
-
-    grouped = defaultdict(lambda: {"place": {}})
-    item_counters = defaultdict(int)
-
-    for row in items:
-        day_id_str = str(row.itinerary_day_id)
-        if "day_id" not in grouped[day_id_str]:
-            grouped[day_id_str]["day_id"] = str(row.day_number)
-            grouped[day_id_str]["date"] = row.date.strftime("%d-%m-%Y") if row.date else ""
-
-        item_counters[day_id_str] += 1
-        pid = f"p_id-{item_counters[day_id_str]}"
-
-        data = {}
-        if row.type == "hotel" and row.hotel_id in hotels:
-            p = hotels[row.hotel_id]
-        elif row.type == "restaurant" and row.restaurant_id in restaurants:
-            p = restaurants[row.restaurant_id]
-        elif row.p_id in places:
-            p = places[row.p_id]
-
-        data = {
+    ).where(
+        ItineraryDays.itinerary_id == itinerary_id
+    ).order_by(ItineraryDays.day_number, ItineraryItem.order_index)
+    if day_id is not None:
+        stmt = stmt.where(ItineraryDays.itinerary_day_id == day_id)
+
+    route = []
+    current_day_id = None
+    result = await session.stream(stmt)
+    async for row in result:
+        if row.itinerary_day_id != current_day_id:
+            current_day_id = row.itinerary_day_id
+            day = {
+                "place": {},
+                "day_id": str(row.day_number),
+                "date": row.date.strftime("%d-%m-%Y") if row.date else "",
+            }
+            route.append(day)
+
+        day["place"][f"p_id-{len(day['place']) + 1}"] = {
             "order": str(row.order_index),
-            "placeID": str(p.place_id),
-            "lat": str(p.latitude),
-            "lng": str(p.longitude),
+            "placeID": str(row.place_id),
+            "lat": str(row.latitude),
+            "lng": str(row.longitude),
             "placeType": row.type,
-            "name": p.name,
-            "address": p.address,
+            "name": row.name,
+            "address": row.address,
         }
 
-        grouped[day_id_str]["place"][pid] = data
+    return route
+
+
+async def get_all_route(itinerary_id, session: AsyncSession):
+    return await materialize_route(itinerary_id, session)
 
-    return list(grouped.values())
+
+async def get_route_for_day(itinerary_id, day_id, session: AsyncSession):
+    return await materialize_route(itinerary_id, session, day_id=day_id)
 
   
-def get_day_summary(itinerary_day_id, db):
-    items = (
-        db.query(ItineraryItem).filter(ItineraryItem.itinerary_day_id == itinerary_day_id).all()
+async def get_day_summary(itinerary_day_id, session: AsyncSession, with_version: bool = False):
+    return await _read_model(
+        session, f"day_summary:{itinerary_day_id}", lambda: _build_day_summary(itinerary_day_id, session),
+        itinerary_day_id=itinerary_day_id, with_version=with_version
+    )
+
+
+async def _build_day_summary(itinerary_day_id, session: AsyncSession):
+    """Day header, stops and totals from one query joining the day, its itinerary, items and their resources"""
+    stmt = _join_item_resources(
+        select(
+            ItineraryDays.itinerary_id,
+            ItineraryDays.day_number,
+            ItineraryDays.date,
+            Itinerary.title,
+            ItineraryItem,
+            _resource_column("name"),
+            _resource_column("address"),
+            _resource_column("latitude"),
+            _resource_column("longitude"),
         )
-    #logger.info(items)
-    itinerary_day = db.query(ItineraryDays).filter(ItineraryDays.itinerary_day_id==itinerary_day_id).first()
-    itinerary = db.query(Itinerary).filter(Itinerary.itinerary_id==itinerary_day.itinerary_id).first()
+        .join(Itinerary, Itinerary.itinerary_id == ItineraryDays.itinerary_id)
+        .outerjoin(ItineraryItem, ItineraryItem.itinerary_day_id == ItineraryDays.itinerary_day_id)
+    ).where(
+        ItineraryDays.itinerary_day_id == itinerary_day_id
+    ).order_by(ItineraryItem.order_index)
+    rows = (await session.execute(stmt)).all()
+    if not rows:
+        raise HTTPException(status_code=404, detail=f"itinerary day with id = {itinerary_day_id} not found")
+
     stops= []
     day_cost = 0
     day_distance_km =0
     estimated_total_duration = 0
     total_stay_duration = 0
-    departure_time = Null
-    for row in items:
-        if row.hotel_id:
-            p = db.query(Hotel).filter(Hotel.hotel_id == row.hotel_id).first()
-        elif row.restaurant_id:
-            p = db.query(Restaurant).filter(Restaurant.restaurant_id == row.restaurant_id).first()
-        elif row.p_id:
-            p = db.query(Place).filter(Place.p_id == row.p_id).first()
-        stop_data = {
-            "stop_id" : row.itinerary_item_id,
-            "order": row.order_index,
-            "name": p.name,
-            "address": p.address,
-            "type": row.type,
-            "eta": row.time,
-            "stay_duration":row.stay_duration,
-            "from_previous_duration": row.duration_from_previous_stop,
-            "distance_from_previous_stop": row.distance_from_previous_stop,
-            "cost": row.cost,
-            "lat": p.latitude,
-            "lng": p.longitude,
-            "description": row.description,
-        }
-        if row.cost:
-            day_cost += row.cost
-        if row.distance_from_previous_stop:
-            day_distance_km += row.distance_from_previous_stop
-        if row.duration_from_previous_stop:
-            estimated_total_duration += row.duration_from_previous_stop
-        if row.stay_duration:
-            total_stay_duration += row.stay_duration
-        stops.append(stop_data)
-    if stops != Null:
-        departure_time = stops[0]["eta"]
-
-    day_summary ={
-        "itinerary_id": itinerary_day.itinerary_id,
-        "date" : itinerary_day.date,
-        "day_title": f"{itinerary.title} - Day {itinerary_day.day_number}",
-        "departure_time": departure_time,
+    for row in rows:
+        item = row.ItineraryItem
+        if item is None:
+            continue
+        stops.append({
+            "stop_id" : item.itinerary_item_id,
+            "order": item.order_index,
+            "name": row.name,
+            "address": row.address,
+            "type": item.type,
+            "eta": item.time,
+            "stay_duration":item.stay_duration,
+            "from_previous_duration": item.duration_from_previous_stop,
+            "distance_from_previous_stop": item.distance_from_previous_stop,
+            "cost": item.cost,
+            "lat": row.latitude,
+            "lng": row.longitude,
+            "description": item.description,
+        })
+        day_cost += item.cost or 0
+        day_distance_km += item.distance_from_previous_stop or 0
+        estimated_total_duration += item.duration_from_previous_stop or 0
+        total_stay_duration += item.stay_duration or 0
+
+    header = rows[0]
+    return {
+        "itinerary_id": header.itinerary_id,
+        "date" : header.date,
+        "day_title": f"{header.title} - Day {header.day_number}",
+        "departure_time": stops[0]["eta"] if stops else None,
         "day_cost": day_cost,
         "day_distance_km": day_distance_km,
         "estimated_total_duration":estimated_total_duration,
         "total_stay_duration":total_stay_duration,
         "stops": stops 
     }
-    
-    return day_summary
 
 
-def get_itinerary_menu_details(
+async def get_itinerary_menu_details(
+    itinerary_id: int,
+    session: AsyncSession
+) -> Dict[str, Any]:
+    return await _read_model(
+        session, f"menu_details:{itinerary_id}", lambda: _build_itinerary_menu_details(itinerary_id, session),
+        itinerary_id
+    )
+
+async def _build_itinerary_menu_details(
     itinerary_id: int,
-    db: Session
+    session: AsyncSession
 ) -> Dict[str, Any]:
-    response = db.query(Itinerary).filter(
-        Itinerary.itinerary_id == itinerary_id
-    ).first()
+    response = await session.get(Itinerary, itinerary_id)
     if not response:
         raise HTTPException(status_code=404, detail="Itinerary not found")
     
@@ -676,77 +789,133 @@ def get_itinerary_menu_details(
         "end_date": response.end_date
     }
 
-def get_timeline(
+async def get_timeline(
+    itinerary_id: int,
+    session: AsyncSession,
+    with_version: bool = False
+) -> Dict[str, Any]:
+    return await _read_model(
+        session, f"timeline:{itinerary_id}", lambda: _build_timeline(itinerary_id, session),
+        itinerary_id, with_version=with_version
+    )
+
+async def _build_timeline(
     itinerary_id: int,
-    db: Session
+    session: AsyncSession
 ) -> Dict[str, Any]:
-    itinerary_response = db.query(Itinerary).filter(
-        Itinerary.itinerary_id == itinerary_id
-    ).first()
-    if not itinerary_response:
+    """Per-day date and distinct item types, from one query grouped by day and item type"""
+    stmt = (
+        select(
+            Itinerary.itinerary_id,
+            Location.address,
+            ItineraryDays.itinerary_day_id,
+            ItineraryDays.day_number,
+            ItineraryDays.date,
+            ItineraryItem.type,
+        )
+        .outerjoin(Location, Location.location_id == Itinerary.location_id)
+        .outerjoin(ItineraryDays, ItineraryDays.itinerary_id == Itinerary.itinerary_id)
+        .outerjoin(ItineraryItem, ItineraryItem.itinerary_day_id == ItineraryDays.itinerary_day_id)
+        .where(Itinerary.itinerary_id == itinerary_id)
+        .group_by(
+            Itinerary.itinerary_id,
+            Location.address,
+            ItineraryDays.itinerary_day_id,
+            ItineraryDays.day_number,
+            ItineraryDays.date,
+            ItineraryItem.type,
+        )
+        .order_by(ItineraryDays.day_number)
+    )
+    rows = (await session.execute(stmt)).all()
+    if not rows:
         raise HTTPException(status_code=404, detail="Itinerary not found")
-    
-    location =  db.query(Location).filter(Location.location_id == itinerary_response.location_id).first()
-    
-    itinerary_days = db.query(ItineraryDays).filter(
-        ItineraryDays.itinerary_id == itinerary_id
-    ).order_by(ItineraryDays.day_number).all()
-    
+
     response = {
-        "itinerary_id": itinerary_response.itinerary_id
+        "itinerary_id": rows[0].itinerary_id
     }
-    for day in itinerary_days:
-        itinerary_items = db.query(ItineraryItem).filter(
-            ItineraryItem.itinerary_day_id == day.itinerary_day_id
-        ).all()
-        types = list(set([item.type.value for item in itinerary_items]))
-        response[f"day{day.day_number}"] = {
-            "address":location.address,
-            "date": str(day.date),
-            "day_id": day.itinerary_day_id,
-            "type": types
-        }
+    for row in rows:
+        if row.itinerary_day_id is None:
+            continue
+        day = response.setdefault(f"day{row.day_number}", {
+            "address": row.address,
+            "date": str(row.date),
+            "day_id": row.itinerary_day_id,
+            "type": []
+        })
+        if row.type is not None:
+            day["type"].append(row.type.value)
     return response
 
-def get_route(
+async def get_route(
     itinerary_id: int,
     day: Union[int, str],
-    db: Session
+    session: AsyncSession,
+    with_version: bool = False
 ) -> List[Any]: 
     if day == "all":
-        return get_all_route(itinerary_id, db)
+        build = lambda: get_all_route(itinerary_id, session)
     else:
-        return get_route_for_day(itinerary_id, int(day), db)
+        day = int(day)
+        build = lambda: get_route_for_day(itinerary_id, day, session)
+    return await _read_model(session, f"route:{itinerary_id}:{day}", build, itinerary_id, with_version=with_version)
 
 
-async def reorder_itinerary_items(request, session: AsyncSession):
-    try:
-        for stop in request.stops:
-            stmt = select(ItineraryItem).where(ItineraryItem.itinerary_item_id == stop.stop_id)
-            result = await session.execute(stmt)
-            item = result.scalar_one_or_none()
+async def apply_item_order(itinerary_day_id, day_items, new_order, session: AsyncSession):
+    """Write `new_order` (itinerary_item_id -> order_index) for the loaded `day_items` and re-time the day"""
+    previous_stop = {
+        item.itinerary_item_id: day_items[index - 1].itinerary_item_id if index else None
+        for index, item in enumerate(day_items)
+    }
 
-            if not item:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"itinerary item with id = {stop.stop_id} not found"
-                )
+    if new_order:
+        # all new positions in one UPDATE ... SET order_index = CASE itinerary_item_id ...
+        await session.execute(
+            update(ItineraryItem)
+            .where(
+                ItineraryItem.itinerary_day_id == itinerary_day_id,
+                ItineraryItem.itinerary_item_id.in_(new_order)
+            )
+            .values(order_index=case(new_order, value=ItineraryItem.itinerary_item_id))
+            .execution_options(synchronize_session=False)
+        )
+        for item in day_items:
+            if item.itinerary_item_id in new_order:
+                set_committed_value(item, "order_index", new_order[item.itinerary_item_id])
 
-            item.order_index = stop.order
+    await mark_itinerary_day_changed(session, itinerary_day_id)
+    ordered_items = sorted(day_items, key=lambda item: item.order_index)
+
+    if ordered_items:
+        changed_legs = {
+            index for index in range(1, len(ordered_items))
+            if previous_stop.get(ordered_items[index].itinerary_item_id) != ordered_items[index - 1].itinerary_item_id
+        }
+        return await recalculate_itinerary_timings(ordered_items, session, changed_legs=changed_legs)
 
-        await session.commit()
 
-        stmt_ordered = (
+async def reorder_itinerary_items(request, session: AsyncSession):
+    try:
+        result = await session.execute(
             select(ItineraryItem)
             .where(ItineraryItem.itinerary_day_id == request.itinerary_day_id)
             .order_by(asc(ItineraryItem.order_index))
         )
-        result_ordered = await session.execute(stmt_ordered)
-        ordered_items = result_ordered.scalars().all()
+        day_items = result.scalars().all()
 
-        if ordered_items:
-            return await recalculate_itinerary_timings(ordered_items, session)
+        new_order = {stop.stop_id: stop.order for stop in request.stops}
+        unknown = set(new_order) - {item.itinerary_item_id for item in day_items}
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"itinerary item with id = {min(unknown)} not found"
+            )
+
+        return await apply_item_order(request.itinerary_day_id, day_items, new_order, session)
 
+    except HTTPException:
+        await session.rollback()
+        raise
     except Exception as e:
         await session.rollback()
         raise HTTPException(
@@ -755,10 +924,86 @@ async def reorder_itinerary_items(request, session: AsyncSession):
         )
 
 
-def get_all_itinerary(id,db):
+async def optimize_itinerary_day(itinerary_day_id: int, session: AsyncSession):
+    """Reorder a day's stops to minimise total drive time.
+
+    The leading starting point / hotel items stay where they are, as does a hotel closing the
+    day; the stops in between are ordered by services.route_optimizer and written back through
+    apply_item_order.
+    """
+    try:
+        result = await session.execute(
+            select(ItineraryItem)
+            .where(ItineraryItem.itinerary_day_id == itinerary_day_id)
+            .order_by(asc(ItineraryItem.order_index))
+        )
+        day_items = result.scalars().all()
+        if not day_items:
+            raise HTTPException(status_code=404, detail=f"no items found for itinerary day id = {itinerary_day_id}")
+
+        fixed_start = 1
+        while fixed_start < len(day_items) and day_items[fixed_start].type in ("starting_point", "hotel"):
+            fixed_start += 1
+        fixed_end = len(day_items) - fixed_start > 1 and day_items[-1].type == "hotel"
+
+        # node 0 is the last fixed leading item, then the movable stops, then the closing hotel if any
+        nodes = day_items[fixed_start - 1:]
+        details_map = await get_items_details_map(nodes, session)
+        details = [details_map.get(get_item_resource_key(item)) for item in nodes]
+        if not all(details):
+            raise HTTPException(status_code=404, detail="Place details not found for an itinerary item")
+
+        size = len(nodes)
+        pairs = [
+            (i, j) for i in range(size) for j in range(1, size)
+            if i != j and not (fixed_end and i == size - 1)
+        ]
+        legs = await google_maps_service.get_distance_matrix_legs(
+            [(details[i].place_id, details[j].place_id) for i, j in pairs],
+            coordinates=get_coordinates(*details)
+        )
+        matrix = [[0] * size for _ in range(size)]
+        for (i, j), data in zip(pairs, legs):
+            matrix[i][j] = data["duration"]
+
+        current = list(range(size))
+        # exact search on larger days is CPU-bound; keep it off the event loop
+        order, method = await run_in_threadpool(route_optimizer.optimize_path, matrix, fixed_end)
+        if route_optimizer.path_cost(matrix, order) >= route_optimizer.path_cost(matrix, current):
+            order = current
+
+        # the movable stops take over the existing order_index values in their new sequence
+        indexes = [item.order_index for item in nodes[1:]]
+        new_order = {
+            nodes[node].itinerary_item_id: order_index
+            for node, order_index in zip(order[1:], indexes)
+            if nodes[node].order_index != order_index
+        }
+        items = await apply_item_order(itinerary_day_id, day_items, new_order, session)
+
+        return {
+            "itinerary_day_id": itinerary_day_id,
+            "method": method,
+            "previous_travel_duration": route_optimizer.path_cost(matrix, current),
+            "travel_duration": route_optimizer.path_cost(matrix, order),
+            "items": items,
+        }
+
+    except HTTPException:
+        await session.rollback()
+        raise
+    except Exception as e:
+        await session.rollback()
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to optimize itinerary day. Error: {e}"
+        )
+
+
+async def get_all_itinerary(id, session: AsyncSession):
     try: 
-        results = (
-            db.query(
+        results = await session.execute(
+            select(
                 Itinerary.itinerary_id,
                 Itinerary.title,
                 Itinerary.start_date,
@@ -767,8 +1012,7 @@ def get_all_itinerary(id,db):
                 Itinerary.created_at
             )
             .join(Location, Itinerary.location_id == Location.location_id)
-            .filter(Itinerary.user_id == id)
-            .all()
+            .where(Itinerary.user_id == id)
         )
 
         response = []
@@ -786,22 +1030,26 @@ def get_all_itinerary(id,db):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"failed to get all itinerary, {e}" )
         
-def update_item_description(payload, db):
+async def update_item_description(payload, session: AsyncSession):
     try:
-        item = get_itinerary_item(payload.itinerary_item_id, db)
+        item = await get_item(payload.itinerary_item_id, session)
         item.description = payload.description
+        await mark_itinerary_day_changed(session, item.itinerary_day_id)
+        await session.commit()
         return "description updated successfully"
     except Exception as e:
-        db.rollback()
+        await session.rollback()
         raise HTTPException(status_code=500, detail= f"error occured while updating item description. error = {e}")
      
-def update_item_cost(payload, db):
+async def update_item_cost(payload, session: AsyncSession):
     try:
-        item = get_itinerary_item(payload.itinerary_item_id, db)
+        item = await get_item(payload.itinerary_item_id, session)
         item.cost = payload.cost
+        await mark_itinerary_day_changed(session, item.itinerary_day_id)
+        await session.commit()
         return "cost updated successfully"
     except Exception as e:
-        db.rollback()
+        await session.rollback()
         raise HTTPException(status_code=500, detail= f"error occured while updating item description. error = {e}")
 
 
@@ -809,19 +1057,24 @@ async def update_item_duration(payload, session: AsyncSession):
     try:
         item = await get_item(payload.itinerary_item_id, session)  # assume this is async
         item.stay_duration = payload.stay_duration
+        await mark_itinerary_day_changed(session, item.itinerary_day_id)
         await session.commit()
 
+        # the whole day, so legs still holding an estimate before the edited stop get re-fetched too
         stmt = (
             select(ItineraryItem)
             .where(ItineraryItem.itinerary_day_id == item.itinerary_day_id)
-            .where(ItineraryItem.order_index >= item.order_index)
             .order_by(asc(ItineraryItem.order_index))
         )
         result = await session.execute(stmt)
         ordered_items = result.scalars().all()
+        position = next(
+            index for index, day_item in enumerate(ordered_items)
+            if day_item.itinerary_item_id == item.itinerary_item_id
+        )
 
-        if ordered_items:
-            await recalculate_itinerary_timings(ordered_items, session)  # assume this is async
+        # no leg changed endpoints, only arrival times after the edited stop move
+        await recalculate_itinerary_timings(ordered_items, session, changed_legs=set(), start_index=position + 1)
 
         return item
 
@@ -837,37 +1090,27 @@ async def delete_item(itinerary_item_id: int, session: AsyncSession):
     try:
         item = await get_item(itinerary_item_id, session)
 
-        # Get previous item (highest order_index less than current item's)
-        stmt_prev = (
-            select(ItineraryItem)
-            .where(ItineraryItem.itinerary_day_id == item.itinerary_day_id)
-            .where(ItineraryItem.order_index < item.order_index)
-            .order_by(desc(ItineraryItem.order_index))
-            .limit(1)
-        )
-        result_prev = await session.execute(stmt_prev)
-        previous_item = result_prev.scalar_one_or_none()
-
-        # Get next items (order_index greater than current item's)
-        stmt_next = (
+        # the rest of the day, so legs still holding an estimate before the deleted stop get re-fetched too
+        stmt = (
             select(ItineraryItem)
             .where(ItineraryItem.itinerary_day_id == item.itinerary_day_id)
-            .where(ItineraryItem.order_index > item.order_index)
+            .where(ItineraryItem.itinerary_item_id != item.itinerary_item_id)
             .order_by(asc(ItineraryItem.order_index))
         )
-        result_next = await session.execute(stmt_next)
-        all_next_items = result_next.scalars().all()
-
-        ordered_items = []
-        if previous_item:
-            ordered_items.append(previous_item)
-        ordered_items.extend(all_next_items)
+        result = await session.execute(stmt)
+        ordered_items = result.scalars().all()
+        # index of the stop that followed the deleted one
+        position = sum(1 for day_item in ordered_items if day_item.order_index < item.order_index)
 
         await session.delete(item)
+        await mark_itinerary_day_changed(session, item.itinerary_day_id)
         await session.commit()
 
         if ordered_items:
-            await recalculate_itinerary_timings(ordered_items, session)
+            # only the leg bridging the deleted stop has new endpoints
+            await recalculate_itinerary_timings(
+                ordered_items, session, changed_legs={position}, start_index=max(position, 1)
+            )
 
         return "Item deleted successfully"
 
@@ -879,45 +1122,55 @@ async def delete_item(itinerary_item_id: int, session: AsyncSession):
         )
 
 
-def day_cost_breakup(day_id, db):
+async def _cost_breakups(session: AsyncSession, itinerary_id: Optional[int] = None, day_id: Optional[int] = None):
+    """Per-day, per-type cost totals from one GROUP BY; the first item of each day is not priced"""
+    first_item = aliased(ItineraryItem)
+    first_item_id = (
+        select(func.min(first_item.itinerary_item_id))
+        .where(first_item.itinerary_day_id == ItineraryDays.itinerary_day_id)
+        .scalar_subquery()
+    )
+    stmt = (
+        select(
+            ItineraryDays.itinerary_day_id,
+            ItineraryItem.type,
+            func.count(ItineraryItem.itinerary_item_id).label("total_quantity"),
+            func.count(ItineraryItem.cost).label("valid_quantity"),
+            func.sum(ItineraryItem.cost).label("total_cost"),
+        )
+        .outerjoin(ItineraryItem, and_(
+            ItineraryItem.itinerary_day_id == ItineraryDays.itinerary_day_id,
+            ItineraryItem.itinerary_item_id != first_item_id
+        ))
+        .group_by(ItineraryDays.itinerary_day_id, ItineraryItem.type)
+        .order_by(ItineraryDays.itinerary_day_id, func.min(ItineraryItem.itinerary_item_id))
+    )
+    if itinerary_id is not None:
+        stmt = stmt.where(ItineraryDays.itinerary_id == itinerary_id)
+    if day_id is not None:
+        stmt = stmt.where(ItineraryDays.itinerary_day_id == day_id)
+
+    breakups = {}
+    for row in (await session.execute(stmt)).all():
+        result = breakups.setdefault(row.itinerary_day_id, [])
+        if row.type is None:
+            continue
+        valid_qty = row.valid_quantity
+        result.append({
+            "item_type": row.type,
+            "total_quantity": row.total_quantity,
+            "valid_quantity": valid_qty,
+            "avg_rate": round(row.total_cost / valid_qty, 2) if valid_qty else None,
+            "sub_total": row.total_cost if valid_qty else 0,
+            "is_complete": valid_qty == row.total_quantity
+        })
+    return breakups
+
+
+async def day_cost_breakup(day_id, session: AsyncSession):
     try:
-        items = db.query(ItineraryItem.type, ItineraryItem.cost).filter(ItineraryItem.itinerary_day_id == day_id).all()
-
-        cost_summary = defaultdict(lambda: {"total_cost": 0, "total_quantity": 0, "valid_quantity":0,"is_complete":True })
-
-        is_first_item = True
-        # Aggregating cost and quantity per type
-        for item_type, cost in items:
-            if is_first_item:
-                is_first_item = False
-                continue
-            cost_summary[item_type]["total_quantity"] +=1
-            if cost is None or 0:
-                cost_summary[item_type]["is_complete"]= False
-            else:
-                cost_summary[item_type]["total_cost"] += cost
-                cost_summary[item_type]["valid_quantity"] += 1
-            
-
-        # Preparing the final response
-        result = []
-        for item_type, data in cost_summary.items():
-            # if item_type == "starting_point" or cost_summary[0]:
-            #     continue
-            valid_qty = data["valid_quantity"]
-            avg_rate = round(data["total_cost"] / valid_qty, 2) if valid_qty else None
-            sub_total = data["total_cost"] if valid_qty else 0
-
-            result.append({
-                "item_type": item_type,
-                "total_quantity":data["total_quantity"],
-                "valid_quantity": data["valid_quantity"],
-                "avg_rate": avg_rate,
-                "sub_total": sub_total,
-                "is_complete": data["is_complete"]
-            })
-
-        return {"day_id": day_id, "cost_breakup": result}
+        breakups = await _cost_breakups(session, day_id=day_id)
+        return {"day_id": day_id, "cost_breakup": breakups.get(day_id, [])}
 
     except HTTPException as e:
         raise e
@@ -925,29 +1178,27 @@ def day_cost_breakup(day_id, db):
         raise HTTPException(status_code=500, detail=f"Failed to fetch day cost breakup details: {str(e)}")
     
 
-def itinerary_cost_breakup(itinerary_id, db):
-    try:
-        day_ids = db.query(ItineraryDays.itinerary_day_id).filter(
-            ItineraryDays.itinerary_id == itinerary_id
-        ).all()
+async def _build_itinerary_cost_breakup(itinerary_id, session: AsyncSession):
+    breakups = await _cost_breakups(session, itinerary_id=itinerary_id)
 
-        if not day_ids:
-            raise HTTPException(status_code=404, detail="No days found for this itinerary")
+    if not breakups:
+        raise HTTPException(status_code=404, detail="No days found for this itinerary")
 
-        # Flatten from [(id1,), (id2,), ...] to [id1, id2, ...]
-        day_ids = [day_id for (day_id,) in day_ids]
+    return {
+        "itinerary_id": itinerary_id,
+        "cost_breakup_by_day": [
+            {"day_id": day_id, "cost_breakup": cost_breakup}
+            for day_id, cost_breakup in breakups.items()
+        ]
+    }
 
-        # Get cost breakup for each day
-        all_breakups=[]
-        for day_id in day_ids:
-            cost_breakup = day_cost_breakup(day_id, db)
-            all_breakups.append(cost_breakup)
-        # cost_breakups = [day_cost_breakup(day_id, db) for day_id in day_ids]
 
-        return {
-            "itinerary_id": itinerary_id,
-            "cost_breakup_by_day": all_breakups
-        }
+async def itinerary_cost_breakup(itinerary_id, session: AsyncSession):
+    try:
+        return await _read_model(
+            session, f"cost_breakup:{itinerary_id}", lambda: _build_itinerary_cost_breakup(itinerary_id, session),
+            itinerary_id
+        )
 
     except HTTPException:
         raise
@@ -958,15 +1209,15 @@ def itinerary_cost_breakup(itinerary_id, db):
         )
 
 
-def get_local_resource(user_id, resource_type,db):
+async def get_local_resource(user_id, resource_type, session: AsyncSession):
     try:
-        user= fetch_by_user_id(db,user_id)
+        user= await fetch_by_user_id(session,user_id)
         if not user:
             raise HTTPException(status_code=404, detail="User not found for adding default timing")
         if resource_type == "hotel":
-            resource = db.query(Hotel).filter(Hotel.user_id == user_id).all()
+            resource = (await session.execute(select(Hotel).where(Hotel.user_id == user_id))).scalars().all()
         if resource_type == "restaurant":
-            resource = db.query(Restaurant).filter(Restaurant.user_id == user_id).all()
+            resource = (await session.execute(select(Restaurant).where(Restaurant.user_id == user_id))).scalars().all()
         # if resource_type == "place":
         #     resource = db.query(Place).filter(Place.user_id == user_id).all()
         return resource
@@ -981,14 +1232,54 @@ def get_local_resource(user_id, resource_type,db):
 
 
     
-def get_shared_itinerary(share_code, db):
-    itinerary = db.query(ItineraryShareCode).filter(ItineraryShareCode.share_code == share_code).first()
-    if not itinerary:
+async def get_shared_itinerary(share_code, session: AsyncSession):
+    itinerary_id = _share_code_cache.get(share_code)
+    if itinerary_id is not None:
+        return itinerary_id
+
+    result = await session.execute(
+        select(ItineraryShareCode.itinerary_id).where(ItineraryShareCode.share_code == share_code).limit(1)
+    )
+    itinerary_id = result.scalar_one_or_none()
+    if itinerary_id is None:
         raise HTTPException(status_code=404, detail="Itinerary not found")
-    return itinerary.itinerary_id  
+    _share_code_cache.set(share_code, itinerary_id)
+    return itinerary_id
 
-def get_share_code(itinerary_id, db):
-    share_entry = db.query(ItineraryShareCode).filter(ItineraryShareCode.itinerary_id == itinerary_id).first()
+async def _build_shared_snapshot(itinerary_id: int) -> Dict[str, Any]:
+    async with AsyncSessionLocal() as snapshot_session:
+        return {
+            "itinerary_id": itinerary_id,
+            "menu_details": await get_itinerary_menu_details(itinerary_id, snapshot_session),
+            "timeline": await get_timeline(itinerary_id, snapshot_session),
+            "route": await get_route(itinerary_id, "all", snapshot_session),
+        }
+
+async def get_shared_snapshot(share_code, session: AsyncSession) -> Dict[str, Any]:
+    """Public view of a shared itinerary, served from memory while the link is hot.
+
+    Edits forget the snapshot on the worker that made them; on other workers it expires after
+    SHARED_SNAPSHOT_CACHE_TTL_SECONDS.
+    """
+    itinerary_id = await get_shared_itinerary(share_code, session)
+    snapshot = _shared_snapshot_cache.get(itinerary_id)
+    if snapshot is not None:
+        return snapshot
+
+    # a build that overlaps a committed edit may hold pre-edit data: serve it once, don't cache it
+    generation = _shared_snapshot_generation
+    snapshot = await _shared_snapshot_flights.do(
+        (itinerary_id, generation), lambda: _build_shared_snapshot(itinerary_id)
+    )
+    if generation == _shared_snapshot_generation:
+        _shared_snapshot_cache.set(itinerary_id, snapshot)
+    return snapshot
+
+async def get_share_code(itinerary_id, session: AsyncSession):
+    result = await session.execute(
+        select(ItineraryShareCode).where(ItineraryShareCode.itinerary_id == itinerary_id).limit(1)
+    )
+    share_entry = result.scalars().first()
     if not share_entry or not share_entry.share_code:
         raise HTTPException(status_code=404, detail="Share code not found for this itinerary")
     return share_entry.share_code
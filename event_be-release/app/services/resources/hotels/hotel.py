@@ -17,7 +17,7 @@ class HotelService:
         user_id: int
     ) -> HotelResponse:
 
-        from services.google_maps_service import create_hotel_from_google_maps_api
+        from services.google_maps_service import get_place_summary
         
         existing_hotel = await HotelRepository.get_by_place_id(session, data.place_id, client_id)
         if existing_hotel:
@@ -26,7 +26,7 @@ class HotelService:
                 detail="Hotel with this place_id already exists for your account"
             )
         
-        google_data = await create_hotel_from_google_maps_api(data.place_id)
+        google_data = await get_place_summary(data.place_id)
         if not google_data:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -184,6 +184,10 @@ class HotelService:
         # Check ownership and existence
         await HotelService.get_hotel_or_404(session, hotel_id, client_id, user_id)
 
+        from services.itinerary_service import mark_resource_changed
+        # itinerary views embed the hotel's name, address and coordinates; dropped in the update's commit
+        await mark_resource_changed(session, "hotel", hotel_id)
+
         update_data = data.model_dump(exclude_unset=True)
         updated_hotel = await HotelRepository.update(session, hotel_id, update_data)
         
@@ -204,5 +208,7 @@ class HotelService:
     ) -> None:
         """Delete hotel (soft or hard delete)"""
         await HotelService.get_hotel_or_404(session, hotel_id, client_id, user_id)
-        
+
+        from services.itinerary_service import mark_resource_changed
+        await mark_resource_changed(session, "hotel", hotel_id)
         await HotelRepository.hard_delete(session, hotel_id)
@@ -0,0 +1,109 @@
+from typing import List, Tuple
+from core.config import settings
+
+# matrix[i][j] = travel cost (seconds) from node i to node j, not necessarily symmetric
+Matrix = List[List[float]]
+
+
+def path_cost(matrix: Matrix, path: List[int]) -> float:
+    return sum(matrix[a][b] for a, b in zip(path, path[1:]))
+
+
+def _held_karp(matrix: Matrix, stops: List[int], end: int = None) -> List[int]:
+    """Exact cheapest path 0 -> every stop -> `end` (open-ended when `end` is None)"""
+    count = len(stops)
+    full = (1 << count) - 1
+    # best[mask][j] = (cost, previous j) of the cheapest path from 0 over `mask` finishing at stops[j]
+    best = [[None] * count for _ in range(1 << count)]
+    for j, stop in enumerate(stops):
+        best[1 << j][j] = (matrix[0][stop], None)
+
+    for mask in range(1, full + 1):
+        for j in range(count):
+            entry = best[mask][j]
+            if entry is None:
+                continue
+            for k in range(count):
+                if mask & (1 << k):
+                    continue
+                cost = entry[0] + matrix[stops[j]][stops[k]]
+                next_entry = best[mask | (1 << k)][k]
+                if next_entry is None or cost < next_entry[0]:
+                    best[mask | (1 << k)][k] = (cost, j)
+
+    last = min(
+        range(count),
+        key=lambda j: best[full][j][0] + (matrix[stops[j]][end] if end is not None else 0)
+    )
+    order, mask, j = [], full, last
+    while j is not None:
+        order.append(stops[j])
+        previous = best[mask][j][1]
+        mask ^= 1 << j
+        j = previous
+    order.reverse()
+    return [0] + order + ([end] if end is not None else [])
+
+
+def _nearest_neighbour(matrix: Matrix, stops: List[int], end: int = None) -> List[int]:
+    path, remaining = [0], set(stops)
+    while remaining:
+        nearest = min(remaining, key=lambda stop: (matrix[path[-1]][stop], stop))
+        path.append(nearest)
+        remaining.remove(nearest)
+    return path + ([end] if end is not None else [])
+
+
+def _two_opt(matrix: Matrix, path: List[int], last_movable: int) -> bool:
+    """Reverse the first segment whose reversal shortens the path; True if one was found"""
+    for i in range(1, last_movable):
+        for j in range(i + 1, last_movable + 1):
+            stop = min(j + 1, len(path) - 1)
+            before = path_cost(matrix, path[i - 1:stop + 1])
+            candidate = path[:i] + path[i:j + 1][::-1] + path[j + 1:]
+            if path_cost(matrix, candidate[i - 1:stop + 1]) < before:
+                path[:] = candidate
+                return True
+    return False
+
+
+def _or_opt(matrix: Matrix, path: List[int], last_movable: int) -> bool:
+    """Move the first run of 1-3 stops whose relocation shortens the path; True if one was found"""
+    current = path_cost(matrix, path)
+    for length in (1, 2, 3):
+        for i in range(1, last_movable - length + 2):
+            segment = path[i:i + length]
+            rest = path[:i] + path[i + length:]
+            for position in range(1, last_movable - length + 2):
+                if position == i:
+                    continue
+                candidate = rest[:position] + segment + rest[position:]
+                if path_cost(matrix, candidate) < current:
+                    path[:] = candidate
+                    return True
+    return False
+
+
+def _local_search(matrix: Matrix, stops: List[int], end: int = None) -> List[int]:
+    """Nearest neighbour tour improved with 2-opt and or-opt moves"""
+    path = _nearest_neighbour(matrix, stops, end)
+    last_movable = len(path) - (2 if end is not None else 1)
+    for _ in range(settings.ROUTE_OPTIMIZER_MAX_PASSES):
+        if not (_two_opt(matrix, path, last_movable) or _or_opt(matrix, path, last_movable)):
+            break
+    return path
+
+
+def optimize_path(matrix: Matrix, fixed_end: bool = False) -> Tuple[List[int], str]:
+    """Cheapest order of the nodes of `matrix`, always starting at node 0.
+
+    With `fixed_end` the last node stays last. Returns (node order, method used).
+    """
+    size = len(matrix)
+    end = size - 1 if fixed_end and size > 1 else None
+    stops = [node for node in range(1, size) if node != end]
+    if len(stops) < 2:
+        return [0] + stops + ([end] if end is not None else []), "trivial"
+    if len(stops) <= settings.ROUTE_OPTIMIZER_EXACT_MAX_STOPS:
+        return _held_karp(matrix, stops, end), "exact"
+    return _local_search(matrix, stops, end), "heuristic"
@@ -1,4 +1,5 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from services.user import add_default_timing
 from repository import to_request as to_request_repo
 from repository import user as user_repo
@@ -7,32 +8,32 @@ from schemas.user import UserSchema
 from schemas.to_request import TORequestCreate
 from models.to_request import TORequest
 
-def update_request_status(db: Session, to_request_id: int, status: str):
+async def update_request_status(session: AsyncSession, to_request_id: int, status: str):
     if status not in ["approved", "rejected"]:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid status")
 
-    request = to_request_repo.update_approval_status(db, to_request_id, status)
+    request = await to_request_repo.update_approval_status(session, to_request_id, status)
     if not request:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="TO Request not found")
 
     user = None
     if status == "approved":
-        user = user_repo.update_user_role(db, request.user_id, new_role_id=3)
-        # add_default_timing(request.user_id,payload=None,db=db)
+        user = await user_repo.update_user_role(session, request.user_id, new_role_id=3)
+        # await add_default_timing(request.user_id,payload=None,session=session)
 
         if not user:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
     else:
-        user = user_repo.fetch_by_user_id(db, request.user_id)
+        user = await user_repo.fetch_by_user_id(session, request.user_id)
 
     return request, user
 
-def get_to_request_users(db: Session):
-    requests = to_request_repo.get_all_to_requests(db)
+async def get_to_request_users(session: AsyncSession):
+    requests = await to_request_repo.get_all_to_requests(session)
     enriched_requests = []
 
     for req in requests:
-        user = user_repo.fetch_by_user_id(db, req.user_id)
+        user = await user_repo.fetch_by_user_id(session, req.user_id)
         if not user:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"User with ID {req.user_id} not found")
         enriched_requests.append({
@@ -43,24 +44,25 @@ def get_to_request_users(db: Session):
 
     return enriched_requests
 
-def fetch_user_by_request(db: Session, to_request):
-    user = user_repo.fetch_by_user_id(db, to_request.user_id)
+async def fetch_user_by_request(session: AsyncSession, to_request):
+    user = await user_repo.fetch_by_user_id(session, to_request.user_id)
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
     return UserSchema.from_orm(user)
 
 
-def create_to_request(db: Session, request_data: TORequestCreate):
+async def create_to_request(session: AsyncSession, request_data: TORequestCreate):
     # Check if user exists
-    user = user_repo.fetch_by_user_id(db, request_data.user_id)
+    user = await user_repo.fetch_by_user_id(session, request_data.user_id)
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
     # Check if user already has a TO request in open/pending state
-    existing = db.query(TORequest).filter(
+    result = await session.execute(select(TORequest).where(
         TORequest.user_id == request_data.user_id,
         TORequest.approval_status.in_(["open", "pending"])
-    ).first()
+    ))
+    existing = result.scalars().first()
     if existing:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -68,7 +70,7 @@ def create_to_request(db: Session, request_data: TORequestCreate):
         )
 
     new_request = TORequest(user_id=request_data.user_id, approval_status="open")
-    db.add(new_request)
-    db.commit()
-    db.refresh(new_request)
+    session.add(new_request)
+    await session.commit()
+    await session.refresh(new_request)
     return new_request
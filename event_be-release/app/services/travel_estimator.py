@@ -0,0 +1,102 @@
+import math
+from typing import Dict, List, Optional, Tuple
+from core.config import settings
+
+EARTH_RADIUS_M = 6371008.8
+
+# (upper bound of road distance in metres, default average speed in km/h)
+DEFAULT_SPEED_BANDS = [
+    (5_000, 20.0),          # in-town
+    (30_000, 35.0),         # suburban / local roads
+    (100_000, 45.0),        # regional roads
+    (math.inf, 55.0),       # highway
+]
+
+Coordinate = Tuple[float, float]
+
+
+def great_circle_distances(pairs: List[Tuple[Coordinate, Coordinate]]) -> List[float]:
+    """Haversine distance in metres for each ((lat, lng), (lat, lng)) pair, in order"""
+    distances = []
+    for (lat1, lng1), (lat2, lng2) in pairs:
+        phi1, phi2 = math.radians(lat1), math.radians(lat2)
+        d_phi = phi2 - phi1
+        d_lambda = math.radians(lng2 - lng1)
+        a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+        distances.append(2 * EARTH_RADIUS_M * math.asin(min(1.0, math.sqrt(a))))
+    return distances
+
+
+class SpeedModel:
+    """Turns straight-line distance into road distance and drive time.
+
+    Road distance is the great-circle distance times a circuity factor, and drive
+    time uses an average speed per distance band. Both are nudged towards real
+    Distance Matrix answers through `observe`.
+    """
+
+    def __init__(self, circuity: float, speed_bands: List[Tuple[float, float]], smoothing: float):
+        self.circuity = circuity
+        self.speed_bands = [list(band) for band in speed_bands]
+        self.smoothing = smoothing
+        self.observations = 0
+
+    def _band(self, road_distance: float) -> list:
+        for band in self.speed_bands:
+            if road_distance <= band[0]:
+                return band
+        return self.speed_bands[-1]
+
+    def estimate(self, straight_distance: float) -> Dict[str, int]:
+        road_distance = straight_distance * self.circuity
+        speed_ms = self._band(road_distance)[1] / 3.6
+        return {
+            "distance": int(round(road_distance)),
+            "duration": int(round(road_distance / speed_ms)) if speed_ms else 0,
+        }
+
+    def observe(self, straight_distance: float, distance: float, duration: float) -> None:
+        """Blend a real (distance, duration) answer for a known straight-line distance into the model"""
+        if straight_distance < 100 or distance <= 0 or duration <= 0:
+            return
+        alpha = self.smoothing
+        self.circuity += alpha * (distance / straight_distance - self.circuity)
+        band = self._band(distance)
+        band[1] += alpha * (distance / duration * 3.6 - band[1])
+        self.observations += 1
+
+
+speed_model = SpeedModel(
+    circuity=settings.TRAVEL_ESTIMATE_CIRCUITY,
+    speed_bands=DEFAULT_SPEED_BANDS,
+    smoothing=settings.TRAVEL_ESTIMATE_SMOOTHING,
+)
+
+
+def estimate_legs(
+    legs: List[Tuple[str, str]],
+    coordinates: Dict[str, Coordinate]
+) -> Optional[List[Dict[str, int]]]:
+    """Estimated {"distance", "duration"} per leg, or None if any endpoint has no coordinates"""
+    pairs = []
+    for origin, destination in legs:
+        if coordinates.get(origin) is None or coordinates.get(destination) is None:
+            return None
+        pairs.append((coordinates[origin], coordinates[destination]))
+    return [speed_model.estimate(distance) for distance in great_circle_distances(pairs)]
+
+
+def calibrate(
+    legs: List[Tuple[str, str]],
+    coordinates: Dict[str, Coordinate],
+    results: List[Dict[str, int]]
+) -> None:
+    """Feed real Distance Matrix results for legs with known coordinates back into the speed model"""
+    known = [
+        (coordinates[origin], coordinates[destination], result)
+        for (origin, destination), result in zip(legs, results)
+        if coordinates.get(origin) is not None and coordinates.get(destination) is not None
+    ]
+    straight = great_circle_distances([(origin, destination) for origin, destination, _ in known])
+    for distance, (_, _, result) in zip(straight, known):
+        speed_model.observe(distance, result["distance"], result["duration"])
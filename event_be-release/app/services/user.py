@@ -1,29 +1,31 @@
-from sqlalchemy.orm import Session
 from passlib.context import CryptContext
 from fastapi import HTTPException, status
 from sqlalchemy.future import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
 
 from schemas.user import DefaultTimingData, DefaultTimingRequest, DefaultTimingResponse
 from models.user import DefaultItineraryTiming
 from models.user import User
 from schemas.user import UserCreate
 from schemas.auth import LoginRequest
+from repository.user import fetch_by_email, fetch_by_user_id
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
-def verify_password(plain_password, hashed_password):
-    return pwd_context.verify(plain_password, hashed_password)
+# bcrypt is deliberately slow, so hashing and verifying run in the threadpool
+async def verify_password(plain_password, hashed_password):
+    return await run_in_threadpool(pwd_context.verify, plain_password, hashed_password)
 
-def get_password_hash(password):
-    return pwd_context.hash(password)
+async def get_password_hash(password):
+    return await run_in_threadpool(pwd_context.hash, password)
 
-def create_user(db: Session, user_data: UserCreate, verified: bool = True):
+async def create_user(session: AsyncSession, user_data: UserCreate, verified: bool = True):
     """Create a new user after verification"""
     if not verified:
         raise ValueError("Email not verified")
     
-    hashed_password = get_password_hash(user_data.password)
+    hashed_password = await get_password_hash(user_data.password)
     
     new_user = User(
         username=user_data.email.split('@')[0],  # Default username from email
@@ -33,38 +35,38 @@ def create_user(db: Session, user_data: UserCreate, verified: bool = True):
         role_id=user_data.role
     )
     
-    db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+    session.add(new_user)
+    await session.commit()
+    await session.refresh(new_user)
     
     return new_user
 
-def authenticate_user(db: Session, login_data: LoginRequest):
+async def authenticate_user(session: AsyncSession, login_data: LoginRequest):
     """Authenticate a user with email and password"""
-    user = db.query(User).filter(User.email == login_data.email).first()
+    user = await fetch_by_email(session, login_data.email)
     if not user:
         return False
     
-    if not verify_password(login_data.password, user.password_hash):
+    if not await verify_password(login_data.password, user.password_hash):
         return False
     
     return user
 
-def reset_password(db: Session, email: str, new_password: str):
+async def reset_password(session: AsyncSession, email: str, new_password: str):
     """Reset user password"""
-    user = db.query(User).filter(User.email == email).first()
+    user = await fetch_by_email(session, email)
     if not user:
         return False
     
-    user.password_hash = get_password_hash(new_password)
-    db.commit()
+    user.password_hash = await get_password_hash(new_password)
+    await session.commit()
     
     return True
 
 
-def add_default_timing(user_id,payload, db):
+async def add_default_timing(user_id,payload, session: AsyncSession):
     try:
-        user = db.query(User).filter(User.user_id == user_id).first()
+        user = await fetch_by_user_id(session, user_id)
         if not user:
             raise HTTPException(status_code=404, detail="User not found for adding default timing")
         if payload is None:
@@ -78,9 +80,9 @@ def add_default_timing(user_id,payload, db):
                 activity_duration = payload.activity_duration,
                 restaurant_duration = payload.restaurant_duration,
             )
-        db.add(itinerary_settings)
-        db.commit()
-        db.refresh(itinerary_settings)
+        session.add(itinerary_settings)
+        await session.commit()
+        await session.refresh(itinerary_settings)
 
         return {"message": "Default itinerary settings added successfully", "data": itinerary_settings}
        
@@ -104,9 +106,9 @@ async def get_default_timing(user_id: int, session: AsyncSession):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch default values: {e}")
 
-def update_default_timing(setting_id,payload,db):
+async def update_default_timing(setting_id,payload, session: AsyncSession):
     try:
-        itinerary_settings = db.query(DefaultItineraryTiming).filter(DefaultItineraryTiming.setting_id == setting_id).first()
+        itinerary_settings = await session.get(DefaultItineraryTiming, setting_id)
         if not itinerary_settings:
             raise HTTPException(status_code=404, detail="default timing details not found for setting id = {setting_id} not found")
   
@@ -116,8 +118,8 @@ def update_default_timing(setting_id,payload,db):
         itinerary_settings.hotel_night_duration = payload.hotel_night_duration
         itinerary_settings.activity_duration = payload.activity_duration
         itinerary_settings.restaurant_duration = payload.restaurant_duration
-        db.commit()
-        db.refresh(itinerary_settings)
+        await session.commit()
+        await session.refresh(itinerary_settings)
 
         response_data = DefaultTimingData(
             # user_id=itinerary_settings.user_id,